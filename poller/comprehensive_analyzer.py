@@ -8,23 +8,17 @@ Shows relationships between lobbying, party affiliation, and voting patterns
 import argparse
 import json
 import logging
+import re
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Dict
 
-from analyze_bipartisan_cooperation import BipartisanCooperationAnalyzer
-from analyze_committees import CommitteeAnalyzer
-
-# Import new trend analyzers
-from analyze_legislative_activity import LegislativeActivityAnalyzer
-from analyze_member_consistency import MemberConsistencyAnalyzer
-from fetch_committees import CommitteeFetcher
-
-# Import our existing modules
-from gov_data_analyzer import CongressGovAPI
-from gov_data_downloader_v2 import CongressGovAPI as CongressGovAPIv2
-from gov_data_downloader_v2 import SenateGovAPI
+# API clients, fetchers and trend analyzers are imported lazily in the
+# properties below so that running a single sub-analysis does not pay the
+# import cost of every module and their dependencies.
 
 # Configure logging
 logging.basicConfig(
@@ -32,26 +26,94 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Single-pass classification of free-form member vote positions
+_POSITION_RE = re.compile(r"\b(not[_ ]voting|yea|aye|yes|nay|no|present)\b")
+_POSITION_TYPES = {
+    "yea": "yea",
+    "aye": "yea",
+    "yes": "yea",
+    "nay": "nay",
+    "no": "nay",
+    "present": "present",
+    "not voting": "not_voting",
+    "not_voting": "not_voting",
+}
+
 
 class ComprehensiveAnalyzer:
     """Analyzes relationships between lobbying, party affiliation, and voting"""
 
-    def __init__(self, base_dir: str = "data"):
-        """Initialize the analyzer"""
+    def __init__(self, base_dir: str = "data", pretty: bool = False):
+        """
+        Initialize the analyzer
+
+        Args:
+            base_dir: Data directory
+            pretty: Indent JSON output files (compact by default)
+        """
         self.base_dir = Path(base_dir)
-        self.congress_api = CongressGovAPI(max_workers=3)
-        self.congress_api_v2 = CongressGovAPIv2()  # For bills fetching
-        self.senate_api = SenateGovAPI()
-        self.committee_fetcher = CommitteeFetcher(base_dir=base_dir)
-        self.committee_analyzer = CommitteeAnalyzer(base_dir=base_dir)
+        self.pretty = pretty
+
+    @cached_property
+    def congress_api(self):
+        """Congress.gov client used for members and votes"""
+        from gov_data_analyzer import CongressGovAPI
+
+        return CongressGovAPI(max_workers=3)
+
+    @cached_property
+    def congress_api_v2(self):
+        """Congress.gov client used for bills fetching"""
+        from gov_data_downloader_v2 import CongressGovAPI as CongressGovAPIv2
+
+        # Both clients send the same API key, so they must draw on one
+        # hourly quota when categories are fetched concurrently
+        return CongressGovAPIv2(rate_limiter=self.congress_api.rate_limiter)
+
+    @cached_property
+    def senate_api(self):
+        """Senate.gov lobbying client"""
+        from gov_data_downloader_v2 import SenateGovAPI
+
+        return SenateGovAPI()
+
+    @cached_property
+    def committee_fetcher(self):
+        """Committee data fetcher"""
+        from fetch_committees import CommitteeFetcher
+
+        return CommitteeFetcher(base_dir=str(self.base_dir))
+
+    @cached_property
+    def committee_analyzer(self):
+        """Committee analyzer"""
+        from analyze_committees import CommitteeAnalyzer
 
-        # Initialize trend analyzers
-        self.legislative_analyzer = LegislativeActivityAnalyzer(base_dir=base_dir)
-        self.bipartisan_analyzer = BipartisanCooperationAnalyzer(data_dir=base_dir)
-        self.member_consistency_analyzer = MemberConsistencyAnalyzer(data_dir=base_dir)
+        return CommitteeAnalyzer(base_dir=str(self.base_dir))
+
+    @cached_property
+    def legislative_analyzer(self):
+        """Legislative activity trend analyzer"""
+        from analyze_legislative_activity import LegislativeActivityAnalyzer
+
+        return LegislativeActivityAnalyzer(base_dir=str(self.base_dir))
+
+    @cached_property
+    def bipartisan_analyzer(self):
+        """Bipartisan cooperation trend analyzer"""
+        from analyze_bipartisan_cooperation import BipartisanCooperationAnalyzer
+
+        return BipartisanCooperationAnalyzer(data_dir=str(self.base_dir))
+
+    @cached_property
+    def member_consistency_analyzer(self):
+        """Member consistency trend analyzer"""
+        from analyze_member_consistency import MemberConsistencyAnalyzer
+
+        return MemberConsistencyAnalyzer(data_dir=str(self.base_dir))
 
     def fetch_comprehensive_data(
-        self, congress: int = 118, max_items: int = 25
+        self, congress: int = 118, max_items: int = 25, max_workers: int = 4
     ) -> Dict:
         """
         Fetch all relevant data for analysis
@@ -59,6 +121,7 @@ class ComprehensiveAnalyzer:
         Args:
             congress: Congress number
             max_items: Maximum items to fetch per category
+            max_workers: Maximum number of categories fetched concurrently
 
         Returns:
             Dictionary with all fetched data
@@ -72,49 +135,64 @@ class ComprehensiveAnalyzer:
             "lobbying": {"filings": [], "lobbyists": []},
         }
 
-        # Fetch Congressional members with party info
-        logger.info("Fetching Congressional members...")
-        data["members"] = self.congress_api.get_members(
-            congress=congress,
-            max_members=max_items * 2,  # Get more members
-            base_dir=str(self.base_dir),
-        )
-
-        # Fetch voting records
-        logger.info("Fetching House voting records...")
-        data["votes"] = self.congress_api.get_roll_call_votes_with_details(
-            congress=congress,
-            chamber="house",
-            max_votes=max_items,
-            base_dir=str(self.base_dir),
-        )
-
-        # Fetch bills (using the v2 API)
-        logger.info("Fetching bills...")
-        self.congress_api_v2.get_bills(
-            congress=congress, max_results=max_items, base_dir=str(self.base_dir)
-        )
-
-        # Fetch committee data
-        logger.info("Fetching committee data...")
-        self.committee_fetcher.fetch_and_save_all(
-            congress=congress, fetch_bills=True, max_bills_per_committee=max_items
-        )
+        # Resolve the lazily created clients up front so worker threads
+        # share one client per API and one rate limiter per API key
+        congress_api = self.congress_api
+        congress_api_v2 = self.congress_api_v2
+        senate_api = self.senate_api
+        committee_fetcher = self.committee_fetcher
+        base_dir = str(self.base_dir)
+
+        # Categories are independent and each is throttled by its own API's
+        # rate limiter, so they are fetched concurrently
+        fetches = {
+            "members": lambda: congress_api.get_members(
+                congress=congress,
+                max_members=max_items * 2,  # Get more members
+                base_dir=base_dir,
+            ),
+            "House voting records": lambda: (
+                congress_api.get_roll_call_votes_with_details(
+                    congress=congress,
+                    chamber="house",
+                    max_votes=max_items,
+                    base_dir=base_dir,
+                )
+            ),
+            "bills": lambda: congress_api_v2.get_bills(
+                congress=congress, max_results=max_items, base_dir=base_dir
+            ),
+            "committee data": lambda: committee_fetcher.fetch_and_save_all(
+                congress=congress, fetch_bills=True, max_bills_per_committee=max_items
+            ),
+            "LD-1 filings": lambda: senate_api.get_filings(
+                filing_type="LD-1", max_results=max_items, base_dir=base_dir
+            ),
+            "LD-2 filings": lambda: senate_api.get_filings(
+                filing_type="LD-2", max_results=max_items, base_dir=base_dir
+            ),
+            "lobbyists": lambda: senate_api.get_lobbyists(
+                max_results=max_items, base_dir=base_dir
+            ),
+        }
 
-        # Fetch lobbying data
-        logger.info("Fetching lobbying filings...")
-        ld1_count = self.senate_api.get_filings(
-            filing_type="LD-1", max_results=max_items, base_dir=str(self.base_dir)
-        )
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for category, fetch in fetches.items():
+                logger.info(f"Fetching {category}...")
+                futures[executor.submit(fetch)] = category
 
-        ld2_count = self.senate_api.get_filings(
-            filing_type="LD-2", max_results=max_items, base_dir=str(self.base_dir)
-        )
+            for future in as_completed(futures):
+                category = futures[future]
+                results[category] = future.result()
+                logger.info(f"Finished fetching {category}")
 
-        logger.info("Fetching lobbyists...")
-        lobbyist_count = self.senate_api.get_lobbyists(
-            max_results=max_items, base_dir=str(self.base_dir)
-        )
+        data["members"] = results["members"]
+        data["votes"] = results["House voting records"]
+        ld1_count = results["LD-1 filings"]
+        ld2_count = results["LD-2 filings"]
+        lobbyist_count = results["lobbyists"]
 
         data["lobbying"]["filing_counts"] = {
             "LD-1": ld1_count,
@@ -154,14 +232,26 @@ class ComprehensiveAnalyzer:
                         continue
 
                     try:
-                        with open(vote_file) as f:
-                            vote = json.load(f)
-
+                        vote = json.loads(vote_file.read_bytes())
                         analysis["total_votes"] += 1
 
                         # Analyze party breakdown
                         party_breakdown = vote.get("party_breakdown", {})
 
+                        vote_summary = {
+                            "rollCall": vote.get("rollCall"),
+                            "question": vote.get("question", "")[:100],
+                            "date": vote.get("date"),
+                            "party_breakdown": party_breakdown,
+                        }
+
+                        # Votes without a party breakdown are never bipartisan
+                        # and have no unity or swing voters to score, so only
+                        # their summary is recorded
+                        if not party_breakdown:
+                            analysis["partisan_bills"].append(vote_summary)
+                            continue
+
                         # Calculate party unity scores
                         for party, votes in party_breakdown.items():
                             total = sum(votes.values())
@@ -172,21 +262,26 @@ class ComprehensiveAnalyzer:
                                 )
                                 unity_score = (majority_position[1] / total) * 100
 
-                                if party not in analysis["party_unity"]:
-                                    analysis["party_unity"][party] = []
-                                analysis["party_unity"][party].append(unity_score)
+                                # Aggregate running stats instead of keeping
+                                # every score around for a second pass
+                                unity = analysis["party_unity"].get(party)
+                                if unity is None:
+                                    analysis["party_unity"][party] = {
+                                        "total": unity_score,
+                                        "min": unity_score,
+                                        "max": unity_score,
+                                        "votes_analyzed": 1,
+                                    }
+                                else:
+                                    unity["total"] += unity_score
+                                    unity["votes_analyzed"] += 1
+                                    if unity_score < unity["min"]:
+                                        unity["min"] = unity_score
+                                    elif unity_score > unity["max"]:
+                                        unity["max"] = unity_score
 
                         # Identify bipartisan vs partisan votes
-                        is_bipartisan = self._is_bipartisan(party_breakdown)
-
-                        vote_summary = {
-                            "rollCall": vote.get("rollCall"),
-                            "question": vote.get("question", "")[:100],
-                            "date": vote.get("date"),
-                            "party_breakdown": party_breakdown,
-                        }
-
-                        if is_bipartisan:
+                        if self._is_bipartisan(party_breakdown):
                             analysis["bipartisan_bills"].append(vote_summary)
                         else:
                             analysis["partisan_bills"].append(vote_summary)
@@ -219,15 +314,13 @@ class ComprehensiveAnalyzer:
                         logger.error(f"Error analyzing {vote_file}: {e}")
 
         # Calculate average party unity scores
-        for party in analysis["party_unity"]:
-            scores = analysis["party_unity"][party]
-            if scores:
-                analysis["party_unity"][party] = {
-                    "average": sum(scores) / len(scores),
-                    "min": min(scores),
-                    "max": max(scores),
-                    "votes_analyzed": len(scores),
-                }
+        for party, unity in analysis["party_unity"].items():
+            analysis["party_unity"][party] = {
+                "average": unity["total"] / unity["votes_analyzed"],
+                "min": unity["min"],
+                "max": unity["max"],
+                "votes_analyzed": unity["votes_analyzed"],
+            }
 
         # Sort bipartisan and partisan bills
         analysis["bipartisan_bills"] = sorted(
@@ -277,18 +370,8 @@ class ComprehensiveAnalyzer:
 
     def _voted_against_party(self, member_position: str, party_majority: str) -> bool:
         """Check if member voted against party majority"""
-        position_map = {
-            "yea": ["yea", "aye", "yes"],
-            "nay": ["nay", "no"],
-            "present": ["present"],
-            "not_voting": ["not voting", "not_voting"],
-        }
-
-        member_vote_type = None
-        for vote_type, variations in position_map.items():
-            if any(var in member_position.lower() for var in variations):
-                member_vote_type = vote_type
-                break
+        match = _POSITION_RE.search(member_position.lower())
+        member_vote_type = _POSITION_TYPES[match.group(1)] if match else None
 
         return member_vote_type != party_majority and member_vote_type not in [
             "present",
@@ -355,7 +438,10 @@ class ComprehensiveAnalyzer:
             )[:10]
         )
 
-        analysis["filing_trends"] = dict(sorted(analysis["filing_trends"].items()))
+        filing_trends = analysis["filing_trends"]
+        analysis["filing_trends"] = {
+            month: filing_trends[month] for month in sorted(filing_trends)
+        }
 
         return analysis
 
@@ -445,8 +531,7 @@ class ComprehensiveAnalyzer:
         trends_path = self.base_dir / "analysis" / "trend_analysis_comprehensive.json"
         trends_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(trends_path, "w") as f:
-            json.dump(trend_results, f, indent=2, default=str)
+        self._write_json(trends_path, trend_results)
 
         logger.info(f"Trend analysis pipeline complete. Results saved to {trends_path}")
 
@@ -551,13 +636,20 @@ class ComprehensiveAnalyzer:
         report_path = self.base_dir / "analysis" / "comprehensive_report.json"
         report_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(report_path, "w") as f:
-            json.dump(report, f, indent=2, default=str)
+        self._write_json(report_path, report)
 
         logger.info(f"Report saved to {report_path}")
 
         return report
 
+    def _write_json(self, path: Path, data: Dict) -> None:
+        """Write analysis output, compact unless pretty output was requested"""
+        with open(path, "w") as f:
+            if self.pretty:
+                json.dump(data, f, indent=2, default=str)
+            else:
+                json.dump(data, f, default=str, separators=(",", ":"))
+
     def _analyze_member_stats(self) -> Dict:
         """Analyze member statistics"""
         stats = {
@@ -799,7 +891,16 @@ def main():
     parser.add_argument(
         "--max-items", type=int, default=25, help="Maximum items to fetch per category"
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=4,
+        help="Maximum number of categories fetched concurrently",
+    )
     parser.add_argument("--output-dir", default="data", help="Output directory")
+    parser.add_argument(
+        "--pretty", action="store_true", help="Indent JSON output for debugging"
+    )
 
     args = parser.parse_args()
 
@@ -809,7 +910,7 @@ def main():
         args.analyze = True
 
     # Initialize analyzer
-    analyzer = ComprehensiveAnalyzer(base_dir=args.output_dir)
+    analyzer = ComprehensiveAnalyzer(base_dir=args.output_dir, pretty=args.pretty)
 
     # Handle trends-only mode
     if args.trends_only:
@@ -830,7 +931,9 @@ def main():
     if args.fetch:
         logger.info(f"Fetching comprehensive data for {args.congress}th Congress...")
         analyzer.fetch_comprehensive_data(
-            congress=args.congress, max_items=args.max_items
+            congress=args.congress,
+            max_items=args.max_items,
+            max_workers=args.max_workers,
         )
         logger.info("Data fetching complete!")
 
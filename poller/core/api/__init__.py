@@ -6,6 +6,9 @@ with consistent rate limiting and error handling.
 """
 
 from .base import BaseAPI
+from .cache import ResponseCache
+from .circuit_breaker import CircuitBreaker
+from .concurrency import AIMDController
 from .congress import CongressGovAPI
 from .rate_limiter import RateLimiter
 from .senate import SenateGovAPI
@@ -15,4 +18,7 @@ __all__ = [
     "CongressGovAPI",
     "SenateGovAPI",
     "BaseAPI",
+    "AIMDController",
+    "ResponseCache",
+    "CircuitBreaker",
 ]
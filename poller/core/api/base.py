@@ -7,19 +7,83 @@ rate limiting, error handling, and response validation.
 
 import logging
 import time
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from ..serialization import dumps, loads
+from .cache import ResponseCache
+from .circuit_breaker import CircuitBreaker
+from .concurrency import DEFAULT_LATENCY_TARGET_MS, AIMDController
 from .rate_limiter import RateLimiter
 
+# ijson is an optional dependency used for incremental parsing
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# ijson's parse errors do not subclass ValueError
+if IJSON_AVAILABLE:
+    JSON_ERRORS = (ValueError, ijson.JSONError)
+else:
+    JSON_ERRORS = (ValueError,)
+
+# httpx is an optional dependency used for the HTTP/2 transport
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+if HTTPX_AVAILABLE:
+    HTTP_STATUS_ERRORS = (requests.exceptions.HTTPError, httpx.HTTPStatusError)
+    TRANSPORT_ERRORS = (requests.exceptions.RequestException, httpx.TransportError)
+else:
+    HTTP_STATUS_ERRORS = (requests.exceptions.HTTPError,)
+    TRANSPORT_ERRORS = (requests.exceptions.RequestException,)
+
 logger = logging.getLogger(__name__)
 
+# Bodies up to this size are parsed in one go rather than incrementally
+STREAM_BUFFER_LIMIT = 1 << 20
+
+# Connection-specific headers that HTTP/2 forbids (RFC 9113, section 8.2.2)
+HOP_BY_HOP_HEADERS = frozenset(
+    {"connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade"}
+)
+
+
+@lru_cache(maxsize=1024)
+def _build_url(base_url: str, endpoint: str) -> str:
+    """Join a base URL and endpoint, memoized for frequently hit endpoints"""
+    return f"{base_url}/{endpoint.lstrip('/')}"
+
 
 class BaseAPI:
     """Base class for API clients with common functionality"""
 
-    def __init__(self, base_url: str, rate_limiter: RateLimiter, name: str = "BaseAPI"):
+    def __init__(
+        self,
+        base_url: str,
+        rate_limiter: RateLimiter,
+        name: str = "BaseAPI",
+        pool_connections: int = 32,
+        pool_maxsize: int = 32,
+        max_retries: int = 3,
+        max_concurrency: int = 32,
+        latency_target_ms: float = DEFAULT_LATENCY_TARGET_MS,
+        cache_ttl: int = 3600,
+        cache_dir: Optional[str] = None,
+        http2: bool = False,
+    ):
         """
         Initialize base API client
 
@@ -27,17 +91,113 @@ class BaseAPI:
             base_url: Base URL for the API
             rate_limiter: Rate limiter instance
             name: Name for logging purposes
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Maximum pooled keep-alive connections per host
+            max_retries: Retry attempts for timeouts, connection errors, 429 and 5xx
+            max_concurrency: Upper bound for the adaptive in-flight request limit
+            latency_target_ms: Mean response latency below which the in-flight
+                limit may grow again after backing off
+            cache_ttl: Seconds to reuse identical GET responses (0 disables caching)
+            cache_dir: Optional directory to persist cached responses across runs
+            http2: Send GETs through an httpx HTTP/2 client (requires httpx[http2])
         """
         self.base_url = base_url.rstrip("/")
         self.rate_limiter = rate_limiter
         self.name = name
+        self.concurrency = AIMDController(
+            c_max=max_concurrency, latency_target_ms=latency_target_ms, name=name
+        )
+        self.circuit_breaker = CircuitBreaker(name=name)
+        self.cache = (
+            ResponseCache(ttl=cache_ttl, cache_dir=cache_dir) if cache_ttl else None
+        )
         self.session = requests.Session()
 
-        # Set a reasonable timeout and user agent
+        # Retries (with exponential backoff and Retry-After support) are handled
+        # by urllib3 below the session rather than by a loop in _make_request
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+
+        # Keep pooled keep-alive sockets around for threaded callers instead of
+        # re-doing the TCP/TLS handshake once the default pool of 10 is full
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=False,
+            max_retries=retry,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Set a reasonable timeout and user agent. Accept-Encoding is left to
+        # requests, which offers gzip/deflate (and br when brotli is installed)
+        # and only advertises encodings it can decode.
         self.session.headers.update(
-            {"User-Agent": "Senate-Gov-Data-Collector/1.0 (Educational Research)"}
+            {
+                "User-Agent": "Senate-Gov-Data-Collector/1.0 (Educational Research)",
+                "Connection": "keep-alive",
+            }
         )
 
+        # Optional HTTP/2 client multiplexing concurrent requests over one
+        # connection; the requests session stays the default transport
+        self.http2_client = None
+        if http2:
+            if not HTTPX_AVAILABLE:
+                logger.warning(
+                    f"{self.name}: httpx not installed, falling back to HTTP/1.1"
+                )
+            else:
+                try:
+                    self.http2_client = httpx.Client(
+                        http2=True,
+                        limits=httpx.Limits(
+                            max_keepalive_connections=pool_maxsize,
+                            max_connections=pool_maxsize * 2,
+                        ),
+                        transport=httpx.HTTPTransport(http2=True, retries=max_retries),
+                        headers={
+                            "User-Agent": self.session.headers["User-Agent"],
+                        },
+                    )
+                except ImportError as e:
+                    logger.warning(
+                        f"{self.name}: HTTP/2 support unavailable ({e}), "
+                        "falling back to HTTP/1.1"
+                    )
+
+    def url(self, endpoint: str) -> str:
+        """
+        Build the full URL for an endpoint
+
+        Args:
+            endpoint: API endpoint (relative to base URL)
+
+        Returns:
+            Absolute request URL
+        """
+        return _build_url(self.base_url, endpoint)
+
+    def _cache_ttl(self, endpoint: str) -> Optional[float]:
+        """
+        Get the cache lifetime for an endpoint
+
+        Subclasses override this to keep immutable data for longer.
+
+        Args:
+            endpoint: API endpoint (relative to base URL)
+
+        Returns:
+            TTL in seconds, or None for the cache default
+        """
+        return None
+
     def _make_request(
         self,
         endpoint: str,
@@ -49,133 +209,342 @@ class BaseAPI:
         """
         Make a rate-limited request to the API
 
+        Responses are cached already parsed, keyed on the URL and the sorted
+        query parameters, so sibling lookups that build the same params in a
+        different order share one entry and one parse. The returned dict may
+        be the cached object itself and must be treated as read-only.
+
         Args:
             endpoint: API endpoint (relative to base URL)
             params: Query parameters
             headers: Additional headers
-            retries: Number of retry attempts
+            retries: Kept for backwards compatibility; retries are configured on
+                the session adapter (see ``max_retries``)
             timeout: Request timeout in seconds
 
         Returns:
             Response data or None if failed
         """
-        self.rate_limiter.wait_if_needed()
-
-        # Build URL
-        if endpoint.startswith("/"):
-            endpoint = endpoint[1:]
-        url = f"{self.base_url}/{endpoint}"
+        url = self.url(endpoint)
 
         # Merge headers
         request_headers = {}
         if headers:
             request_headers.update(headers)
 
-        last_exception = None
-
-        for attempt in range(retries + 1):
-            try:
-                logger.debug(f"{self.name}: Making request to {url}")
+        # Identical GETs are served from cache without touching the quota
+        cache_key = None
+        stale = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(url, params)
+            cached = self.cache.get(cache_key, ttl=self._cache_ttl(endpoint))
+            if cached is not None:
+                logger.debug("%s: Cache hit for %s", self.name, url)
+                return cached
+
+            # Expired entries with validators are revalidated with a conditional GET
+            stale = self.cache.get_stale(cache_key)
+            if stale is not None:
+                if stale.etag:
+                    request_headers["If-None-Match"] = stale.etag
+                if stale.last_modified:
+                    request_headers["If-Modified-Since"] = stale.last_modified
+
+        # Fast-fail while the host is in a sustained outage
+        if not self.circuit_breaker.allow_request():
+            logger.debug("%s: Circuit open, skipping request to %s", self.name, url)
+            return None
 
-                response = self.session.get(
-                    url, params=params, headers=request_headers, timeout=timeout
-                )
-                response.raise_for_status()
+        self.rate_limiter.wait_if_needed()
 
-                # Try to parse JSON
-                try:
-                    return response.json()
-                except ValueError as e:
-                    logger.error(f"{self.name}: Invalid JSON response from {url}: {e}")
-                    return None
-
-            except requests.exceptions.HTTPError as e:
-                last_exception = e
-                status_code = e.response.status_code if e.response else None
-
-                if status_code is None:
-                    logger.error(f"{self.name}: HTTP error with no response: {e}")
-                    continue
-                elif status_code == 429:  # Rate limit exceeded
-                    backoff_time = 60 * (attempt + 1)  # Exponential backoff
-                    logger.warning(
-                        f"{self.name}: Rate limit exceeded (429), backing off for {backoff_time}s..."
-                    )
-                    time.sleep(backoff_time)
-                    continue
-                elif status_code == 403:
-                    logger.error(
-                        f"{self.name}: Forbidden (403) - Check authentication/API key"
+        response = None
+        try:
+            logger.debug("%s: Making request to %s", self.name, url)
+
+            with self.concurrency.slot():
+                started = time.monotonic()
+                if self.http2_client is not None:
+                    # The httpx client does not see session-level settings, and
+                    # the session's HTTP/1.1 keep-alive header is invalid in h2
+                    response = self.http2_client.get(
+                        url,
+                        params={**(self.session.params or {}), **(params or {})},
+                        headers={
+                            name: value
+                            for name, value in {
+                                **self.session.headers,
+                                **request_headers,
+                            }.items()
+                            if name.lower() not in HOP_BY_HOP_HEADERS
+                        },
+                        timeout=timeout,
                     )
-                    return None
-                elif status_code == 404:
-                    logger.warning(f"{self.name}: Not found (404): {url}")
-                    return None
-                elif status_code >= 500:  # Server errors - retry
-                    backoff_time = 2**attempt  # Exponential backoff
-                    logger.warning(
-                        f"{self.name}: Server error {status_code}, retrying in {backoff_time}s..."
-                    )
-                    time.sleep(backoff_time)
-                    continue
                 else:
-                    logger.error(f"{self.name}: HTTP error {status_code}: {e}")
-                    return None
-
-            except requests.exceptions.Timeout as e:
-                last_exception = e
+                    response = self.session.get(
+                        url, params=params, headers=request_headers, timeout=timeout
+                    )
+            self.rate_limiter.observe(response.headers)
+            self.concurrency.observe(response.status_code, time.monotonic() - started)
+            if response.status_code >= 500:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+            response.raise_for_status()
+
+        except HTTP_STATUS_ERRORS as e:
+            status_code = e.response.status_code if e.response is not None else None
+
+            if status_code == 429:
                 logger.warning(
-                    f"{self.name}: Timeout on attempt {attempt + 1}/{retries + 1}"
+                    "%s: Rate limit exceeded (429), retries exhausted: %s",
+                    self.name,
+                    url,
+                )
+            elif status_code == 403:
+                logger.error(
+                    "%s: Forbidden (403) - Check authentication/API key", self.name
                 )
-                if attempt < retries:
-                    time.sleep(2**attempt)  # Exponential backoff
-                continue
+            elif status_code == 404:
+                logger.warning("%s: Not found (404): %s", self.name, url)
+            else:
+                logger.error("%s: HTTP error %s: %s", self.name, status_code, e)
+            return None
+
+        except TRANSPORT_ERRORS as e:
+            # Timeouts and connection errors that survived the adapter's retries
+            self.concurrency.record_failure()
+            self.circuit_breaker.record_failure()
+            logger.error(
+                "%s: All retry attempts failed. Last error: %s", self.name, e
+            )
+            return None
+
+        except Exception as e:
+            if response is None:
+                self.circuit_breaker.record_failure()
+            logger.error("%s: Unexpected error: %s", self.name, e)
+            return None
+
+        # Unchanged since the cached copy - skip the download and the parse
+        if response.status_code == 304 and stale is not None:
+            logger.debug("%s: Not modified (304): %s", self.name, url)
+            self.cache.set(cache_key, stale.data, stale.etag, stale.last_modified)
+            return stale.data
+
+        # Parse the raw bytes directly, skipping the str decode of response.text
+        try:
+            data = loads(memoryview(response.content))
+        except ValueError as e:
+            logger.error("%s: Invalid JSON response from %s: %s", self.name, url, e)
+            return None
+
+        if cache_key is not None:
+            self.cache.set(
+                cache_key,
+                data,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        return data
+
+    def _stream_request(
+        self,
+        endpoint: str,
+        json_path: str = "results.item",
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        timeout: int = 30,
+    ) -> Iterator[Dict]:
+        """
+        Stream records out of a large list response
 
-            except requests.exceptions.ConnectionError as e:
-                last_exception = e
-                logger.warning(
-                    f"{self.name}: Connection error on attempt {attempt + 1}/{retries + 1}"
+        With ijson installed, records are parsed incrementally as the body
+        arrives, so memory stays bounded per record and the first record is
+        available before the last byte. Without it, or when Content-Length
+        shows a small body, the response is parsed in full and the records
+        are yielded from the parsed document.
+
+        Args:
+            endpoint: API endpoint (relative to base URL)
+            json_path: ijson prefix of the records, e.g. "results.item"
+            params: Query parameters
+            headers: Additional headers
+            timeout: Request timeout in seconds
+
+        Yields:
+            Individual records found at json_path
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails, even
+                part way through the body, so callers paging through results
+                cannot mistake a failure for the end of the data
+            ValueError: If the body is not valid JSON (ijson.JSONError when
+                parsing incrementally)
+        """
+        self.rate_limiter.wait_if_needed()
+
+        url = self.url(endpoint)
+
+        try:
+            logger.debug("%s: Streaming request to %s", self.name, url)
+            with self.session.get(
+                url, params=params, headers=headers, timeout=timeout, stream=True
+            ) as response:
+                self.rate_limiter.observe(response.headers)
+                response.raise_for_status()
+
+                content_length = response.headers.get("Content-Length")
+                small_body = (
+                    content_length is not None
+                    and int(content_length) <= STREAM_BUFFER_LIMIT
                 )
-                if attempt < retries:
-                    time.sleep(2**attempt)  # Exponential backoff
-                continue
-
-            except Exception as e:
-                last_exception = e
-                logger.error(f"{self.name}: Unexpected error: {e}")
-                return None
-
-        # All retries exhausted
-        logger.error(
-            f"{self.name}: All retry attempts failed. Last error: {last_exception}"
-        )
-        return None
+                if IJSON_AVAILABLE and not small_body:
+                    response.raw.decode_content = True
+                    yield from ijson.items(response.raw, json_path)
+                    return
+
+                data = loads(memoryview(response.content))
+                for key in json_path.split("."):
+                    if key == "item":
+                        break
+                    data = data.get(key, []) if isinstance(data, dict) else []
+                yield from data
+
+        except requests.exceptions.RequestException as e:
+            logger.error("%s: Streaming request to %s failed: %s", self.name, url, e)
+            raise
+        except JSON_ERRORS as e:
+            logger.error("%s: Invalid JSON response from %s: %s", self.name, url, e)
+            raise
+
+    def _prime_cache(self, endpoint: str, data: Dict) -> None:
+        """
+        Seed the in-memory cache with a record already fetched elsewhere
+
+        Used when a list page returns the same representation as a detail
+        endpoint, so a later lookup by ID needs no request.
+
+        Args:
+            endpoint: Detail endpoint the record would be fetched from
+            data: Record to serve for that endpoint
+        """
+        if self.cache is not None:
+            key = self.cache.make_key(self.url(endpoint))
+            self.cache.set(key, data, persist=False)
+
+    def fetch_many(
+        self,
+        requests_to_make: List[Tuple[str, Optional[Dict]]],
+        max_workers: int = 8,
+    ) -> List[Optional[Dict]]:
+        """
+        Make several requests concurrently
+
+        Requests overlap their network waits in a thread pool while the
+        shared rate limiter still bounds the overall request rate.
+
+        Args:
+            requests_to_make: List of (endpoint, params) tuples
+            max_workers: Maximum number of in-flight requests
+
+        Returns:
+            Response data (or None) for each request, in input order
+        """
+        if not requests_to_make:
+            return []
+
+        workers = max(1, min(max_workers, len(requests_to_make)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(
+                    lambda request: self._make_request(request[0], request[1]),
+                    requests_to_make,
+                )
+            )
 
     def _validate_response(
-        self, data: Dict, required_fields: Optional[list] = None
+        self, data: Dict, required_fields: Optional[FrozenSet[str]] = None
     ) -> bool:
         """
         Validate API response structure
 
         Args:
             data: Response data to validate
-            required_fields: List of required fields
+            required_fields: Required fields, ideally a module-level frozenset
+                so the set is built once rather than per call
 
         Returns:
             True if valid, False otherwise
         """
         if not isinstance(data, dict):
-            logger.error(f"{self.name}: Response is not a dictionary")
+            logger.error("%s: Response is not a dictionary", self.name)
             return False
 
         if required_fields:
-            missing_fields = [field for field in required_fields if field not in data]
+            missing_fields = required_fields - data.keys()
             if missing_fields:
-                logger.error(f"{self.name}: Missing required fields: {missing_fields}")
+                logger.error(
+                    "%s: Missing required fields: %s",
+                    self.name,
+                    sorted(missing_fields),
+                )
                 return False
 
         return True
 
+    def _saved_count(self, filepath) -> int:
+        """
+        Get the number of records in a saved output file
+
+        The progress sidecar written by _write_progress gives the count
+        without parsing the (potentially very large) output file.
+
+        Args:
+            filepath: Path of the saved JSON array
+
+        Returns:
+            Number of saved records, 0 if there is no output file
+        """
+        progress_path = filepath.with_suffix(".progress.json")
+        if progress_path.exists():
+            return loads(progress_path.read_bytes())["count"]
+        if filepath.exists():
+            return len(loads(filepath.read_bytes()))
+        return 0
+
+    def _write_progress(self, filepath, count: int) -> None:
+        """Record the saved count so resumes need not parse the whole file"""
+        filepath.with_suffix(".progress.json").write_bytes(dumps({"count": count}))
+
+    def _load_saved(self, filepath, count: int) -> List[Dict]:
+        """Load the first count records saved by a previous run"""
+        return loads(filepath.read_bytes())[:count]
+
+    def _append_jsonl(self, records: List[Dict], filepath) -> None:
+        """Append records to a JSON Lines checkpoint file"""
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(filepath, "ab") as f:
+            for record in records:
+                f.write(dumps(record) + b"\n")
+
+    def _read_jsonl(self, filepath) -> List[Dict]:
+        """Read records from a JSON Lines checkpoint file"""
+        records = []
+        with open(filepath, "rb+") as f:
+            complete = 0
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("unterminated line")
+                    records.append(loads(line))
+                except ValueError:
+                    # Drop a partial last line left by an interrupted write so
+                    # later appends start on a fresh line
+                    f.truncate(complete)
+                    break
+                complete += len(line)
+        return records
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get API client statistics
@@ -187,4 +556,7 @@ class BaseAPI:
             "name": self.name,
             "base_url": self.base_url,
             "rate_limiter_stats": self.rate_limiter.get_stats(),
+            "concurrency_stats": self.concurrency.get_stats(),
+            "cache_stats": self.cache.get_stats() if self.cache else None,
+            "circuit_breaker_stats": self.circuit_breaker.get_stats(),
         }
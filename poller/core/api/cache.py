@@ -0,0 +1,219 @@
+"""
+Response cache for idempotent API GETs.
+
+Provides a two-tier cache: a thread-safe in-memory LRU with TTL, backed by
+an optional on-disk store so repeated lookups survive across runs without
+spending API quota. Expired entries keep their ETag/Last-Modified
+validators so they can be revalidated with a conditional GET.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CacheEntry(NamedTuple):
+    """A cached response and the validators needed to revalidate it"""
+
+    stored_at: float
+    data: Any
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class ResponseCache:
+    """Thread-safe in-memory LRU/TTL cache with optional disk persistence"""
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        ttl: int = 3600,
+        cache_dir: Optional[str] = None,
+    ):
+        """
+        Initialize response cache
+
+        Args:
+            maxsize: Maximum number of in-memory entries
+            ttl: Time to live in seconds for cached entries
+            cache_dir: Directory for the on-disk tier (disabled if None)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict] = None) -> str:
+        """
+        Build a stable cache key for a request
+
+        Args:
+            url: Full request URL
+            params: Query parameters
+
+        Returns:
+            Hex digest identifying the request
+        """
+        items = sorted((params or {}).items())
+        return hashlib.blake2b(f"{url}|{items}".encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str, ttl: Optional[float] = None) -> Optional[Any]:
+        """
+        Look up a cached response, checking memory then disk
+
+        Args:
+            key: Cache key from make_key()
+            ttl: Time to live for this lookup (defaults to the cache TTL)
+
+        Returns:
+            Cached response data or None on a miss
+        """
+        now = time.time()
+        ttl = self.ttl if ttl is None else ttl
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and now - entry.stored_at < ttl:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry.data
+
+        if entry is None:
+            entry = self._read_disk(key)
+            if entry is not None:
+                with self.lock:
+                    self._store(key, entry)
+                if now - entry.stored_at < ttl:
+                    with self.lock:
+                        self.hits += 1
+                    return entry.data
+
+        with self.lock:
+            self.misses += 1
+        return None
+
+    def get_stale(self, key: str) -> Optional[CacheEntry]:
+        """
+        Get an entry regardless of age, if it can be revalidated
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Entry with an ETag or Last-Modified validator, or None
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry is None:
+            entry = self._read_disk(key)
+        if entry is None or not (entry.etag or entry.last_modified):
+            return None
+        return entry
+
+    def set(
+        self,
+        key: str,
+        data: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        persist: bool = True,
+    ) -> None:
+        """
+        Cache a response in memory and, if enabled, on disk
+
+        Args:
+            key: Cache key from make_key()
+            data: Response data to cache
+            etag: ETag header of the response, if any
+            last_modified: Last-Modified header of the response, if any
+            persist: Also write the entry to the disk tier
+        """
+        entry = CacheEntry(time.time(), data, etag, last_modified)
+        with self.lock:
+            self._store(key, entry)
+        if persist:
+            self._write_disk(key, entry)
+
+    def clear(self) -> None:
+        """Clear the in-memory tier"""
+        with self.lock:
+            self.entries.clear()
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        """Insert an entry into the LRU, evicting the oldest if full"""
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Path:
+        """Get the on-disk location for a key"""
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str) -> Optional[CacheEntry]:
+        """Read an entry from the disk tier"""
+        if not self.cache_dir:
+            return None
+
+        path = self._disk_path(key)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path) as f:
+                stored = json.load(f)
+            return CacheEntry(
+                stored["stored_at"],
+                stored["data"],
+                stored.get("etag"),
+                stored.get("last_modified"),
+            )
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+    def _write_disk(self, key: str, entry: CacheEntry) -> None:
+        """Write an entry to the disk tier"""
+        if not self.cache_dir:
+            return
+
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(entry._asdict(), f)
+            tmp_path.replace(path)
+        except Exception as e:
+            logger.warning(f"Could not write cache entry {path}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with cache stats
+        """
+        with self.lock:
+            return {
+                "entries": len(self.entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "cache_dir": str(self.cache_dir) if self.cache_dir else None,
+            }
@@ -0,0 +1,121 @@
+"""
+Circuit breaker for API clients.
+
+Fast-fails requests while an API host is having a sustained outage instead
+of spending the full retry budget on every call, then lets a single probe
+request through after a cooldown to detect recovery.
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """Thread-safe closed -> open -> half-open circuit breaker"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        failure_window: float = 30,
+        cooldown: float = 60,
+        name: Optional[str] = None,
+    ):
+        """
+        Initialize circuit breaker
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            failure_window: Seconds within which those failures must occur
+            cooldown: Seconds to stay open before allowing a probe request
+            name: Optional name for logging purposes
+        """
+        self.failure_threshold = failure_threshold
+        self.failure_window = failure_window
+        self.cooldown = cooldown
+        self.name = name or "CircuitBreaker"
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.first_failure_time = 0.0
+        self.last_open_time = 0.0
+        self.lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may be sent
+
+        Returns:
+            False while the circuit is open (or a half-open probe is in flight)
+        """
+        with self.lock:
+            if self.state == self.CLOSED:
+                return True
+
+            if self.state == self.OPEN:
+                if time.monotonic() - self.last_open_time < self.cooldown:
+                    return False
+                # Cooldown elapsed - let a single probe through
+                self.state = self.HALF_OPEN
+                logger.info(f"{self.name}: Circuit half-open, sending probe request")
+                return True
+
+            # Half-open with a probe already in flight
+            return False
+
+    def record_success(self) -> None:
+        """Record a healthy response, closing the circuit"""
+        with self.lock:
+            if self.state != self.CLOSED:
+                logger.info(f"{self.name}: Circuit closed, API has recovered")
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        """Record a server error or transport failure"""
+        with self.lock:
+            now = time.monotonic()
+
+            if self.state == self.HALF_OPEN:
+                self._open(now)
+                return
+
+            if (
+                self.consecutive_failures == 0
+                or now - self.first_failure_time > self.failure_window
+            ):
+                self.consecutive_failures = 0
+                self.first_failure_time = now
+
+            self.consecutive_failures += 1
+            if self.consecutive_failures >= self.failure_threshold:
+                self._open(now)
+
+    def _open(self, now: float) -> None:
+        """Open the circuit (caller must hold the lock)"""
+        self.state = self.OPEN
+        self.last_open_time = now
+        self.consecutive_failures = 0
+        logger.warning(
+            f"{self.name}: Circuit open, skipping requests for {self.cooldown:.0f}s"
+        )
+
+    def get_stats(self) -> dict:
+        """
+        Get current circuit breaker statistics
+
+        Returns:
+            Dictionary with current stats
+        """
+        with self.lock:
+            return {
+                "name": self.name,
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+            }
@@ -0,0 +1,128 @@
+"""
+Adaptive concurrency control for API clients.
+
+Provides an AIMD (additive-increase / multiplicative-decrease) limit on the
+number of in-flight requests, so threaded callers fill the pipe while the
+API is healthy and back off quickly on 429s, server errors and timeouts.
+"""
+
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Full pages (up to 250 records) routinely take a second or two to arrive, so
+# only mean latencies beyond this count as a sign of an overloaded API
+DEFAULT_LATENCY_TARGET_MS = 3000
+
+
+class AIMDController:
+    """Thread-safe AIMD limit on concurrent requests"""
+
+    def __init__(
+        self,
+        c_min: int = 1,
+        c_max: int = 32,
+        alpha: float = 0.5,
+        beta: float = 0.5,
+        latency_target_ms: float = DEFAULT_LATENCY_TARGET_MS,
+        initial: Optional[int] = None,
+        window: int = 20,
+        name: Optional[str] = None,
+    ):
+        """
+        Initialize the controller
+
+        Args:
+            c_min: Minimum number of concurrent requests
+            c_max: Maximum number of concurrent requests
+            alpha: Additive increase applied after each fast success
+            beta: Multiplicative decrease applied after each failure
+            latency_target_ms: Mean latency below which concurrency may grow
+            initial: Starting concurrency limit (defaults to c_max, so callers
+                get their full worker count until the API pushes back)
+            window: Number of recent latencies used for the sliding mean
+            name: Optional name for logging purposes
+        """
+        self.c_min = c_min
+        self.c_max = c_max
+        self.alpha = alpha
+        self.beta = beta
+        self.latency_target = latency_target_ms / 1000
+        if initial is None:
+            initial = c_max
+        self.limit = float(max(c_min, min(c_max, initial)))
+        self.name = name or "AIMDController"
+        self.in_flight = 0
+        self.latencies = deque(maxlen=window)
+        self.condition = threading.Condition()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one of the currently allowed concurrent request slots"""
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.in_flight -= 1
+                self.condition.notify()
+
+    def record_success(self, latency: float) -> None:
+        """
+        Additively raise the limit while latencies stay under target
+
+        Args:
+            latency: Request latency in seconds
+        """
+        with self.condition:
+            self.latencies.append(latency)
+            mean_latency = sum(self.latencies) / len(self.latencies)
+            if mean_latency <= self.latency_target and self.limit < self.c_max:
+                previous = int(self.limit)
+                self.limit = min(self.c_max, self.limit + self.alpha)
+                if int(self.limit) > previous:
+                    self.condition.notify_all()
+
+    def record_failure(self) -> None:
+        """Multiplicatively cut the limit after a 429, 5xx or timeout"""
+        with self.condition:
+            self.limit = max(self.c_min, self.limit * self.beta)
+            logger.debug(
+                f"{self.name}: Backing off, concurrency limit now {int(self.limit)}"
+            )
+
+    def observe(self, status_code: int, latency: float) -> None:
+        """
+        Feed a completed response back into the controller
+
+        Args:
+            status_code: HTTP status code
+            latency: Request latency in seconds
+        """
+        if status_code == 429 or status_code >= 500:
+            self.record_failure()
+        else:
+            self.record_success(latency)
+
+    def get_stats(self) -> dict:
+        """
+        Get current controller statistics
+
+        Returns:
+            Dictionary with current stats
+        """
+        with self.condition:
+            return {
+                "name": self.name,
+                "limit": int(self.limit),
+                "in_flight": self.in_flight,
+                "c_min": self.c_min,
+                "c_max": self.c_max,
+            }
@@ -7,18 +7,59 @@ with unified functionality from all existing implementations.
 
 import logging
 import os
-import time
-from collections import defaultdict
+import re
+import threading
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, List, Optional
+from datetime import date
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
 
-from core.storage.file_storage import save_individual_record
+from core.storage.file_storage import load_individual_record, save_individual_record
 
+from ..serialization import dumps
 from .base import BaseAPI
 from .rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Bill actions that record a vote, each matched in a single case-insensitive scan
+_VOTE_ACTION_RE = re.compile(r"passed senate|vote|yea|nay|agreed", re.IGNORECASE)
+_ROLL_CALL_RE = re.compile(r"roll call|recorded vote", re.IGNORECASE)
+
+# Congress number in endpoints such as /bill/118/s/42/actions or /house-vote/118
+_ENDPOINT_CONGRESS_RE = re.compile(r"^/?[a-z-]+/(\d+)(?:/|$)")
+
+
+# Tallied vote positions, in party_breakdown order
+_VOTE_TALLY_KEYS = ("yea", "nay", "present", "not_voting")
+
+
+# Lowercased member vote positions as reported by the API
+_VOTE_POSITIONS = {
+    "yea": "yea",
+    "aye": "yea",
+    "yes": "yea",
+    "nay": "nay",
+    "no": "nay",
+    "present": "present",
+    "not voting": "not_voting",
+}
+
+
+def _normalize_vote_position(vote_position: str) -> str:
+    """Map a lowercased member vote position to one of _VOTE_TALLY_KEYS"""
+    vote_key = _VOTE_POSITIONS.get(vote_position)
+    if vote_key is None and vote_position:
+        # Qualified positions such as "present (announced)"
+        vote_key = _VOTE_POSITIONS.get(vote_position.split(None, 1)[0])
+    return vote_key or "not_voting"
+
+
+def _current_congress() -> int:
+    """Get the number of the Congress in session this year"""
+    return (date.today().year - 1789) // 2 + 1
+
 
 class CongressGovAPI(BaseAPI):
     """
@@ -33,12 +74,21 @@ class CongressGovAPI(BaseAPI):
 
     BASE_URL = "https://api.congress.gov/v3"
 
+    # Largest page the API returns per request; fewer, bigger pages amortize
+    # the per-request overhead and rate-limit cost
+    MAX_PAGE_SIZE = 250
+
+    # Records from adjourned Congresses no longer change, so cache them longer
+    HISTORICAL_CACHE_TTL = 30 * 24 * 3600
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         max_workers: int = 5,
         max_requests: int = 900,
         time_window: int = 3600,
+        cache_dir: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
     ):
         """
         Initialize Congress.gov API client
@@ -48,6 +98,11 @@ class CongressGovAPI(BaseAPI):
             max_workers: Maximum parallel workers for concurrent operations
             max_requests: Maximum requests per time window (default: 900/hour)
             time_window: Time window in seconds (default: 1 hour)
+            cache_dir: Directory for the persistent response cache (disabled
+                if None)
+            rate_limiter: Limiter shared with other clients using the same
+                API key (a new one is created from max_requests/time_window
+                if None)
         """
         # Support both DATA_GOV_API_KEY and CONGRESS_GOV_API_KEY for flexibility
         self.api_key = (
@@ -58,12 +113,26 @@ class CongressGovAPI(BaseAPI):
 
         # Congress.gov rate limit via data.gov: 1000 requests per hour per API key
         # Being conservative to ensure compliance
-        rate_limiter = RateLimiter(max_requests, time_window, name="CongressGovAPI")
+        if rate_limiter is None:
+            rate_limiter = RateLimiter(
+                max_requests, time_window, name="CongressGovAPI"
+            )
 
-        super().__init__(self.BASE_URL, rate_limiter, name="CongressGovAPI")
+        super().__init__(
+            self.BASE_URL, rate_limiter, name="CongressGovAPI", cache_dir=cache_dir
+        )
 
         self.max_workers = max_workers
 
+        # For data.gov APIs, the API key should be in the header; it is set
+        # once on the pooled keep-alive session rather than per request
+        if self.api_key:
+            self.session.headers["X-Api-Key"] = self.api_key
+
+        # Always request JSON; session params are merged into every request, so
+        # callers' params dicts are never mutated
+        self.session.params = {"format": "json"}
+
         if not self.api_key:
             logger.warning(
                 "No Congress.gov API key provided. Get one at: https://api.data.gov/signup/"
@@ -73,6 +142,21 @@ class CongressGovAPI(BaseAPI):
         self.members_cache = {}
         self.party_cache = {}
 
+    def _cache_ttl(self, endpoint: str) -> Optional[float]:
+        """
+        Keep responses about past Congresses for HISTORICAL_CACHE_TTL
+
+        Args:
+            endpoint: API endpoint
+
+        Returns:
+            TTL in seconds, or None for the cache default
+        """
+        match = _ENDPOINT_CONGRESS_RE.match(endpoint)
+        if match and int(match.group(1)) < _current_congress():
+            return self.HISTORICAL_CACHE_TTL
+        return None
+
     def _make_request(
         self,
         endpoint: str,
@@ -92,22 +176,80 @@ class CongressGovAPI(BaseAPI):
         Returns:
             Response data or None if failed
         """
-        if not params:
-            params = {}
+        return super()._make_request(endpoint, params, None, retries, timeout)
 
-        # For data.gov APIs, the API key should be in the header
-        headers = {}
-        if self.api_key:
-            headers["X-Api-Key"] = self.api_key
+    def _iter_pages(
+        self,
+        endpoint: str,
+        extract: Callable[[Dict], List[Dict]],
+        params: Optional[Dict] = None,
+        limit: int = MAX_PAGE_SIZE,
+        max_items: Optional[int] = None,
+        offset: int = 0,
+    ) -> Iterator[List[Dict]]:
+        """
+        Yield the pages of a paginated list endpoint in offset order
+
+        The first page reveals the total count, after which the remaining
+        pages are requested ``max_workers`` at a time via fetch_many so their
+        network latency overlaps while the rate limiter bounds the rate.
+
+        Args:
+            endpoint: API endpoint
+            extract: Returns the records from a page response
+            params: Extra query parameters for every page
+            limit: Results per page
+            max_items: Maximum number of records to request (None for all)
+            offset: Offset of the first record
+
+        Yields:
+            Lists of records, one per page
+        """
+        params = params or {}
+        end = offset + max_items if max_items is not None else None
 
-        params["format"] = "json"
+        first_limit = limit if end is None else min(limit, end - offset)
+        data = self._make_request(
+            endpoint, {**params, "limit": first_limit, "offset": offset}
+        )
+        records = extract(data) if data else []
+        if not records:
+            return
+        yield records
+
+        pagination = data.get("pagination", {})
+        if not pagination.get("next"):
+            return
+
+        total = pagination.get("count")
+        if total is not None:
+            end = total if end is None else min(end, total)
+        offset += first_limit
+
+        # Without a known end, fall back to fetching one page at a time
+        batch_size = self.max_workers if end is not None else 1
+
+        while end is None or offset < end:
+            batch = []
+            for _ in range(batch_size):
+                if end is not None and offset >= end:
+                    break
+                page_limit = limit if end is None else min(limit, end - offset)
+                batch.append(
+                    (endpoint, {**params, "limit": page_limit, "offset": offset})
+                )
+                offset += page_limit
 
-        return super()._make_request(endpoint, params, headers, retries, timeout)
+            for data in self.fetch_many(batch, max_workers=batch_size):
+                records = extract(data) if data else []
+                if not records:
+                    return
+                yield records
 
     def get_bills(
         self,
         congress: Optional[int] = None,
-        limit: int = 25,
+        limit: int = MAX_PAGE_SIZE,
         max_results: int = 25,
         output_dir: str = "data",
         incremental: bool = True,
@@ -118,7 +260,7 @@ class CongressGovAPI(BaseAPI):
 
         Args:
             congress: Congress number (e.g., 118 for 118th Congress), None for all
-            limit: Number of results per page
+            limit: Number of results per page (API maximum by default)
             max_results: Maximum total results to fetch
             output_dir: Directory for incremental saves
             incremental: Whether to save incrementally
@@ -138,75 +280,78 @@ class CongressGovAPI(BaseAPI):
             endpoint = "/bill"
             filename = "congress_all_bills.json"
 
+        # Bills beyond those already saved in the output file
         all_bills = []
-        offset = 0
+        # Bills in the output file from a previous run, loaded only when needed
+        saved_count = 0
+        # Number of records in all_bills already appended to the JSONL checkpoint
+        checkpointed = 0
 
         # Check if we have existing data to resume from
         if incremental:
-            import json
-            from pathlib import Path
-
             filepath = Path(output_dir) / filename
-            if filepath.exists():
-                try:
-                    with open(filepath) as f:
-                        existing_data = json.load(f)
-                    if len(existing_data) >= max_results:
-                        logger.info(
-                            f"Using existing data: {len(existing_data)} bills already cached"
-                        )
-                        return existing_data[:max_results]
-                    all_bills = existing_data
-                    offset = len(all_bills)
+            checkpoint_path = filepath.with_suffix(".jsonl")
+            try:
+                saved_count = self._saved_count(filepath)
+
+                if checkpoint_path.exists():
+                    # An interrupted run left an append-only checkpoint
+                    all_bills = self._read_jsonl(checkpoint_path)
+                    checkpointed = len(all_bills)
+
+                if saved_count + len(all_bills) >= max_results:
+                    existing_data = (
+                        self._load_saved(filepath, saved_count) + all_bills
+                    )
                     logger.info(
-                        f"Resuming from offset {offset} with {len(all_bills)} existing bills"
+                        f"Using existing data: {len(existing_data)} bills already cached"
                     )
-                except Exception as e:
-                    logger.warning(f"Could not load existing data: {e}")
+                    return existing_data[:max_results]
+                if saved_count or all_bills:
+                    logger.info(
+                        f"Resuming from offset {saved_count + len(all_bills)} "
+                        "with existing bills"
+                    )
+            except Exception as e:
+                logger.warning(f"Could not load existing data: {e}")
+                saved_count = 0
+                all_bills = []
+                checkpointed = 0
 
+        offset = saved_count + len(all_bills)
         batch_count = 0
 
-        while len(all_bills) < max_results:
-            params = {
-                "limit": min(limit, max_results - len(all_bills)),
-                "offset": offset,
-            }
-
-            logger.info(
-                f"Fetching bills (offset: {offset}, {len(all_bills)}/{max_results})..."
-            )
-
-            data = self._make_request(endpoint, params)
-            if not data:
-                break
-
-            bills = data.get("bills", [])
-            if not bills:
-                break
+        logger.info(f"Fetching bills (offset: {offset}, {offset}/{max_results})...")
 
+        for bills in self._iter_pages(
+            endpoint,
+            lambda data: data.get("bills", []),
+            limit=limit,
+            max_items=max_results - offset,
+            offset=offset,
+        ):
             all_bills.extend(bills)
             batch_count += 1
 
-            # Save incrementally every 5 batches
+            # Checkpoint incrementally every 5 batches, appending only the
+            # bills fetched since the last checkpoint
             if incremental and batch_count % 5 == 0:
-                self._save_data(all_bills, filename, output_dir)
-                logger.info(f"Saved checkpoint: {len(all_bills)} bills")
+                self._append_jsonl(all_bills[checkpointed:], checkpoint_path)
+                checkpointed = len(all_bills)
+                logger.info(f"Saved checkpoint: {saved_count + len(all_bills)} bills")
 
-            if len(all_bills) >= max_results:
+            if saved_count + len(all_bills) >= max_results:
                 logger.info(f"Reached maximum results limit: {max_results}")
                 break
 
-            # Check pagination
-            pagination = data.get("pagination", {})
-            if not pagination.get("next"):
-                break
-
-            offset += limit
-            time.sleep(0.5)  # Be respectful
+        # The saved output is only parsed once, when merging for the final save
+        if saved_count:
+            all_bills = self._load_saved(filepath, saved_count) + all_bills
 
-        # Final save
+        # Final save replaces the checkpoint
         if incremental:
-            self._save_data(all_bills, filename, output_dir)
+            self._save_data(all_bills, filename, output_dir, pretty=True)
+            checkpoint_path.unlink(missing_ok=True)
 
         logger.info(f"Retrieved {len(all_bills)} bills")
         return all_bills[:max_results]
@@ -274,7 +419,7 @@ class CongressGovAPI(BaseAPI):
             List of action records
         """
         endpoint = f"/bill/{congress}/{bill_type.lower()}/{bill_number}/actions"
-        data = self._make_request(endpoint, {"limit": 250})
+        data = self._make_request(endpoint, {"limit": self.MAX_PAGE_SIZE})
 
         if data and "actions" in data:
             return data["actions"]
@@ -284,7 +429,7 @@ class CongressGovAPI(BaseAPI):
         self,
         congress: int,
         chamber: str = "house",
-        limit: int = 25,
+        limit: int = MAX_PAGE_SIZE,
         max_results: int = 25,
         current_only: bool = True,
     ) -> List[Dict]:
@@ -294,7 +439,7 @@ class CongressGovAPI(BaseAPI):
         Args:
             congress: Congress number
             chamber: Chamber ('house' or 'senate')
-            limit: Results per page
+            limit: Results per page (API maximum by default)
             max_results: Maximum total results
             current_only: Only get current members
 
@@ -304,55 +449,33 @@ class CongressGovAPI(BaseAPI):
         # Use the general member endpoint with filters
         endpoint = "/member"
         all_members = []
-        offset = 0
-
-        while len(all_members) < max_results:
-            params = {
-                "limit": min(limit, max_results - len(all_members)),
-                "offset": offset,
-            }
-
-            if current_only:
-                params["currentMember"] = "true"
 
-            logger.info(
-                f"Fetching {chamber} members from {congress}th Congress (offset: {offset})..."
-            )
+        params = {}
+        if current_only:
+            params["currentMember"] = "true"
 
-            data = self._make_request(endpoint, params)
-            if not data:
-                break
+        logger.info(f"Fetching {chamber} members from {congress}th Congress...")
 
-            members = data.get("members", [])
-            if not members:
-                break
+        wanted_chamber = chamber.lower()
 
+        for members in self._iter_pages(
+            endpoint, lambda data: data.get("members", []), params, limit=limit
+        ):
             # Filter by chamber if needed
-            # Since we're getting all members, filter based on their terms
-            for member in members:
-                terms = member.get("terms", {}).get("item", [])
-                # Check if member served in the requested chamber
-                for term in terms:
-                    term_chamber = term.get("chamber", "").lower()
-                    if (
-                        chamber.lower() == "house"
-                        and "house" in term_chamber
-                        or chamber.lower() == "senate"
-                        and "senate" in term_chamber
-                    ):
-                        all_members.append(member)
-                        break
+            # Since we're getting all members, keep those who served a term
+            # in the requested chamber
+            all_members.extend(
+                member
+                for member in members
+                if any(
+                    wanted_chamber in term.get("chamber", "").lower()
+                    for term in member.get("terms", {}).get("item", [])
+                )
+            )
 
             if len(all_members) >= max_results:
                 break
 
-            pagination = data.get("pagination", {})
-            if not pagination.get("next"):
-                break
-
-            offset += limit
-            time.sleep(0.5)
-
         logger.info(f"Retrieved {len(all_members)} {chamber} members")
         return all_members[:max_results]
 
@@ -360,7 +483,7 @@ class CongressGovAPI(BaseAPI):
         self,
         congress: int,
         session: Optional[int] = None,
-        limit: int = 25,
+        limit: int = MAX_PAGE_SIZE,
         max_results: int = 25,
     ) -> List[Dict]:
         """
@@ -369,7 +492,7 @@ class CongressGovAPI(BaseAPI):
         Args:
             congress: Congress number
             session: Session number (optional)
-            limit: Results per page
+            limit: Results per page (API maximum by default)
             max_results: Maximum results to fetch
 
         Returns:
@@ -381,43 +504,25 @@ class CongressGovAPI(BaseAPI):
             endpoint = f"/house-vote/{congress}"
 
         all_votes = []
-        offset = 0
-
-        while len(all_votes) < max_results:
-            params = {
-                "limit": min(limit, max_results - len(all_votes)),
-                "offset": offset,
-            }
-
-            logger.info(
-                f"Fetching House votes from {congress}th Congress (offset: {offset})..."
-            )
 
-            data = self._make_request(endpoint, params)
-            if not data:
-                break
+        logger.info(f"Fetching House votes from {congress}th Congress...")
 
-            votes = (
+        for votes in self._iter_pages(
+            endpoint,
+            lambda data: (
                 data.get("votes", [])
                 or data.get("rollCalls", [])
                 or data.get("houseVotes", [])
-            )
-            if not votes:
-                break
-
+            ),
+            limit=limit,
+            max_items=max_results,
+        ):
             all_votes.extend(votes)
 
             if len(all_votes) >= max_results:
                 logger.info(f"Reached maximum results limit: {max_results}")
                 break
 
-            pagination = data.get("pagination", {})
-            if not pagination.get("next"):
-                break
-
-            offset += limit
-            time.sleep(0.5)
-
         logger.info(f"Retrieved {len(all_votes)} House votes")
         return all_votes[:max_results]
 
@@ -428,6 +533,7 @@ class CongressGovAPI(BaseAPI):
         session: int,
         vote_number: int,
         base_dir: str = "data",
+        refresh: bool = False,
     ) -> Optional[Dict]:
         """
         Get detailed vote information including how each member voted
@@ -438,56 +544,64 @@ class CongressGovAPI(BaseAPI):
             session: Session number
             vote_number: Vote number
             base_dir: Base directory for storage
+            refresh: Re-fetch even if the vote was already saved
 
         Returns:
             Detailed vote record or None if not found
         """
         if chamber.lower() == "house":
-            # Get vote details
+            vote_id = f"{congress}_{session}_{vote_number}"
+            record_type = f"house_votes_detailed/{congress}"
+
+            # Recorded roll calls do not change, so reuse a saved copy
+            if not refresh:
+                saved_vote = load_individual_record(record_type, vote_id, base_dir)
+                if saved_vote is not None:
+                    return saved_vote
+
+            # Get vote details and member votes; the requests are independent
+            # so they are issued concurrently
             detail_endpoint = f"/house-vote/{congress}/{session}/{vote_number}"
-            data = self._make_request(detail_endpoint)
+            members_endpoint = f"{detail_endpoint}/members"
+            data, members_data = self.fetch_many(
+                [(detail_endpoint, None), (members_endpoint, None)], max_workers=2
+            )
 
             if not data:
                 return None
 
             vote_info = data.get("rollCall", {})
 
-            # Get member votes
-            members_endpoint = f"/house-vote/{congress}/{session}/{vote_number}/members"
-            members_data = self._make_request(members_endpoint)
-
             if members_data:
+                members = members_data.get("members", [])
+
+                # Column-wise pass over the roll call: one list per field
+                parties = [member.get("party", "Unknown") for member in members]
+                positions = [
+                    member.get("votePosition", "").lower() for member in members
+                ]
+                vote_keys = [_normalize_vote_position(p) for p in positions]
+
                 # Organize votes by party
-                party_breakdown = defaultdict(
-                    lambda: {"yea": 0, "nay": 0, "present": 0, "not_voting": 0}
-                )
-                member_votes = []
-
-                for member_vote in members_data.get("members", []):
-                    vote_position = member_vote.get("votePosition", "").lower()
-                    party = member_vote.get("party", "Unknown")
-
-                    # Normalize vote position
-                    if "yea" in vote_position or "aye" in vote_position:
-                        vote_key = "yea"
-                    elif "nay" in vote_position or "no" in vote_position:
-                        vote_key = "nay"
-                    elif "present" in vote_position:
-                        vote_key = "present"
-                    else:
-                        vote_key = "not_voting"
-
-                    party_breakdown[party][vote_key] += 1
-
-                    member_votes.append(
-                        {
-                            "bioguideId": member_vote.get("bioguideId"),
-                            "name": member_vote.get("name"),
-                            "party": party,
-                            "state": member_vote.get("state"),
-                            "vote": vote_position,
-                        }
+                party_breakdown = {}
+                tallies = Counter(zip(parties, vote_keys))
+                for (party, vote_key), count in tallies.items():
+                    if party not in party_breakdown:
+                        party_breakdown[party] = dict.fromkeys(_VOTE_TALLY_KEYS, 0)
+                    party_breakdown[party][vote_key] = count
+
+                member_votes = [
+                    {
+                        "bioguideId": member.get("bioguideId"),
+                        "name": member.get("name"),
+                        "party": party,
+                        "state": member.get("state"),
+                        "vote": vote_position,
+                    }
+                    for member, party, vote_position in zip(
+                        members, parties, positions
                     )
+                ]
 
                 # Combine vote info with member votes
                 detailed_vote = {
@@ -500,7 +614,7 @@ class CongressGovAPI(BaseAPI):
                     "date": vote_info.get("date", ""),
                     "result": vote_info.get("result", ""),
                     "bill": vote_info.get("bill", {}),
-                    "party_breakdown": dict(party_breakdown),
+                    "party_breakdown": party_breakdown,
                     "totals": {
                         "yea": vote_info.get("yea", 0),
                         "nay": vote_info.get("nay", 0),
@@ -511,8 +625,6 @@ class CongressGovAPI(BaseAPI):
                 }
 
                 # Save detailed vote
-                vote_id = f"{congress}_{session}_{vote_number}"
-                record_type = f"house_votes_detailed/{congress}"
                 save_individual_record(detailed_vote, record_type, vote_id, base_dir)
 
                 logger.info(
@@ -552,55 +664,56 @@ class CongressGovAPI(BaseAPI):
             return self._get_senate_votes_from_bills(congress, max_votes, base_dir)
 
         all_votes = []
-        offset = 0
-        limit = 20
+        futures = []
+        # Bounds how far pagination may run ahead of the detail workers
+        pending = threading.BoundedSemaphore(self.max_workers * 2)
+
+        def fetch_details(session: int, vote_number: int) -> Optional[Dict]:
+            try:
+                return self.get_vote_details(
+                    congress=congress,
+                    chamber=chamber,
+                    session=session,
+                    vote_number=vote_number,
+                    base_dir=base_dir,
+                )
+            finally:
+                pending.release()
 
         logger.info(f"Fetching {chamber} roll call votes from {congress}th Congress...")
 
-        while len(all_votes) < max_votes:
-            params = {"limit": min(limit, max_votes - len(all_votes)), "offset": offset}
-            data = self._make_request(endpoint, params)
-
-            if not data:
-                break
-
-            votes = data.get("votes", []) or data.get("rollCalls", [])
-            if not votes:
-                break
-
-            # Process votes in parallel
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = []
-
-                for vote in votes[: max_votes - len(all_votes)]:
+        # Pagination feeds vote numbers to the detail workers as pages arrive,
+        # so detail fetches are not held up at page boundaries
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for votes in self._iter_pages(
+                endpoint,
+                lambda data: data.get("votes", []) or data.get("rollCalls", []),
+                max_items=max_votes,
+            ):
+                for vote in votes:
                     vote_number = vote.get("rollCall") or vote.get("number")
-                    session = vote.get("session", 1)
-
-                    if vote_number:
-                        future = executor.submit(
-                            self.get_vote_details,
-                            congress,
-                            session,
-                            vote_number,
-                            chamber,
-                            base_dir,
-                        )
-                        futures.append((future, vote))
+                    if not vote_number:
+                        continue
 
-                for future, _vote in futures:
-                    try:
-                        detailed_vote = future.result(timeout=30)
-                        if detailed_vote:
-                            all_votes.append(detailed_vote)
-                    except Exception as e:
-                        logger.error(f"Error getting vote details: {e}")
+                    pending.acquire()
+                    futures.append(
+                        executor.submit(
+                            fetch_details, vote.get("session", 1), vote_number
+                        )
+                    )
+                    if len(futures) >= max_votes:
+                        break
 
-            pagination = data.get("pagination", {})
-            if not pagination.get("next"):
-                break
+                if len(futures) >= max_votes:
+                    break
 
-            offset += limit
-            time.sleep(0.5)
+        for future in futures:
+            try:
+                detailed_vote = future.result()
+                if detailed_vote:
+                    all_votes.append(detailed_vote)
+            except Exception as e:
+                logger.error(f"Error getting vote details: {e}")
 
         logger.info(f"Retrieved {len(all_votes)} detailed votes")
         return all_votes
@@ -619,7 +732,7 @@ class CongressGovAPI(BaseAPI):
         max_bills_to_process = 1000  # Prevent infinite processing
 
         while len(votes) < max_votes and bills_processed < max_bills_to_process:
-            params = {"limit": 100, "offset": offset}
+            params = {"limit": self.MAX_PAGE_SIZE, "offset": offset}
             logger.info(
                 f"Fetching bills batch (offset: {offset}, votes found so far: {len(votes)}/{max_votes})..."
             )
@@ -638,74 +751,59 @@ class CongressGovAPI(BaseAPI):
                 f"Processing {len(bills)} bills from batch (offset {offset})..."
             )
 
-            for bill in bills:
-                bills_processed += 1
-                if len(votes) >= max_votes:
-                    logger.info(f"Reached max_votes limit ({max_votes})")
-                    break
+            bills_processed += len(bills)
+
+            # Pass 1: keep the Senate-origin bills whose actions can be looked up
+            senate_bills = [
+                bill
+                for bill in bills
+                if bill.get("originChamberCode") == "S"
+                and bill.get("type")
+                and bill.get("number")
+            ]
+            senate_bills_found += len(senate_bills)
+            logger.info(
+                f"Found {len(senate_bills)} Senate bills in batch "
+                f"(total Senate bills: {senate_bills_found})"
+            )
+
+            def fetch_actions(bill):
+                try:
+                    return self.get_bill_actions(
+                        congress, bill["type"].lower(), bill["number"]
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to get actions for {bill['type'].upper()}{bill['number']}: {e}"
+                    )
+                    return []
 
-                # Only process Senate-origin bills
-                if bill.get("originChamberCode") == "S":
-                    senate_bills_found += 1
-                    bill_type = bill.get("type", "").lower()
-                    bill_number = bill.get("number", "")
-
-                    if bill_type and bill_number:
-                        if senate_bills_found % 10 == 0:  # Log every 10th Senate bill
-                            logger.info(
-                                f"Processing Senate bill {senate_bills_found}: {bill_type.upper()}{bill_number} (total bills processed: {bills_processed})"
-                            )
-
-                        try:
-                            actions = self.get_bill_actions(
-                                congress, bill_type, bill_number
-                            )
-                        except Exception as e:
-                            logger.warning(
-                                f"Failed to get actions for {bill_type.upper()}{bill_number}: {e}"
-                            )
-                            continue
-
-                        for action in actions:
-                            action_text = action.get("text", "").lower()
-
-                            # Look for vote actions
-                            if any(
-                                term in action_text
-                                for term in [
-                                    "passed senate",
-                                    "vote",
-                                    "yea",
-                                    "nay",
-                                    "agreed",
-                                ]
-                            ):
-                                if (
-                                    "roll call" in action_text
-                                    or "recorded vote" in action_text
-                                ):
-                                    vote_record = {
-                                        "congress": congress,
-                                        "chamber": "senate",
-                                        "bill": {
-                                            "type": bill_type.upper(),
-                                            "number": bill_number,
-                                            "title": bill.get("title", ""),
-                                        },
-                                        "action": action.get("text"),
-                                        "date": action.get("actionDate", ""),
-                                        "action_code": action.get("actionCode", ""),
-                                    }
-                                    votes.append(vote_record)
-
-                                    if len(votes) >= max_votes:
-                                        break
+            # Pass 2: fetch actions concurrently; pass 3: scan them in bill order
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    executor.submit(fetch_actions, bill) for bill in senate_bills
+                ]
+                for index, (bill, future) in enumerate(zip(senate_bills, futures)):
+                    votes.extend(
+                        self._extract_senate_votes(congress, bill, future.result())
+                    )
+
+                    if len(votes) >= max_votes:
+                        del votes[max_votes:]
+                        logger.info(f"Reached max_votes limit ({max_votes})")
+                        # Skip action lookups that have not started yet
+                        for pending in futures[index + 1 :]:
+                            pending.cancel()
+                        break
+
+            if len(votes) >= max_votes:
+                break
 
             pagination = data.get("pagination", {})
             if not pagination.get("next"):
                 break
 
-            offset += 100
+            offset += self.MAX_PAGE_SIZE
 
         # Final summary
         logger.info("📊 Senate vote collection completed:")
@@ -721,16 +819,61 @@ class CongressGovAPI(BaseAPI):
 
         return votes
 
-    def _save_data(self, data: List[Dict], filename: str, output_dir: str = "data"):
-        """Save data to JSON file"""
-        import json
-        from pathlib import Path
+    def _extract_senate_votes(
+        self, congress: int, bill: Dict, actions: List[Dict]
+    ) -> List[Dict]:
+        """
+        Build vote records from the recorded-vote actions of a Senate bill
+
+        Args:
+            congress: Congress number
+            bill: Bill record from the bill list endpoint
+            actions: Actions taken on the bill
 
+        Returns:
+            List of vote records
+        """
+        bill_info = {
+            "type": bill["type"].upper(),
+            "number": bill["number"],
+            "title": bill.get("title", ""),
+        }
+        return [
+            {
+                "congress": congress,
+                "chamber": "senate",
+                "bill": dict(bill_info),
+                "action": action.get("text"),
+                "date": action.get("actionDate", ""),
+                "action_code": action.get("actionCode", ""),
+            }
+            for action in actions
+            if _VOTE_ACTION_RE.search(action.get("text", ""))
+            and _ROLL_CALL_RE.search(action.get("text", ""))
+        ]
+
+    def _save_data(
+        self,
+        data: List[Dict],
+        filename: str,
+        output_dir: str = "data",
+        pretty: bool = False,
+    ):
+        """
+        Save data to JSON file
+
+        Args:
+            data: Records to save
+            filename: Output filename
+            output_dir: Output directory
+            pretty: Indent the output; intermediate saves are written compact
+                and only the final save is pretty-printed
+        """
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         filepath = Path(output_dir) / filename
 
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2, default=str)
+        filepath.write_bytes(dumps(data, indent=pretty))
+        self._write_progress(filepath, len(data))
 
         logger.info(f"Saved {len(data)} records to {filepath}")
 
@@ -8,15 +8,35 @@ for both Congress.gov and Senate.gov APIs.
 import logging
 import threading
 import time
-from typing import Optional
+from collections import deque
+from typing import Mapping, Optional
 
 logger = logging.getLogger(__name__)
 
+# X-RateLimit-Reset values above this are epoch timestamps, not delta-seconds
+_EPOCH_THRESHOLD = 1e9
+
+
+def _parse_header_number(value) -> Optional[float]:
+    """Parse a numeric rate-limit header value, returning None if unusable"""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
 
 class RateLimiter:
     """Thread-safe rate limiter to respect API terms of service"""
 
-    def __init__(self, max_requests: int, time_window: int, name: Optional[str] = None):
+    def __init__(
+        self,
+        max_requests: int,
+        time_window: int,
+        name: Optional[str] = None,
+        burst: Optional[int] = None,
+    ):
         """
         Initialize rate limiter
 
@@ -24,46 +44,127 @@ class RateLimiter:
             max_requests: Maximum number of requests allowed
             time_window: Time window in seconds
             name: Optional name for logging purposes
+            burst: Token bucket capacity, i.e. how many requests may be sent
+                back to back (defaults to max_requests)
         """
         self.max_requests = max_requests
         self.time_window = time_window
         self.name = name or "RateLimiter"
-        self.requests = []
+        # Request timestamps in insertion (and therefore time) order
+        self.requests = deque()
         self.lock = threading.Lock()
+        # Set from server rate-limit headers; no request is made before this time
+        self.blocked_until = 0.0
+
+        # Token bucket refilled at the long-run allowed rate
+        self.burst = burst or max_requests
+        self.rate = max_requests / time_window
+        self.tokens = float(self.burst)
+        self.last_refill = time.monotonic()
+
+    def _evict(self, now: float) -> None:
+        """Drop requests that have left the time window (caller holds the lock)"""
+        requests = self.requests
+        while requests and now - requests[0] >= self.time_window:
+            requests.popleft()
+
+    def _refill(self) -> None:
+        """Top up the token bucket for the time elapsed since the last refill"""
+        now = time.monotonic()
+        self.tokens = min(
+            self.burst, self.tokens + (now - self.last_refill) * self.rate
+        )
+        self.last_refill = now
+
+    def schedule(self) -> float:
+        """
+        Reserve the next request slot without blocking
 
-    def wait_if_needed(self) -> None:
-        """Wait if rate limit would be exceeded"""
+        The slot is counted against the window and token bucket as soon as
+        it is reserved, so concurrent callers are handed successive dispatch
+        times and can wait for them without holding the lock.
+
+        Returns:
+            Epoch time at which the reserved request may be sent
+        """
         with self.lock:
             now = time.time()
 
             # Remove old requests outside the time window
-            self.requests = [
-                req_time
-                for req_time in self.requests
-                if now - req_time < self.time_window
-            ]
+            self._evict(now)
+
+            # Honour any pause requested by the server
+            dispatch = max(now, self.blocked_until)
 
+            # Never dispatch ahead of an earlier reservation
+            if self.requests:
+                dispatch = max(dispatch, self.requests[-1])
+
+            # Sliding window: wait for the request max_requests back to leave it
             if len(self.requests) >= self.max_requests:
-                # Calculate wait time based on oldest request
-                oldest_request = min(self.requests)
-                wait_time = self.time_window - (now - oldest_request) + 1
-
-                if wait_time > 0:
-                    logger.info(
-                        f"{self.name}: Rate limit reached, waiting {wait_time:.1f} seconds..."
-                    )
-                    time.sleep(wait_time)
-
-                    # Clean up after waiting
-                    now = time.time()
-                    self.requests = [
-                        req_time
-                        for req_time in self.requests
-                        if now - req_time < self.time_window
-                    ]
+                dispatch = max(
+                    dispatch, self.requests[-self.max_requests] + self.time_window + 1
+                )
+
+            # Token bucket: bursts beyond capacity proceed at the allowed rate.
+            # Tokens may go negative, each missing token being one reservation
+            # still waiting for the bucket to refill.
+            self._refill()
+            self.tokens -= 1
+            if self.tokens < 0:
+                dispatch = max(dispatch, now - self.tokens / self.rate)
 
             # Record this request
-            self.requests.append(now)
+            self.requests.append(dispatch)
+            return dispatch
+
+    def wait_if_needed(self) -> None:
+        """Wait if rate limit would be exceeded"""
+        wait_time = self.schedule() - time.time()
+        if wait_time > 0:
+            logger.info(
+                f"{self.name}: Rate limit reached, waiting {wait_time:.1f} seconds..."
+            )
+            time.sleep(wait_time)
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """
+        Reconcile the limiter with rate-limit headers returned by the server
+
+        A ``Retry-After`` header pauses requests for exactly that long. When
+        ``X-RateLimit-Remaining`` drops below 10% of ``X-RateLimit-Limit`` the
+        remaining quota is spread over the rest of the window so the limit is
+        never actually hit.
+
+        Args:
+            headers: Response headers
+        """
+        retry_after = _parse_header_number(headers.get("Retry-After"))
+        remaining = _parse_header_number(headers.get("X-RateLimit-Remaining"))
+        limit = _parse_header_number(headers.get("X-RateLimit-Limit"))
+
+        pause = 0.0
+        if retry_after is not None:
+            pause = retry_after
+        elif remaining is not None and limit and remaining < limit * 0.1:
+            reset = _parse_header_number(headers.get("X-RateLimit-Reset"))
+            now = time.time()
+            if reset is None:
+                window = self.time_window
+            elif reset > _EPOCH_THRESHOLD:
+                # Reset given as an epoch timestamp, possibly already passed
+                window = max(0.0, reset - now)
+            else:
+                # Reset given as seconds until the window resets
+                window = reset
+            pause = min(window, self.time_window) / max(remaining, 1)
+
+        if pause > 0:
+            with self.lock:
+                self.blocked_until = max(self.blocked_until, time.time() + pause)
+            logger.debug(
+                f"{self.name}: Throttling for {pause:.1f}s based on response headers"
+            )
 
     def get_stats(self) -> dict:
         """
@@ -75,11 +176,7 @@ class RateLimiter:
         with self.lock:
             now = time.time()
             # Clean up old requests
-            self.requests = [
-                req_time
-                for req_time in self.requests
-                if now - req_time < self.time_window
-            ]
+            self._evict(now)
 
             return {
                 "name": self.name,
@@ -87,8 +184,10 @@ class RateLimiter:
                 "time_window": self.time_window,
                 "current_requests": len(self.requests),
                 "requests_remaining": max(0, self.max_requests - len(self.requests)),
+                "tokens": self.tokens,
+                "burst": self.burst,
                 "time_until_reset": (
-                    self.time_window - (now - min(self.requests))
+                    self.time_window - (now - self.requests[0])
                     if self.requests
                     else 0
                 ),
@@ -98,4 +197,7 @@ class RateLimiter:
         """Reset the rate limiter by clearing all recorded requests"""
         with self.lock:
             self.requests.clear()
+            self.blocked_until = 0.0
+            self.tokens = float(self.burst)
+            self.last_refill = time.monotonic()
             logger.info(f"{self.name}: Rate limiter reset")
@@ -5,18 +5,35 @@ Provides comprehensive access to Senate.gov Lobbying Disclosure API
 with unified functionality from all existing implementations.
 """
 
+import hashlib
 import logging
 import os
-import time
-from typing import Dict, List, Optional
+import re
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
 from urllib.parse import urljoin
 
+try:
+    import fcntl
+
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+from ..serialization import dumps
+from ..storage.columnar import records_to_table, save_arrow
 from ..storage.file_storage import save_index, save_individual_record
 from .base import BaseAPI
 from .rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Single-filing endpoints such as /v1/filings/<uuid>/
+_FILING_DETAIL_RE = re.compile(r"^/v1/filings/[^/]+/$")
+
 
 class SenateGovAPI(BaseAPI):
     """
@@ -60,6 +77,29 @@ class SenateGovAPI(BaseAPI):
         "YT",
     }
 
+    # Posted filings never change (amendments are filed separately), so
+    # single-filing lookups are cached longer
+    FILING_CACHE_TTL = 30 * 24 * 3600
+
+    # Threads writing individual record files
+    IO_WORKERS = 8
+
+    # Columns of get_filings_arrow, as (column name, key path in the filing)
+    FILING_COLUMNS = (
+        ("filing_uuid", ("filing_uuid",)),
+        ("filing_type", ("filing_type",)),
+        ("filing_year", ("filing_year",)),
+        ("filing_period", ("filing_period",)),
+        ("dt_posted", ("dt_posted",)),
+        ("income", ("income",)),
+        ("expenses", ("expenses",)),
+        ("registrant_id", ("registrant", "id")),
+        ("registrant_name", ("registrant", "name")),
+        ("client_id", ("client", "id")),
+        ("client_name", ("client", "name")),
+        ("filing_document_url", ("filing_document_url",)),
+    )
+
     @classmethod
     def get_filing_category(cls, filing_type: str) -> str:
         """
@@ -79,13 +119,22 @@ class SenateGovAPI(BaseAPI):
             # Default to the filing type as-is for unknown types
             return filing_type.lower()
 
-    def __init__(self, username: Optional[str] = None, password: Optional[str] = None):
+    def __init__(
+        self,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        max_workers: int = 4,
+        cache_dir: Optional[str] = None,
+    ):
         """
         Initialize Senate.gov API client
 
         Args:
             username: API username (optional, uses .env if not provided)
             password: API password (optional, uses .env if not provided)
+            max_workers: Maximum pages fetched concurrently while paginating
+            cache_dir: Directory for the persistent response cache (disabled
+                if None)
         """
         self.token = os.getenv("SENATE_GOV_TOKEN")
         self.username = username or os.getenv("SENATE_GOV_USERNAME")
@@ -103,7 +152,22 @@ class SenateGovAPI(BaseAPI):
             )
             logger.info("Using anonymous rate limit (15 requests/minute)")
 
-        super().__init__(self.BASE_URL, rate_limiter, name="SenateGovAPI")
+        super().__init__(
+            self.BASE_URL, rate_limiter, name="SenateGovAPI", cache_dir=cache_dir
+        )
+
+        self.max_workers = max_workers
+
+        # Individual record files are written in the background so disk I/O
+        # overlaps with fetching the next page
+        self.io_pool = ThreadPoolExecutor(
+            max_workers=self.IO_WORKERS, thread_name_prefix="SenateGovAPI-io"
+        )
+
+        # The token is set once on the pooled keep-alive session rather than
+        # per request
+        if self.token:
+            self.session.headers["Authorization"] = f"Token {self.token}"
 
         # Authenticate if credentials are available
         if not self.token and self.username and self.password:
@@ -122,9 +186,9 @@ class SenateGovAPI(BaseAPI):
             self.token = data.get("token")
 
             if self.token:
-                # Save token to .env file
-                with open(".env", "a") as f:
-                    f.write(f"\nSENATE_GOV_TOKEN={self.token}\n")
+                self.session.headers["Authorization"] = f"Token {self.token}"
+
+                self._save_token()
                 logger.info("Successfully authenticated with senate.gov")
 
                 # Update rate limiter to authenticated limits
@@ -137,6 +201,56 @@ class SenateGovAPI(BaseAPI):
         except Exception as e:
             logger.error(f"Failed to authenticate: {e}")
 
+    def _save_token(self, env_path: str = ".env") -> None:
+        """
+        Store the token in the .env file, replacing any previous value
+
+        The file is rewritten through a temporary file and os.replace under
+        an exclusive lock, so concurrent pollers cannot interleave writes and
+        repeated runs do not pile up SENATE_GOV_TOKEN lines. The rewritten
+        file keeps the original's permissions, or is owner-only when new.
+
+        Args:
+            env_path: Path of the .env file
+        """
+        env_file = Path(env_path)
+        # The lock lives in the temp dir so nothing is left in the project root
+        digest = hashlib.sha1(str(env_file.resolve()).encode()).hexdigest()[:16]
+        lock_path = Path(tempfile.gettempdir()) / f"senate-token-{digest}.lock"
+        with open(lock_path, "w") as lock:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+
+            lines = env_file.read_text().splitlines() if env_file.exists() else []
+            lines = [
+                line
+                for line in lines
+                if line.split("=", 1)[0].strip() != "SENATE_GOV_TOKEN"
+            ]
+            lines.append(f"SENATE_GOV_TOKEN={self.token}")
+
+            tmp_file = Path(f"{env_path}.tmp")
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                f.write("\n".join(lines) + "\n")
+            if env_file.exists():
+                shutil.copymode(env_file, tmp_file)
+            os.replace(tmp_file, env_file)
+
+    def _cache_ttl(self, endpoint: str) -> Optional[float]:
+        """
+        Keep single-filing lookups for FILING_CACHE_TTL
+
+        Args:
+            endpoint: API endpoint
+
+        Returns:
+            TTL in seconds, or None for the cache default
+        """
+        if _FILING_DETAIL_RE.match(endpoint):
+            return self.FILING_CACHE_TTL
+        return None
+
     def _make_request(
         self,
         endpoint: str,
@@ -156,11 +270,69 @@ class SenateGovAPI(BaseAPI):
         Returns:
             Response data or None if failed
         """
-        headers = {}
-        if self.token:
-            headers["Authorization"] = f"Token {self.token}"
+        return super()._make_request(endpoint, params, None, retries, timeout)
+
+    def _iter_pages(
+        self,
+        endpoint: str,
+        params: Dict,
+        page: int = 1,
+        max_items: Optional[int] = None,
+    ) -> Iterator[List[Dict]]:
+        """
+        Yield the results of a paginated endpoint in page order
 
-        return super()._make_request(endpoint, params, headers, retries, timeout)
+        The first page reveals the total count and page size, after which the
+        remaining pages are requested ``max_workers`` at a time via fetch_many
+        so their latency overlaps while the rate limiter bounds the rate.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters for every page (``page`` is added)
+            page: First page to fetch
+            max_items: Maximum number of records to request (None for all)
+
+        Yields:
+            Lists of records, one per page
+        """
+        logger.info(f"Fetching {endpoint} page {page}...")
+        data = self._make_request(endpoint, {**params, "page": page})
+        results = data.get("results", []) if data else []
+        if not results:
+            return
+        yield results
+
+        if not data.get("next"):
+            return
+
+        # A page with a next link is full, so its length is the page size
+        page_size = len(results)
+        last_page = None
+        if data.get("count") is not None:
+            last_page = -(-data["count"] // page_size)
+        if max_items is not None:
+            wanted = page - 1 + -(-max_items // page_size)
+            last_page = wanted if last_page is None else min(last_page, wanted)
+
+        # Without a known last page, fall back to fetching one page at a time
+        batch_size = self.max_workers if last_page is not None else 1
+        page += 1
+
+        while last_page is None or page <= last_page:
+            stop = page + batch_size
+            if last_page is not None:
+                stop = min(stop, last_page + 1)
+            logger.info(f"Fetching {endpoint} pages {page}-{stop - 1}...")
+
+            batch = [(endpoint, {**params, "page": p}) for p in range(page, stop)]
+            for data in self.fetch_many(batch, max_workers=batch_size):
+                results = data.get("results", []) if data else []
+                if not results:
+                    return
+                yield results
+                if not data.get("next"):
+                    return
+            page = stop
 
     def get_filings(
         self,
@@ -206,47 +378,83 @@ class SenateGovAPI(BaseAPI):
             params["dt_posted__lte"] = end_date
 
         filename = f"senate_{filing_type.lower().replace('-', '')}_filings.json"
+        # Filings beyond those already saved in the output file
         all_filings = []
         page = 1
+        # Filings in the output file from a previous run, loaded only when needed
+        saved_count = 0
+        # Number of records in all_filings already appended to the checkpoint
+        checkpointed = 0
+        # Records at the start of the first page that are already held
+        skip = 0
 
         # Check if we have existing data to skip or resume from
         if incremental:
-            import json
-            from pathlib import Path
-
             filepath = Path(output_dir) / filename
-            if filepath.exists():
-                try:
-                    with open(filepath) as f:
-                        existing_data = json.load(f)
-                    # Check if we need to update (simple check based on count)
-                    if len(existing_data) >= max_results:
-                        logger.info(
-                            f"Existing file has {len(existing_data)} records, skipping download"
-                        )
-                        return existing_data[:max_results]
+            checkpoint_path = filepath.with_suffix(".jsonl")
+            try:
+                saved_count = self._saved_count(filepath)
+                if checkpoint_path.exists():
+                    # An interrupted run left an append-only checkpoint
+                    all_filings = self._read_jsonl(checkpoint_path)
+                    checkpointed = len(all_filings)
+
+                # Check if we need to update (simple check based on count)
+                existing_count = saved_count + len(all_filings)
+                if existing_count >= max_results:
+                    logger.info(
+                        f"Existing data has {existing_count} records, skipping download"
+                    )
+                    existing_data = (
+                        self._load_saved(filepath, saved_count) + all_filings
+                    )
+                    return existing_data[:max_results]
+                if existing_count:
                     # Resume from where we left off
-                    all_filings = existing_data
-                    page = (len(all_filings) // limit) + 1
+                    page = (existing_count // limit) + 1
+                    skip = existing_count % limit
                     logger.info(
-                        f"Resuming from page {page} with {len(all_filings)} existing filings"
+                        f"Resuming from page {page} with {existing_count} existing filings"
                     )
-                except Exception as e:
-                    logger.warning(f"Could not load existing data: {e}")
+            except Exception as e:
+                logger.warning(f"Could not load existing data: {e}")
+                saved_count = 0
+                all_filings = []
+                checkpointed = 0
 
         batch_count = 0
 
-        while len(all_filings) < max_results:
-            params["page"] = page
-            logger.info(f"Fetching {filing_type} filings page {page}...")
-
-            data = self._make_request(endpoint, params)
-            if not data:
-                break
+        # IDs of the filings collected in this run, so pages that overlap
+        # (e.g. when new filings shift the ordering) are not stored twice
+        seen = {self._filing_id(filing) for filing in all_filings}
+        # Pending individual file writes
+        writes = []
 
-            results = data.get("results", [])
-            if not results:
-                break
+        pages = self._iter_pages(
+            endpoint, params, page=page, max_items=max_results - (page - 1) * limit
+        )
+        for results in pages:
+            # Resuming re-reads the partial last page
+            results, skip = results[skip:], 0
+
+            new_results = []
+            for filing in results:
+                filing_id = self._filing_id(filing)
+                if filing_id is not None:
+                    if filing_id in seen:
+                        continue
+                    seen.add(filing_id)
+                new_results.append(filing)
+            results = new_results
+
+            # Drop records past max_results before any work is done on them
+            results = results[: max_results - saved_count - len(all_filings)]
+
+            # List pages carry full filings, so later get_filing_by_id calls
+            # for them are served from memory
+            for filing in results:
+                if filing.get("filing_uuid"):
+                    self._prime_cache(f"/v1/filings/{filing['filing_uuid']}/", filing)
 
             # Save individual files if requested
             if individual_files:
@@ -256,38 +464,55 @@ class SenateGovAPI(BaseAPI):
 
                 for filing in results:
                     filing_id = (
-                        filing.get("filing_uuid")
-                        or filing.get("id")
-                        or f"filing_{len(all_filings)}"
+                        self._filing_id(filing)
+                        or f"filing_{saved_count + len(all_filings)}"
+                    )
+                    writes.append(
+                        self.io_pool.submit(
+                            save_individual_record,
+                            filing,
+                            record_type,
+                            filing_id,
+                            output_dir,
+                        )
                     )
-                    save_individual_record(filing, record_type, filing_id, output_dir)
 
             all_filings.extend(results)
 
-            # Check if there are more pages
-            if not data.get("next"):
-                break
-
             batch_count += 1
 
-            # Save incrementally every 3 batches
+            # Checkpoint incrementally every 3 batches, appending only the
+            # records fetched since the last checkpoint
             if incremental and batch_count % 3 == 0:
-                self._save_data(all_filings, filename, output_dir)
-                logger.info(f"Saved checkpoint: {len(all_filings)} filings")
+                self._append_jsonl(all_filings[checkpointed:], checkpoint_path)
+                checkpointed = len(all_filings)
+                logger.info(
+                    f"Saved checkpoint: {saved_count + len(all_filings)} filings"
+                )
 
             # Check if we've reached the max
-            if len(all_filings) >= max_results:
+            if saved_count + len(all_filings) >= max_results:
                 logger.info(f"Reached maximum results limit: {max_results}")
                 break
 
-            page += 1
-
-            # Be respectful, add small delay between pages
-            time.sleep(0.5)
-
-        # Final save
+        # Wait for the background writes, surfacing any failure
+        self._finish_writes(writes)
+
+        # The saved output is only parsed once, when merging for the final
+        # save; any saved filings seen again on shifted pages are dropped
+        if saved_count:
+            saved = self._load_saved(filepath, saved_count)
+            saved_ids = {self._filing_id(filing) for filing in saved} - {None}
+            all_filings = saved + [
+                filing
+                for filing in all_filings
+                if self._filing_id(filing) not in saved_ids
+            ]
+
+        # Final save replaces the checkpoint
         if incremental:
-            self._save_data(all_filings, filename, output_dir)
+            self._save_data(all_filings, filename, output_dir, pretty=True)
+            checkpoint_path.unlink(missing_ok=True)
 
         # Save index if using individual files
         if individual_files:
@@ -297,6 +522,17 @@ class SenateGovAPI(BaseAPI):
         logger.info(f"Retrieved {len(all_filings)} {filing_type} filings")
         return all_filings[:max_results]
 
+    @staticmethod
+    def _finish_writes(writes: List) -> None:
+        """Wait for background file writes and re-raise the first failure"""
+        for future in writes:
+            future.result()
+
+    @staticmethod
+    def _filing_id(filing: Dict) -> Optional[str]:
+        """Get the identifier of a filing record, if it has one"""
+        return filing.get("filing_uuid") or filing.get("id")
+
     def get_lobbyists(
         self,
         start_date: Optional[str] = None,
@@ -331,45 +567,60 @@ class SenateGovAPI(BaseAPI):
             params["created__lte"] = end_date
 
         filename = "senate_lobbyists.json"
+        # Lobbyists beyond those already saved in the output file
         all_lobbyists = []
         page = 1
+        # Lobbyists in the output file from a previous run, loaded only when needed
+        saved_count = 0
+        # Number of records in all_lobbyists already appended to the checkpoint
+        checkpointed = 0
+        # Records at the start of the first page that are already held
+        skip = 0
 
         # Check if we have existing data
         if incremental:
-            import json
-            from pathlib import Path
-
             filepath = Path(output_dir) / filename
-            if filepath.exists():
-                try:
-                    with open(filepath) as f:
-                        existing_data = json.load(f)
-                    if len(existing_data) >= max_results:
-                        logger.info(
-                            f"Existing file has {len(existing_data)} records, skipping download"
-                        )
-                        return existing_data[:max_results]
-                    all_lobbyists = existing_data
-                    page = (len(all_lobbyists) // limit) + 1
+            checkpoint_path = filepath.with_suffix(".jsonl")
+            try:
+                saved_count = self._saved_count(filepath)
+                if checkpoint_path.exists():
+                    # An interrupted run left an append-only checkpoint
+                    all_lobbyists = self._read_jsonl(checkpoint_path)
+                    checkpointed = len(all_lobbyists)
+
+                existing_count = saved_count + len(all_lobbyists)
+                if existing_count >= max_results:
                     logger.info(
-                        f"Resuming from page {page} with {len(all_lobbyists)} existing lobbyists"
+                        f"Existing data has {existing_count} records, skipping download"
+                    )
+                    existing_data = (
+                        self._load_saved(filepath, saved_count) + all_lobbyists
                     )
-                except Exception as e:
-                    logger.warning(f"Could not load existing data: {e}")
+                    return existing_data[:max_results]
+                if existing_count:
+                    page = (existing_count // limit) + 1
+                    skip = existing_count % limit
+                    logger.info(
+                        f"Resuming from page {page} with {existing_count} existing lobbyists"
+                    )
+            except Exception as e:
+                logger.warning(f"Could not load existing data: {e}")
+                saved_count = 0
+                all_lobbyists = []
+                checkpointed = 0
 
         batch_count = 0
+        # Pending individual file writes
+        writes = []
 
-        while len(all_lobbyists) < max_results:
-            params["page"] = page
-            logger.info(f"Fetching lobbyists page {page}...")
-
-            data = self._make_request(endpoint, params)
-            if not data:
-                break
-
-            results = data.get("results", [])
-            if not results:
-                break
+        pages = self._iter_pages(
+            endpoint, params, page=page, max_items=max_results - (page - 1) * limit
+        )
+        for results in pages:
+            # Resuming re-reads the partial last page
+            results, skip = results[skip:], 0
+            # Drop records past max_results before any work is done on them
+            results = results[: max_results - saved_count - len(all_lobbyists)]
 
             # Save individual files if requested
             if individual_files:
@@ -377,39 +628,51 @@ class SenateGovAPI(BaseAPI):
                     lobbyist_id = (
                         lobbyist.get("lobbyist_id")
                         or lobbyist.get("id")
-                        or f"lobbyist_{len(all_lobbyists)}"
+                        or f"lobbyist_{saved_count + len(all_lobbyists)}"
                     )
                     # Clean the name for use as identifier
                     name = lobbyist.get("name", "").replace(" ", "_").replace(",", "")
                     if name:
                         lobbyist_id = f"{lobbyist_id}_{name}"
 
-                    save_individual_record(
-                        lobbyist, "senate_lobbyists", lobbyist_id, output_dir
+                    writes.append(
+                        self.io_pool.submit(
+                            save_individual_record,
+                            lobbyist,
+                            "senate_lobbyists",
+                            lobbyist_id,
+                            output_dir,
+                        )
                     )
 
             all_lobbyists.extend(results)
 
-            if not data.get("next"):
-                break
-
             batch_count += 1
 
-            # Save incrementally
+            # Checkpoint incrementally every 3 batches, appending only the
+            # records fetched since the last checkpoint
             if incremental and batch_count % 3 == 0:
-                self._save_data(all_lobbyists, filename, output_dir)
-                logger.info(f"Saved checkpoint: {len(all_lobbyists)} lobbyists")
+                self._append_jsonl(all_lobbyists[checkpointed:], checkpoint_path)
+                checkpointed = len(all_lobbyists)
+                logger.info(
+                    f"Saved checkpoint: {saved_count + len(all_lobbyists)} lobbyists"
+                )
 
-            if len(all_lobbyists) >= max_results:
+            if saved_count + len(all_lobbyists) >= max_results:
                 logger.info(f"Reached maximum results limit: {max_results}")
                 break
 
-            page += 1
-            time.sleep(0.5)
+        # Wait for the background writes, surfacing any failure
+        self._finish_writes(writes)
+
+        # The saved output is only parsed once, when merging for the final save
+        if saved_count:
+            all_lobbyists = self._load_saved(filepath, saved_count) + all_lobbyists
 
-        # Final save
+        # Final save replaces the checkpoint
         if incremental:
-            self._save_data(all_lobbyists, filename, output_dir)
+            self._save_data(all_lobbyists, filename, output_dir, pretty=True)
+            checkpoint_path.unlink(missing_ok=True)
 
         # Save index if using individual files
         if individual_files:
@@ -422,6 +685,9 @@ class SenateGovAPI(BaseAPI):
         """
         Get a specific filing by ID
 
+        Filings seen by get_filings in this session, and those fetched
+        before, are served from the response cache.
+
         Args:
             filing_id: Filing ID or UUID
 
@@ -444,6 +710,87 @@ class SenateGovAPI(BaseAPI):
         endpoint = f"/v1/lobbyists/{lobbyist_id}/"
         return self._make_request(endpoint)
 
+    def get_filings_arrow(self, arrow_path: Optional[str] = None, **kwargs):
+        """
+        Get lobbying filings as a columnar Arrow table
+
+        Filings are fetched with get_filings and their FILING_COLUMNS are
+        laid out column by column, which is far smaller than a list of dicts
+        and hands off to pandas/polars without copying. Requires pyarrow.
+
+        Args:
+            arrow_path: Also write the table to this compressed Arrow IPC file
+            **kwargs: Arguments for get_filings
+
+        Returns:
+            pyarrow.Table of filings
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        table = records_to_table(self.get_filings(**kwargs), self.FILING_COLUMNS)
+        if arrow_path:
+            save_arrow(table, arrow_path)
+        return table
+
+    def iter_filings(
+        self,
+        filing_type: str = "RR",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 25,
+        max_results: Optional[int] = None,
+        ordering: str = "-dt_posted",
+    ) -> Iterator[Dict]:
+        """
+        Stream filings one at a time without collecting them
+
+        Each page is parsed incrementally with ijson when it is installed
+        (see BaseAPI._stream_request), so walking a long filing history, e.g.
+        to save individual files, holds one filing at a time rather than
+        whole decoded pages. Pages are fetched sequentially and bypass the
+        response cache; use get_filings to collect filings into a list.
+
+        Args:
+            filing_type: Type of filing (see get_filings)
+            start_date: Start date (YYYY-MM-DD format)
+            end_date: End date (YYYY-MM-DD format)
+            limit: Results per page; a shorter page ends the stream
+            max_results: Maximum total results to yield (None for all)
+            ordering: Sort order ('-dt_posted' for newest first)
+
+        Yields:
+            Filing records
+
+        Raises:
+            requests.exceptions.RequestException: If a page request fails
+            ValueError: If a page is not valid JSON
+        """
+        endpoint = "/v1/filings/"
+        params = {"filing_type": filing_type, "limit": limit, "ordering": ordering}
+
+        if start_date:
+            params["dt_posted__gte"] = start_date
+        if end_date:
+            params["dt_posted__lte"] = end_date
+
+        yielded = 0
+        page = 1
+        while True:
+            page_count = 0
+            for filing in self._stream_request(
+                endpoint, "results.item", {**params, "page": page}
+            ):
+                yield filing
+                page_count += 1
+                yielded += 1
+                if max_results is not None and yielded >= max_results:
+                    return
+
+            if page_count < limit:
+                return
+            page += 1
+
     def search_filings(
         self,
         query: str,
@@ -470,40 +817,37 @@ class SenateGovAPI(BaseAPI):
             params["filing_type"] = filing_type
 
         all_results = []
-        page = 1
-
-        while len(all_results) < max_results:
-            params["page"] = page
-            data = self._make_request(endpoint, params)
-
-            if not data:
-                break
-
-            results = data.get("results", [])
-            if not results:
-                break
-
-            all_results.extend(results)
 
-            if not data.get("next") or len(all_results) >= max_results:
+        for results in self._iter_pages(endpoint, params, max_items=max_results):
+            all_results.extend(results[: max_results - len(all_results)])
+            if len(all_results) >= max_results:
                 break
 
-            page += 1
-            time.sleep(0.5)
-
         logger.info(f"Found {len(all_results)} filings matching '{query}'")
         return all_results[:max_results]
 
-    def _save_data(self, data: List[Dict], filename: str, output_dir: str = "data"):
-        """Save data to JSON file"""
-        import json
-        from pathlib import Path
+    def _save_data(
+        self,
+        data: List[Dict],
+        filename: str,
+        output_dir: str = "data",
+        pretty: bool = False,
+    ):
+        """
+        Save data to JSON file
 
+        Args:
+            data: Records to save
+            filename: Output filename
+            output_dir: Output directory
+            pretty: Indent the output; checkpoints are written compact and
+                only the final save is pretty-printed
+        """
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         filepath = Path(output_dir) / filename
 
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2, default=str)
+        filepath.write_bytes(dumps(data, indent=pretty))
+        self._write_progress(filepath, len(data))
 
         logger.info(f"Saved {len(data)} records to {filepath}")
 
@@ -6,7 +6,7 @@ including bills, members, votes, committees, and lobbying data with proper valid
 relationships, and computed properties.
 """
 
-from .bill import Bill, BillAction, BillSponsor, BillSubject
+from .bill import Bill, BillAction, BillActionsTable, BillSponsor, BillSubject
 from .committee import (
     BillCommitteeAction,
     Committee,
@@ -41,6 +41,7 @@ __all__ = [
     # Bill models
     "Bill",
     "BillAction",
+    "BillActionsTable",
     "BillSponsor",
     "BillSubject",
     # Member models
@@ -5,9 +5,54 @@ Provides common base classes and utilities for data validation
 and type safety across congressional and lobbying data.
 """
 
-from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Optional
+
+
+# Common party name variations mapped to standard codes
+_PARTY_MAP = {
+    "DEMOCRATIC": "D",
+    "DEMOCRAT": "D",
+    "DEM": "D",
+    "REPUBLICAN": "R",
+    "REP": "R",
+    "INDEPENDENT": "I",
+    "IND": "I",
+    "LIBERTARIAN": "L",
+    "GREEN": "G",
+}
+
+# Chamber name variations mapped to standard names
+_CHAMBER_MAP = {
+    "house": "house",
+    "h": "house",
+    "house of representatives": "house",
+    "senate": "senate",
+    "s": "senate",
+}
+
+
+def _utc_now() -> datetime:
+    """Get the current time as a timezone-aware UTC datetime"""
+    return datetime.now(timezone.utc)
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> FrozenSet[str]:
+    """Get the dataclass field names of a record class (computed once per class)"""
+    return frozenset(f.name for f in fields(cls))
+
+
+@lru_cache(maxsize=None)
+def _datetime_fields(cls: type) -> FrozenSet[str]:
+    """Get the fields of a record class typed datetime or Optional[datetime]"""
+    return frozenset(
+        f.name
+        for f in fields(cls)
+        if f.type is datetime or datetime in getattr(f.type, "__args__", ())
+    )
 
 
 @dataclass
@@ -17,32 +62,36 @@ class BaseRecord:
     # Common metadata fields
     record_type: str
     identifier: str
-    created_at: Optional[datetime] = field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = field(default_factory=_utc_now)
     source_url: Optional[str] = None
     api_source: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert record to dictionary"""
-        result = {}
-        for key, value in self.__dict__.items():
+        result = dict(self.__dict__)
+        # Only the datetime-typed fields need converting
+        for key in _datetime_fields(type(self)):
+            value = result.get(key)
             if isinstance(value, datetime):
                 result[key] = value.isoformat()
-            else:
-                result[key] = value
         return result
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BaseRecord":
         """Create record from dictionary"""
         # Handle datetime fields
-        if "created_at" in data and isinstance(data["created_at"], str):
-            try:
-                data["created_at"] = datetime.fromisoformat(data["created_at"])
-            except ValueError:
-                data["created_at"] = None
-
-        # Filter data to only include fields that exist in the dataclass
-        valid_fields = {f.name for f in cls.__dataclass_fields__.values()}
+        for key in _datetime_fields(cls):
+            if isinstance(data.get(key), str):
+                try:
+                    data[key] = datetime.fromisoformat(data[key])
+                except ValueError:
+                    data[key] = None
+
+        # Filter data to only include fields that exist in the dataclass;
+        # records written by to_dict already match and skip the copy
+        valid_fields = _field_names(cls)
+        if data.keys() <= valid_fields:
+            return cls(**data)
         filtered_data = {k: v for k, v in data.items() if k in valid_fields}
 
         return cls(**filtered_data)
@@ -56,13 +105,22 @@ class BaseRecord:
         return f"{self.__class__.__name__}(identifier='{self.identifier}', type='{self.record_type}')"
 
 
-@dataclass
 class DataValidationError(Exception):
     """Exception raised when data validation fails"""
 
-    message: str
-    field: Optional[str] = None
-    value: Any = None
+    def __init__(self, message: str, field: Optional[str] = None, value: Any = None):
+        """
+        Initialize validation error
+
+        Args:
+            message: Description of the failure
+            field: Name of the invalid field, if known
+            value: The rejected value
+        """
+        super().__init__(message)
+        self.message = message
+        self.field = field
+        self.value = value
 
     def __str__(self) -> str:
         if self.field:
@@ -171,21 +229,7 @@ def normalize_party_code(party: Optional[str]) -> Optional[str]:
         return None
 
     party_upper = party.upper().strip()
-
-    # Map common variations
-    party_map = {
-        "DEMOCRATIC": "D",
-        "DEMOCRAT": "D",
-        "DEM": "D",
-        "REPUBLICAN": "R",
-        "REP": "R",
-        "INDEPENDENT": "I",
-        "IND": "I",
-        "LIBERTARIAN": "L",
-        "GREEN": "G",
-    }
-
-    return party_map.get(party_upper, party_upper)
+    return _PARTY_MAP.get(party_upper, party_upper)
 
 
 def normalize_chamber(chamber: Optional[str]) -> Optional[str]:
@@ -202,10 +246,4 @@ def normalize_chamber(chamber: Optional[str]) -> Optional[str]:
         return None
 
     chamber_lower = chamber.lower().strip()
-
-    if chamber_lower in ["house", "h", "house of representatives"]:
-        return "house"
-    elif chamber_lower in ["senate", "s"]:
-        return "senate"
-
-    return chamber_lower
+    return _CHAMBER_MAP.get(chamber_lower, chamber_lower)
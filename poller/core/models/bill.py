@@ -5,12 +5,72 @@ Provides comprehensive Pydantic v2 models for bill data including
 sponsors, actions, subjects, and computed properties for analysis.
 """
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import pickle
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from functools import cached_property
+from itertools import chain
+from pathlib import Path
+from typing import Any, ClassVar, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    computed_field,
+    SerializationInfo,
+    TypeAdapter,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
+
+from ..serialization import dumps
+from .enums import BillType, Chamber, Party
 
-from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
 
-from .enums import BillType, Chamber, Party
+def _json_default(value: Any) -> Any:
+    """Encode dates as ISO strings when falling back to the json module."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+# Lowercase bill type codes used in bill identifiers, e.g. "118_hr_1234"
+_BILL_TYPE_LOWER = {bill_type: bill_type.value.lower() for bill_type in BillType}
+
+# Common spellings of chambers and bill types mapped straight to their enums,
+# so validators only fall back to the enum's normalize() for unusual input.
+# The enums are str subclasses, so their members are found here as well.
+_CHAMBER_LUT = {
+    spelling: chamber
+    for chamber in Chamber
+    for spelling in (chamber.value, chamber.value.capitalize(), chamber.value.upper())
+}
+_BILL_TYPE_LUT = {
+    spelling: bill_type
+    for bill_type in BillType
+    for spelling in (bill_type.value, bill_type.value.lower())
+}
+
+
+def _normalize_chamber(value: Any) -> Optional[Chamber]:
+    """Normalize chamber input, leaving missing values as None."""
+    if not value:
+        return None
+    return _CHAMBER_LUT.get(value) or Chamber.normalize(value)
+
+
+def _normalize_bill_type(value: Any) -> BillType:
+    """Normalize bill type input, rejecting unknown types."""
+    bill_type = _BILL_TYPE_LUT.get(value) if isinstance(value, str) else None
+    if bill_type is None:
+        bill_type = BillType.normalize(value)
+        if bill_type is None:
+            raise ValueError(f"Invalid bill type: {value}")
+    return bill_type
 
 
 class BillSponsor(BaseModel):
@@ -18,7 +78,7 @@ class BillSponsor(BaseModel):
 
     model_config = ConfigDict(
         extra="forbid",
-        validate_assignment=True,
+        validate_assignment=False,
         str_strip_whitespace=True,
         populate_by_name=True,
     )
@@ -57,9 +117,14 @@ class BillSponsor(BaseModel):
     @classmethod
     def normalize_state(cls, v: str) -> str:
         """Normalize state to uppercase."""
-        return v.upper()
+        return sys.intern(v.upper())
+
+    @field_validator("bioguide_id", "url")
+    @classmethod
+    def intern_repeated(cls, v: Optional[str]) -> Optional[str]:
+        """Intern identifiers repeated across the bills a member sponsors."""
+        return sys.intern(v) if v else v
 
-    @computed_field
     @property
     def display_name(self) -> str:
         """Get formatted display name with party and state."""
@@ -75,7 +140,7 @@ class BillSubject(BaseModel):
 
     model_config = ConfigDict(
         extra="forbid",
-        validate_assignment=True,
+        validate_assignment=False,
         str_strip_whitespace=True,
     )
 
@@ -88,8 +153,8 @@ class BillAction(BaseModel):
     """An action taken on a bill during the legislative process."""
 
     model_config = ConfigDict(
-        extra="allow",  # API data varies significantly
-        validate_assignment=True,
+        extra="ignore",
+        validate_assignment=False,
         str_strip_whitespace=True,
     )
 
@@ -101,21 +166,115 @@ class BillAction(BaseModel):
         None, description="Chamber where action occurred"
     )
 
-    @field_validator("chamber", mode="before")
+    normalize_chamber = field_validator("chamber", mode="before")(_normalize_chamber)
+
+
+class BillActionsTable(BaseModel):
+    """
+    Actions on a bill stored column-wise, one list per BillAction field.
+
+    Bills can carry thousands of actions, most of which are only scanned
+    for their dates. Keeping each field in its own list validates plain
+    values instead of one model per action and lets date scans run over a
+    single list; BillAction views are rebuilt on indexing.
+    """
+
+    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
+
+    action_dates: List[Optional[str]] = Field(default_factory=list)
+    texts: List[str] = Field(default_factory=list)
+    action_codes: List[Optional[str]] = Field(default_factory=list)
+    committees: List[Optional[str]] = Field(default_factory=list)
+    chambers: List[Optional[Chamber]] = Field(default_factory=list)
+
+    @classmethod
+    def from_actions(
+        cls,
+        actions: Iterable[Union[BillAction, Dict[str, Any]]],
+        trusted: bool = False,
+    ) -> "BillActionsTable":
+        """
+        Build a table from action models or raw action dictionaries.
+
+        Args:
+            actions: Actions in their original order
+            trusted: Skip validation, only normalizing chambers
+
+        Returns:
+            Actions table
+        """
+        columns: Dict[str, List[Any]] = {name: [] for name in cls.model_fields}
+        for action in actions:
+            if isinstance(action, BillAction):
+                action = action.__dict__
+            columns["action_dates"].append(action.get("action_date"))
+            columns["texts"].append(action.get("text"))
+            columns["action_codes"].append(action.get("action_code"))
+            columns["committees"].append(action.get("committee"))
+            columns["chambers"].append(action.get("chamber"))
+
+        if trusted:
+            columns["chambers"] = cls.normalize_chambers(columns["chambers"])
+            return cls.model_construct(**columns)
+        return cls.model_validate(columns)
+
+    @field_validator("texts")
     @classmethod
-    def normalize_chamber(cls, v: Any) -> Optional[Chamber]:
-        """Normalize chamber input."""
-        return Chamber.normalize(v) if v else None
+    def require_text(cls, v: List[str]) -> List[str]:
+        """Reject actions without a description."""
+        if not all(v):
+            raise ValueError("Every action needs a non-empty text")
+        return v
+
+    @field_validator("chambers", mode="before")
+    @classmethod
+    def normalize_chambers(cls, v: List[Any]) -> List[Optional[Chamber]]:
+        """Normalize chamber inputs."""
+        return [_normalize_chamber(chamber) for chamber in v]
+
+    @model_validator(mode="after")
+    def check_lengths(self) -> "BillActionsTable":
+        """Ensure every column describes the same number of actions."""
+        if len({len(getattr(self, name)) for name in type(self).model_fields}) > 1:
+            raise ValueError("Action columns must all have the same length")
+        return self
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __getitem__(self, index: int) -> BillAction:
+        """Rebuild the action at an index as a BillAction."""
+        return BillAction.model_construct(
+            action_date=self.action_dates[index],
+            text=self.texts[index],
+            action_code=self.action_codes[index],
+            committee=self.committees[index],
+            chamber=self.chambers[index],
+        )
+
+    def __iter__(self) -> Iterator[BillAction]:  # type: ignore[override]
+        return (self[index] for index in range(len(self)))
 
 
 class Bill(BaseModel):
     """Model for Congressional bill data with comprehensive validation."""
 
     model_config = ConfigDict(
-        extra="allow",  # Allow extra fields for API flexibility
-        validate_assignment=True,
+        extra="ignore",  # API responses carry many fields we do not use
+        validate_assignment=False,
         str_strip_whitespace=True,
         populate_by_name=True,
+        ignored_types=(cached_property,),
+    )
+
+    # Cheap properties left out of model_dump unless asked for
+    DERIVED_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "display_name",
+        "full_display_name",
+        "sponsor_count",
+        "cosponsor_count",
+        "total_sponsors",
+        "days_since_introduction",
     )
 
     # Required identification fields
@@ -153,8 +312,10 @@ class Bill(BaseModel):
     policy_area: Optional[str] = Field(None, description="Primary policy area")
 
     # Legislative process
-    actions: List[BillAction] = Field(
-        default_factory=list, description="Legislative actions"
+    action_table: BillActionsTable = Field(
+        default_factory=BillActionsTable,
+        alias="actions",
+        description="Legislative actions",
     )
     committees: List[Dict[str, Any]] = Field(
         default_factory=list, description="Committees involved"
@@ -170,29 +331,57 @@ class Bill(BaseModel):
     url: Optional[str] = Field(None, description="Congress.gov URL")
 
     # Metadata
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow, description="Record creation time"
+    created_at_ns: int = Field(
+        default_factory=time.time_ns,
+        description="Record creation time in nanoseconds since the epoch",
     )
     updated_at: Optional[datetime] = Field(None, description="Last update time")
     fetched_at: Optional[str] = Field(None, description="When data was fetched")
     source_api: str = Field(default="congress.gov", description="Source API")
 
-    @field_validator("bill_type", mode="before")
+    @model_validator(mode="before")
     @classmethod
-    def normalize_bill_type(cls, v: Any) -> BillType:
-        """Normalize bill type input."""
-        if isinstance(v, BillType):
-            return v
-        normalized = BillType.normalize(v)
-        if normalized is None:
-            raise ValueError(f"Invalid bill type: {v}")
-        return normalized
+    def convert_created_at(cls, data: Any) -> Any:
+        """Accept created_at as a datetime or ISO string, as older dumps hold."""
+        if isinstance(data, dict) and "created_at" in data:
+            data = dict(data)
+            created_at = data.pop("created_at")
+            if isinstance(created_at, str):
+                created_at = datetime.fromisoformat(created_at)
+            if created_at.tzinfo is None:
+                # Older records were stamped with naive datetime.utcnow()
+                created_at = created_at.replace(tzinfo=timezone.utc)
+            data.setdefault(
+                "created_at_ns",
+                int(created_at.timestamp()) * 10**9 + created_at.microsecond * 1000,
+            )
+        return data
 
-    @field_validator("origin_chamber", mode="before")
+    normalize_bill_type = field_validator("bill_type", mode="before")(
+        _normalize_bill_type
+    )
+
+    @field_validator("action_table", mode="before")
     @classmethod
-    def normalize_origin_chamber(cls, v: Any) -> Optional[Chamber]:
-        """Normalize origin chamber input."""
-        return Chamber.normalize(v) if v else None
+    def build_action_table(cls, v: Any) -> Any:
+        """Accept actions as a list and store them column-wise."""
+        if isinstance(v, list):
+            return BillActionsTable.from_actions(v)
+        return v
+
+    @field_serializer("action_table")
+    def serialize_action_table(
+        self, table: BillActionsTable, info: SerializationInfo
+    ) -> List[Dict[str, Any]]:
+        """Dump actions as a list of action objects, as stored before."""
+        return [
+            action.model_dump(mode=info.mode, exclude_none=info.exclude_none)
+            for action in table
+        ]
+
+    normalize_origin_chamber = field_validator("origin_chamber", mode="before")(
+        _normalize_chamber
+    )
 
     @field_validator("bill_id", mode="before")
     @classmethod
@@ -201,44 +390,41 @@ class Bill(BaseModel):
         if v:
             return v
 
+        # Fields validate in order, so bill_type is already a BillType here
         congress = info.data.get("congress")
-        bill_type = info.data.get("bill_type") or info.data.get("type")
+        bill_type = info.data.get("bill_type")
         number = info.data.get("number")
 
         if congress and bill_type and number:
-            # Handle both enum and string bill types
-            type_str = (
-                bill_type.value if hasattr(bill_type, "value") else str(bill_type)
-            )
-            return f"{congress}_{type_str.lower()}_{number}"
+            return f"{congress}_{_BILL_TYPE_LOWER[bill_type]}_{number}"
 
         return ""
 
-    @computed_field
+    @property
+    def created_at(self) -> datetime:
+        """Get the record creation time as an aware UTC datetime."""
+        return datetime.fromtimestamp(self.created_at_ns / 1e9, tz=timezone.utc)
+
     @property
     def display_name(self) -> str:
         """Get formatted bill name."""
         return f"{self.bill_type.value} {self.number}"
 
-    @computed_field
     @property
     def full_display_name(self) -> str:
         """Get full bill name with congress."""
         return f"{self.congress}th Congress {self.bill_type.value} {self.number}"
 
-    @computed_field
     @property
     def sponsor_count(self) -> int:
         """Get number of sponsors."""
         return len(self.sponsors)
 
-    @computed_field
     @property
     def cosponsor_count(self) -> int:
         """Get number of cosponsors."""
         return len(self.cosponsors)
 
-    @computed_field
     @property
     def total_sponsors(self) -> int:
         """Get total number of sponsors and cosponsors."""
@@ -254,23 +440,24 @@ class Bill(BaseModel):
 
     def get_sponsors_by_party(self) -> Dict[Party, int]:
         """Get sponsor count by party."""
-        party_counts = {}
-
-        for sponsor in self.sponsors + self.cosponsors:
-            party = sponsor.party
-            party_counts[party] = party_counts.get(party, 0) + 1
-
-        return party_counts
+        return Counter(s.party for s in chain(self.sponsors, self.cosponsors))
 
     def get_sponsors_by_state(self) -> Dict[str, int]:
         """Get sponsor count by state."""
-        state_counts = {}
+        return Counter(s.state for s in chain(self.sponsors, self.cosponsors))
 
-        for sponsor in self.sponsors + self.cosponsors:
-            state = sponsor.state
-            state_counts[state] = state_counts.get(state, 0) + 1
+    @cached_property
+    def _known_party_counts(self) -> Dict[Party, int]:
+        """
+        Sponsor count by known party, computed once per bill.
 
-        return state_counts
+        Shared by is_bipartisan and bipartisan_score so serializing a bill
+        walks its sponsors once. Sponsor lists are treated as fixed after
+        construction; use revalidate() to get fresh counts after editing them.
+        """
+        party_counts = self.get_sponsors_by_party()
+        party_counts.pop(Party.UNKNOWN, None)
+        return party_counts
 
     def get_primary_sponsor(self) -> Optional[BillSponsor]:
         """Get the primary sponsor (first sponsor)."""
@@ -280,75 +467,270 @@ class Bill(BaseModel):
     @property
     def is_bipartisan(self) -> bool:
         """Check if bill has bipartisan support."""
-        party_counts = self.get_sponsors_by_party()
-        # Remove unknown parties for this calculation
-        known_parties = {k: v for k, v in party_counts.items() if k != Party.UNKNOWN}
-        return len(known_parties) > 1
+        return len(self._known_party_counts) > 1
 
     @computed_field
     @property
     def bipartisan_score(self) -> float:
         """Calculate bipartisan score (0-1) based on party distribution."""
-        party_counts = self.get_sponsors_by_party()
-        known_parties = {k: v for k, v in party_counts.items() if k != Party.UNKNOWN}
-
-        if len(known_parties) < 2:
+        known_parties = self._known_party_counts
+        parties = len(known_parties)
+        if parties < 2:
             return 0.0
 
+        # Variance of the party shares around an even split, taken from the
+        # sum of squared counts: sum((c/t - 1/n)^2) = sum(c^2)/t^2 - 1/n
         total_sponsors = sum(known_parties.values())
-        if total_sponsors == 0:
-            return 0.0
-
-        # Calculate entropy-like measure of party distribution
-        party_ratios = [count / total_sponsors for count in known_parties.values()]
-        # Bipartisan score is higher when parties are more evenly distributed
-        variance = sum(
-            (ratio - (1 / len(known_parties))) ** 2 for ratio in party_ratios
-        )
-        max_variance = (len(known_parties) - 1) / len(known_parties) ** 2
-        return 1.0 - (variance / max_variance) if max_variance > 0 else 0.0
+        squares = sum(count * count for count in known_parties.values())
+        variance = squares / total_sponsors**2 - 1 / parties
+        max_variance = (parties - 1) / parties**2
+        # Bipartisan score is higher when parties are more evenly distributed;
+        # clamp away rounding error at the even-split end
+        return min(1.0, 1.0 - variance / max_variance)
 
     def get_committee_names(self) -> List[str]:
         """Extract committee names from committee data."""
-        names = []
-        for committee in self.committees:
-            if isinstance(committee, dict) and "name" in committee:
-                names.append(committee["name"])
-            elif isinstance(committee, str):
-                names.append(committee)
-        return names
+        # Validated committees are plain dicts; bare names can still arrive
+        # through from_trusted_api
+        return [
+            committee["name"] if type(committee) is dict else committee
+            for committee in self.committees
+            if (type(committee) is dict and "name" in committee)
+            or type(committee) is str
+        ]
+
+    @cached_property
+    def _subjects_lower(self) -> Tuple[str, ...]:
+        """Lowercased subjects, computed once per bill for has_subject."""
+        return tuple(s.lower() for s in self.subjects)
 
     def has_subject(self, subject: str) -> bool:
         """Check if bill has a specific subject."""
         subject_lower = subject.lower()
-        return any(subject_lower in s.lower() for s in self.subjects)
+        return any(subject_lower in s for s in self._subjects_lower)
+
+    @property
+    def actions(self) -> List[BillAction]:
+        """Get the legislative actions as BillAction objects."""
+        return list(self.action_table)
 
     def get_latest_action(self) -> Optional[BillAction]:
         """Get the most recent action."""
-        if not self.actions:
+        table = self.action_table
+        if not len(table):
             return None
 
-        # Sort by date if available, otherwise take last
-        dated_actions = [a for a in self.actions if a.action_date]
-        if dated_actions:
-            return max(dated_actions, key=lambda x: x.action_date)
-        return self.actions[-1]
+        # Latest by date if available, otherwise take last. Undated actions
+        # sort below any date and among themselves by position, while equal
+        # dates keep the first occurrence, all in a single pass
+        dates = table.action_dates
+        latest = max(
+            range(len(dates)),
+            key=lambda index: (dates[index], 0) if dates[index] else ("", index),
+        )
+        return table[latest]
+
+    @cached_property
+    def _introduced_dt(self) -> Optional[datetime]:
+        """Introduction date parsed once per bill, or None if missing/invalid."""
+        if not self.introduced_date:
+            return None
+
+        try:
+            return datetime.fromisoformat(self.introduced_date.replace("Z", "+00:00"))
+        except ValueError:
+            return None
 
-    @computed_field
     @property
     def days_since_introduction(self) -> Optional[int]:
         """Calculate days since bill was introduced."""
-        if not self.introduced_date:
+        intro_date = self._introduced_dt
+        if intro_date is None:
             return None
+        # Match the awareness of the parsed date so they can be subtracted
+        return (datetime.now(intro_date.tzinfo) - intro_date).days
 
-        try:
-            intro_date = datetime.fromisoformat(
-                self.introduced_date.replace("Z", "+00:00")
+    @classmethod
+    def validate_many(cls, rows: Iterable[Dict[str, Any]]) -> List["Bill"]:
+        """
+        Validate a batch of bill dictionaries in a single call.
+
+        Args:
+            rows: Bill data keyed by field name or alias
+
+        Returns:
+            Validated bills in input order
+        """
+        return _BILL_LIST_ADAPTER.validate_python(list(rows))
+
+    @classmethod
+    def from_trusted_api(cls, data: Dict[str, Any]) -> "Bill":
+        """
+        Build a bill from trusted API data without running validation.
+
+        Only the enum normalization the validators would apply is done, and
+        sponsors and actions are constructed directly, so bulk loads of data
+        already checked upstream skip the validator pipeline. Use the normal
+        constructor (or revalidate()) for anything untrusted.
+
+        Args:
+            data: Bill data keyed by field name or alias
+
+        Returns:
+            Unvalidated Bill
+        """
+        data = dict(data)
+
+        type_key = "type" if "type" in data else "bill_type"
+        bill_type = data.get(type_key)
+        if bill_type is not None and not isinstance(bill_type, BillType):
+            data[type_key] = bill_type = _normalize_bill_type(bill_type)
+        if data.get("origin_chamber"):
+            data["origin_chamber"] = _normalize_chamber(data["origin_chamber"])
+
+        for key in ("sponsors", "cosponsors"):
+            if key in data:
+                data[key] = [
+                    sponsor
+                    if isinstance(sponsor, BillSponsor)
+                    else BillSponsor.model_construct(
+                        **{
+                            **sponsor,
+                            "party": Party.normalize(sponsor.get("party")),
+                            "state": sys.intern((sponsor.get("state") or "").upper()),
+                        }
+                    )
+                    for sponsor in data[key]
+                ]
+
+        actions_key = "actions" if "actions" in data else "action_table"
+        if isinstance(data.get(actions_key), list):
+            data[actions_key] = BillActionsTable.from_actions(
+                data[actions_key], trusted=True
             )
-            return (datetime.now() - intro_date).days
-        except (ValueError, AttributeError):
+
+        if not data.get("bill_id") and bill_type and data.get("number"):
+            data["bill_id"] = (
+                f"{data.get('congress')}_{_BILL_TYPE_LOWER[bill_type]}_{data['number']}"
+            )
+
+        return cls.model_construct(**data)
+
+    @classmethod
+    def from_cache(cls, bill_id: str, cache_dir: Union[str, Path]) -> Optional["Bill"]:
+        """
+        Load a bill saved by to_cache() without validating it again.
+
+        Entries are unpickled, which can run arbitrary code, so the cache
+        directory must be private to the poller (to_cache creates it 0700)
+        and never shared with or writable by other users.
+
+        Args:
+            bill_id: Bill identifier, e.g. "118_hr_1234"
+            cache_dir: Bill cache directory
+
+        Returns:
+            Cached Bill, or None if it is missing or unreadable
+        """
+        try:
+            bill = pickle.loads(_bill_cache_path(cache_dir, bill_id).read_bytes())
+        except Exception:
+            # Missing, or written by an incompatible version of the model
             return None
+        return bill if isinstance(bill, cls) else None
+
+    def to_cache(self, cache_dir: Union[str, Path]) -> Path:
+        """
+        Pickle the validated bill so later runs can skip validation.
+
+        Entries are sharded into one subdirectory per congress and written
+        atomically, so concurrent pollers never read a partial file. New
+        cache directories are created owner-only, since from_cache()
+        unpickles whatever it finds there.
+
+        Args:
+            cache_dir: Bill cache directory
+
+        Returns:
+            Path of the cache entry
+        """
+        bill_id = (
+            self.bill_id
+            or f"{self.congress}_{_BILL_TYPE_LOWER[self.bill_type]}_{self.number}"
+        )
+        path = _bill_cache_path(cache_dir, bill_id)
+        Path(cache_dir).mkdir(mode=0o700, parents=True, exist_ok=True)
+        path.parent.mkdir(mode=0o700, exist_ok=True)
+
+        tmp_path = path.with_suffix(f".{time.time_ns()}.tmp")
+        tmp_path.write_bytes(pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL))
+        tmp_path.replace(path)
+        return path
+
+    def revalidate(self) -> "Bill":
+        """
+        Re-run validation after fields were mutated in place.
+
+        Assignment is not validated on bill models to keep bulk ingest to a
+        single validation pass, so code that edits a bill can call this to
+        get a validated copy. The bill is dumped first so nested sponsors and
+        actions are validated again too, rather than passed through as
+        already-built instances.
+
+        Returns:
+            A new, validated Bill
+        """
+        # warnings=False: edited fields may hold raw values, e.g. a str type
+        return self.model_validate(
+            self.model_dump(by_alias=True, round_trip=True, warnings=False)
+        )
+
+    def model_dump_json_safe(self, include_derived: bool = False) -> Dict[str, Any]:
+        """
+        Dump model to JSON-safe dictionary.
+
+        Args:
+            include_derived: Also include the DERIVED_FIELDS properties
+
+        Returns:
+            JSON-safe dictionary of the bill
+        """
+        data = self.model_dump(by_alias=True, exclude_none=True, mode="json")
+        if include_derived:
+            self._add_derived(data)
+        return data
+
+    def to_json(self, include_derived: bool = False) -> bytes:
+        """
+        Serialize the bill straight to JSON bytes.
+
+        Dumps in python mode and leaves dates and enums to the JSON encoder
+        (orjson when installed) instead of converting them first, skipping
+        the extra pass that model_dump_json_safe makes before encoding.
+
+        Args:
+            include_derived: Also include the DERIVED_FIELDS properties
+
+        Returns:
+            UTF-8 encoded JSON document
+        """
+        data = self.model_dump(by_alias=True, exclude_none=True)
+        if include_derived:
+            self._add_derived(data)
+        return dumps(data, default=_json_default)
+
+    def _add_derived(self, data: Dict[str, Any]) -> None:
+        """Add the DERIVED_FIELDS properties that have a value to a dump."""
+        for name in self.DERIVED_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                data[name] = value
+
+
+def _bill_cache_path(cache_dir: Union[str, Path], bill_id: str) -> Path:
+    """Get the cache entry for a bill, sharded by congress number."""
+    return Path(cache_dir) / bill_id.split("_", 1)[0] / f"{bill_id}.pickle"
+
 
-    def model_dump_json_safe(self) -> Dict[str, Any]:
-        """Dump model to JSON-safe dictionary."""
-        return self.model_dump(by_alias=True, exclude_none=True, mode="json")
+# Built once so batches are validated by pydantic-core in one pass
+_BILL_LIST_ADAPTER = TypeAdapter(List[Bill])
@@ -5,13 +5,37 @@ Provides comprehensive Pydantic v2 models for committee data including
 membership, activities, and jurisdictional information.
 """
 
+import heapq
+import statistics
+from collections import Counter, defaultdict
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    computed_field,
+    field_validator,
+    model_validator,
+)
 
 from .enums import Chamber, CommitteeRole, CommitteeType, Party
 
+# Legacy boolean field implied by each leadership role
+_ROLE_LEGACY_FLAGS = {
+    CommitteeRole.CHAIR: "is_chair",
+    CommitteeRole.RANKING_MEMBER: "is_ranking_member",
+}
+
+# Prefixes for committee display names; other chambers get none
+_CHAMBER_PREFIX = {
+    Chamber.HOUSE: "House",
+    Chamber.SENATE: "Senate",
+    Chamber.JOINT: "Joint",
+}
+
 
 class CommitteeMember(BaseModel):
     """A member of a congressional committee with enhanced role tracking."""
@@ -71,19 +95,37 @@ class CommitteeMember(BaseModel):
         """Normalize role input."""
         return CommitteeRole.normalize(v)
 
+    @classmethod
+    def from_trusted_api(cls, data: Dict[str, Any]) -> "CommitteeMember":
+        """
+        Build a member from trusted data without running validation.
+
+        Only party and role are normalized; model_construct still runs
+        model_post_init, so the legacy flags are synced as usual.
+
+        Args:
+            data: Member data keyed by field name or alias
+
+        Returns:
+            Unvalidated CommitteeMember
+        """
+        data = dict(data)
+        data["party"] = Party.normalize(data.get("party"))
+        if "role" in data:
+            data["role"] = CommitteeRole.normalize(data["role"])
+        return cls.model_construct(**data)
+
     def model_post_init(self, __context: Any) -> None:
         """Sync legacy boolean fields with role enum after initialization."""
-        # Update role based on legacy fields if they are set
+        # A set legacy flag decides the role; otherwise the role sets its flag
         if self.is_chair:
             object.__setattr__(self, "role", CommitteeRole.CHAIR)
         elif self.is_ranking_member:
             object.__setattr__(self, "role", CommitteeRole.RANKING_MEMBER)
-
-        # Update legacy fields based on role
-        if self.role == CommitteeRole.CHAIR:
-            object.__setattr__(self, "is_chair", True)
-        elif self.role == CommitteeRole.RANKING_MEMBER:
-            object.__setattr__(self, "is_ranking_member", True)
+        else:
+            flag = _ROLE_LEGACY_FLAGS.get(self.role)
+            if flag:
+                object.__setattr__(self, flag, True)
 
     @computed_field
     @property
@@ -141,17 +183,39 @@ class CommitteeActivity(BaseModel):
         default_factory=list, description="Related documents"
     )
 
+    # activity_type lowercased once for the type checks below
+    _type_lower: str = PrivateAttr(default="")
+
+    @model_validator(mode="after")
+    def _lower_type(self) -> "CommitteeActivity":
+        """Cache the lowercased activity_type; also reruns when it is reassigned."""
+        self._type_lower = self.activity_type.lower()
+        return self
+
+    @classmethod
+    def from_trusted_api(cls, data: Dict[str, Any]) -> "CommitteeActivity":
+        """
+        Build an activity from trusted data without running validation.
+
+        Args:
+            data: Activity data keyed by field name
+
+        Returns:
+            Unvalidated CommitteeActivity
+        """
+        return cls.model_construct(**data)._lower_type()
+
     @computed_field
     @property
     def is_hearing(self) -> bool:
         """Check if this is a hearing."""
-        return "hearing" in self.activity_type.lower()
+        return "hearing" in self._type_lower
 
     @computed_field
     @property
     def is_markup(self) -> bool:
         """Check if this is a markup session."""
-        return "markup" in self.activity_type.lower()
+        return "markup" in self._type_lower
 
 
 class CommitteeMeeting(BaseModel):
@@ -216,23 +280,45 @@ class CommitteeMeeting(BaseModel):
     )
     updated_at: Optional[datetime] = Field(None, description="Last update time")
 
+    # meeting_type lowercased once for the type checks below
+    _type_lower: str = PrivateAttr(default="")
+
+    @model_validator(mode="after")
+    def _lower_type(self) -> "CommitteeMeeting":
+        """Cache the lowercased meeting_type; also reruns when it is reassigned."""
+        self._type_lower = self.meeting_type.lower()
+        return self
+
+    @classmethod
+    def from_trusted_api(cls, data: Dict[str, Any]) -> "CommitteeMeeting":
+        """
+        Build a meeting from trusted data without running validation.
+
+        Args:
+            data: Meeting data keyed by field name
+
+        Returns:
+            Unvalidated CommitteeMeeting
+        """
+        return cls.model_construct(**data)._lower_type()
+
     @computed_field
     @property
     def is_hearing(self) -> bool:
         """Check if this is a hearing."""
-        return "hearing" in self.meeting_type.lower()
+        return "hearing" in self._type_lower
 
     @computed_field
     @property
     def is_markup(self) -> bool:
         """Check if this is a markup session."""
-        return "markup" in self.meeting_type.lower()
+        return "markup" in self._type_lower
 
     @computed_field
     @property
     def is_business_meeting(self) -> bool:
         """Check if this is a business meeting."""
-        return "business" in self.meeting_type.lower()
+        return "business" in self._type_lower
 
     @computed_field
     @property
@@ -327,19 +413,19 @@ class BillCommitteeAction(BaseModel):
     @property
     def is_referred(self) -> bool:
         """Check if this is a referral action."""
-        return "referral" in self.action_type.lower()
+        return "referral" in self._type_lower
 
     @computed_field
     @property
     def is_markup_action(self) -> bool:
         """Check if this is a markup action."""
-        return "markup" in self.action_type.lower()
+        return "markup" in self._type_lower
 
     @computed_field
     @property
     def is_discharge_action(self) -> bool:
         """Check if this is a discharge action."""
-        return "discharge" in self.action_type.lower()
+        return "discharge" in self._type_lower
 
     @computed_field
     @property
@@ -364,6 +450,28 @@ class BillCommitteeAction(BaseModel):
         """Check if action involves a subcommittee."""
         return self.subcommittee_code is not None
 
+    # action_type lowercased once for the type checks below
+    _type_lower: str = PrivateAttr(default="")
+
+    @model_validator(mode="after")
+    def _lower_type(self) -> "BillCommitteeAction":
+        """Cache the lowercased action_type; also reruns when it is reassigned."""
+        self._type_lower = self.action_type.lower()
+        return self
+
+    @classmethod
+    def from_trusted_api(cls, data: Dict[str, Any]) -> "BillCommitteeAction":
+        """
+        Build a committee action from trusted data without running validation.
+
+        Args:
+            data: Action data keyed by field name
+
+        Returns:
+            Unvalidated BillCommitteeAction
+        """
+        return cls.model_construct(**data)._lower_type()
+
     def get_action_summary(self) -> str:
         """Get a human-readable summary of the action."""
         if self.is_referred:
@@ -470,19 +578,48 @@ class Committee(BaseModel):
         """Normalize committee type input."""
         return CommitteeType.normalize(v)
 
+    @classmethod
+    def from_trusted_api(cls, data: Dict[str, Any]) -> "Committee":
+        """
+        Build a committee from trusted data without running validation.
+
+        For data validated before, such as database reloads, this skips the
+        validator pipeline for the committee and everything nested in it.
+        Only the enum normalization the validators would apply is done. Use
+        the normal constructor for anything untrusted.
+
+        Args:
+            data: Committee data keyed by field name or alias
+
+        Returns:
+            Unvalidated Committee
+        """
+        data = dict(data)
+        if "chamber" in data:
+            data["chamber"] = Chamber.normalize(data["chamber"])
+        if "committee_type" in data:
+            data["committee_type"] = CommitteeType.normalize(data["committee_type"])
+
+        for key, model in (
+            ("members", CommitteeMember),
+            ("activities", CommitteeActivity),
+            ("meetings", CommitteeMeeting),
+            ("bill_actions", BillCommitteeAction),
+        ):
+            if key in data:
+                data[key] = [
+                    model.from_trusted_api(item) if isinstance(item, dict) else item
+                    for item in data[key]
+                ]
+
+        return cls.model_construct(**data)
+
     @computed_field
     @property
     def display_name(self) -> str:
         """Get formatted committee name."""
-        chamber_prefix = {
-            Chamber.HOUSE: "House",
-            Chamber.SENATE: "Senate",
-            Chamber.JOINT: "Joint",
-        }.get(self.chamber, "")
-
-        return f"{chamber_prefix} {self.name}".strip()
+        return f"{_CHAMBER_PREFIX.get(self.chamber, '')} {self.name}".strip()
 
-    @computed_field
     @property
     def member_count(self) -> int:
         """Get total number of committee members."""
@@ -505,66 +642,55 @@ class Committee(BaseModel):
 
     def get_members_by_party(self) -> Dict[Party, List[CommitteeMember]]:
         """Get committee members grouped by party."""
-        party_members = {}
+        party_members: Dict[Party, List[CommitteeMember]] = defaultdict(list)
         for member in self.members:
-            if member.party not in party_members:
-                party_members[member.party] = []
             party_members[member.party].append(member)
-        return party_members
+        # Plain dict so lookups of absent parties don't insert empty lists
+        return dict(party_members)
 
     def get_party_breakdown(self) -> Dict[Party, int]:
         """Get count of members by party."""
-        party_counts = {}
-        for member in self.members:
-            party_counts[member.party] = party_counts.get(member.party, 0) + 1
-        return party_counts
+        return Counter(member.party for member in self.members)
 
     def get_chair(self) -> Optional[CommitteeMember]:
         """Get the committee chair."""
-        chairs = [member for member in self.members if member.is_chair]
-        return chairs[0] if chairs else None
+        return next((member for member in self.members if member.is_chair), None)
 
     def get_ranking_member(self) -> Optional[CommitteeMember]:
         """Get the ranking minority member."""
-        ranking_members = [
-            member for member in self.members if member.is_ranking_member
-        ]
-        return ranking_members[0] if ranking_members else None
+        return next(
+            (member for member in self.members if member.is_ranking_member), None
+        )
 
     def get_leadership(self) -> List[CommitteeMember]:
         """Get all leadership members (chair and ranking member)."""
         return [member for member in self.members if member.is_leadership]
 
+    @staticmethod
+    def _rank_parties(party_breakdown: Dict[Party, int]) -> List[Party]:
+        """Order known parties from most to fewest members, ties by first seen."""
+        known_parties = [
+            (party, count)
+            for party, count in party_breakdown.items()
+            if party != Party.UNKNOWN
+        ]
+        # sort() is stable even when reversed, so ties keep breakdown order
+        known_parties.sort(key=lambda item: item[1], reverse=True)
+        return [party for party, _ in known_parties]
+
     @computed_field
     @property
     def majority_party(self) -> Optional[Party]:
         """Get the majority party on the committee."""
-        party_breakdown = self.get_party_breakdown()
-        if not party_breakdown:
-            return None
-
-        # Remove unknown parties
-        known_parties = {k: v for k, v in party_breakdown.items() if k != Party.UNKNOWN}
-        if not known_parties:
-            return None
-
-        return max(known_parties, key=known_parties.get)
+        ranked_parties = self._rank_parties(self.get_party_breakdown())
+        return ranked_parties[0] if ranked_parties else None
 
     @computed_field
     @property
     def minority_party(self) -> Optional[Party]:
         """Get the minority party on the committee."""
-        party_breakdown = self.get_party_breakdown()
-        if len(party_breakdown) < 2:
-            return None
-
-        # Remove unknown parties
-        known_parties = {k: v for k, v in party_breakdown.items() if k != Party.UNKNOWN}
-        if len(known_parties) < 2:
-            return None
-
-        sorted_parties = sorted(known_parties.items(), key=lambda x: x[1], reverse=True)
-        return sorted_parties[1][0]  # Second largest party
+        ranked_parties = self._rank_parties(self.get_party_breakdown())
+        return ranked_parties[1] if len(ranked_parties) > 1 else None  # Second largest
 
     def get_activities_by_type(self, activity_type: str) -> List[CommitteeActivity]:
         """Get activities of a specific type."""
@@ -572,7 +698,7 @@ class Committee(BaseModel):
         return [
             activity
             for activity in self.activities
-            if activity_type_lower in activity.activity_type.lower()
+            if activity_type_lower in activity._type_lower
         ]
 
     def get_hearings(self) -> List[CommitteeActivity]:
@@ -583,7 +709,6 @@ class Committee(BaseModel):
         """Get all markup sessions conducted by the committee."""
         return [activity for activity in self.activities if activity.is_markup]
 
-    @computed_field
     @property
     def activity_count(self) -> int:
         """Get total number of activities."""
@@ -593,15 +718,13 @@ class Committee(BaseModel):
     @property
     def hearing_count(self) -> int:
         """Get total number of hearings."""
-        return len(self.get_hearings())
+        return sum(1 for activity in self.activities if activity.is_hearing)
 
-    @computed_field
     @property
     def bills_considered_count(self) -> int:
         """Get number of bills considered."""
         return len(self.bills_considered)
 
-    @computed_field
     @property
     def bills_reported_count(self) -> int:
         """Get number of bills reported."""
@@ -611,20 +734,26 @@ class Committee(BaseModel):
     @property
     def productivity_score(self) -> float:
         """Calculate committee productivity score based on activities and bills."""
+        return self._productivity_score(
+            self.activity_count, self.bills_considered_count, self.bills_reported_count
+        )
+
+    @staticmethod
+    def _productivity_score(
+        activity_count: int, bills_considered_count: int, bills_reported_count: int
+    ) -> float:
+        """Calculate the legacy productivity score from its counts."""
         # Simple scoring: activities + bills considered + (2 * bills reported)
-        score = (
-            self.activity_count
-            + self.bills_considered_count
-            + (2 * self.bills_reported_count)
+        return float(
+            activity_count + bills_considered_count + (2 * bills_reported_count)
         )
-        return float(score)
 
     def get_member_by_bioguide(self, bioguide_id: str) -> Optional[CommitteeMember]:
         """Get a specific member by bioguide ID."""
-        for member in self.members:
-            if member.bioguide_id == bioguide_id:
-                return member
-        return None
+        return next(
+            (member for member in self.members if member.bioguide_id == bioguide_id),
+            None,
+        )
 
     def has_member(self, bioguide_id: str) -> bool:
         """Check if a member serves on this committee."""
@@ -642,7 +771,11 @@ class Committee(BaseModel):
     @property
     def partisan_balance(self) -> float:
         """Calculate partisan balance (0.5 = perfectly balanced, closer to 0 or 1 = imbalanced)."""
-        party_breakdown = self.get_party_breakdown()
+        return self._partisan_balance(self.get_party_breakdown())
+
+    @staticmethod
+    def _partisan_balance(party_breakdown: Dict[Party, int]) -> float:
+        """Calculate partisan balance from a party breakdown."""
         major_parties = [Party.DEMOCRATIC, Party.REPUBLICAN]
 
         major_party_counts = [party_breakdown.get(party, 0) for party in major_parties]
@@ -675,21 +808,24 @@ class Committee(BaseModel):
 
     def get_member_tenure_stats(self) -> Dict[str, float]:
         """Get statistics about member tenure on committee."""
-        tenures = [m.tenure_years for m in self.members if m.tenure_years is not None]
+        return self._tenure_stats(
+            [m.tenure_years for m in self.members if m.tenure_years is not None]
+        )
+
+    @staticmethod
+    def _tenure_stats(tenures: List[float]) -> Dict[str, float]:
+        """Summarize a list of tenures, sorting it in place."""
         if not tenures:
             return {"min": 0.0, "max": 0.0, "avg": 0.0, "median": 0.0}
 
+        # Sorted once: the extremes are the ends, and median() re-sorting an
+        # already ordered list is a single linear pass
         tenures.sort()
-        n = len(tenures)
         return {
-            "min": min(tenures),
-            "max": max(tenures),
-            "avg": sum(tenures) / n,
-            "median": (
-                tenures[n // 2]
-                if n % 2 == 1
-                else (tenures[n // 2 - 1] + tenures[n // 2]) / 2
-            ),
+            "min": tenures[0],
+            "max": tenures[-1],
+            "avg": sum(tenures) / len(tenures),
+            "median": statistics.median(tenures),
         }
 
     def get_meetings_by_type(self, meeting_type: str) -> List[CommitteeMeeting]:
@@ -698,18 +834,17 @@ class Committee(BaseModel):
         return [
             meeting
             for meeting in self.meetings
-            if meeting_type_lower in meeting.meeting_type.lower()
+            if meeting_type_lower in meeting._type_lower
         ]
 
     def get_recent_meetings(self, limit: int = 10) -> List[CommitteeMeeting]:
         """Get most recent meetings."""
-        # Sort by date if available, otherwise by creation time
-        sorted_meetings = sorted(
-            self.meetings,
-            key=lambda m: m.date or m.created_at.isoformat(),
-            reverse=True,
+        # Newest by date if available, otherwise by creation time (which is
+        # only formatted for undated meetings); nlargest keeps just `limit`
+        # candidates instead of sorting every meeting
+        return heapq.nlargest(
+            limit, self.meetings, key=lambda m: m.date or m.created_at.isoformat()
         )
-        return sorted_meetings[:limit]
 
     def get_bill_actions_by_type(self, action_type: str) -> List[BillCommitteeAction]:
         """Get bill actions of a specific type."""
@@ -717,7 +852,7 @@ class Committee(BaseModel):
         return [
             action
             for action in self.bill_actions
-            if action_type_lower in action.action_type.lower()
+            if action_type_lower in action._type_lower
         ]
 
     def get_referred_bills(self) -> List[BillCommitteeAction]:
@@ -732,25 +867,21 @@ class Committee(BaseModel):
         """Get bills currently in markup."""
         return [action for action in self.bill_actions if action.is_markup_action]
 
-    @computed_field
     @property
     def meetings_count(self) -> int:
         """Get total number of meetings."""
         return len(self.meetings)
 
-    @computed_field
     @property
     def hearings_count_detailed(self) -> int:
         """Get number of hearings from detailed meetings."""
-        return len([m for m in self.meetings if m.is_hearing])
+        return sum(1 for m in self.meetings if m.is_hearing)
 
-    @computed_field
     @property
     def markups_count_detailed(self) -> int:
         """Get number of markups from detailed meetings."""
-        return len([m for m in self.meetings if m.is_markup])
+        return sum(1 for m in self.meetings if m.is_markup)
 
-    @computed_field
     @property
     def bill_actions_count(self) -> int:
         """Get total number of bill actions."""
@@ -760,77 +891,140 @@ class Committee(BaseModel):
     @property
     def referred_bills_count(self) -> int:
         """Get number of bills referred to committee."""
-        return len(self.get_referred_bills())
+        return sum(1 for action in self.bill_actions if action.is_referred)
 
     @computed_field
     @property
     def reported_bills_count(self) -> int:
         """Get number of bills reported by committee."""
-        return len(self.get_reported_bills())
+        return sum(1 for action in self.bill_actions if action.is_reported)
 
     @computed_field
     @property
     def bills_in_markup_count(self) -> int:
         """Get number of bills currently in markup."""
-        return len(self.get_bills_in_markup())
+        return sum(1 for action in self.bill_actions if action.is_markup_action)
 
     @computed_field
     @property
     def enhanced_productivity_score(self) -> float:
         """Calculate enhanced productivity score including new tracking."""
+        return self._enhanced_productivity_score(
+            self.meetings_count,
+            self.bill_actions_count,
+            self.reported_bills_count,
+            self.activity_count,
+        )
+
+    @staticmethod
+    def _enhanced_productivity_score(
+        meetings_count: int,
+        bill_actions_count: int,
+        reported_count: int,
+        activity_count: int,
+    ) -> float:
+        """Calculate the enhanced productivity score from its counts."""
         # Enhanced scoring: meetings + bill actions + (2 * reported bills) + activities
-        score = (
-            self.meetings_count
-            + self.bill_actions_count
-            + (2 * self.reported_bills_count)
-            + self.activity_count  # Legacy activities
+        return float(
+            meetings_count
+            + bill_actions_count
+            + (2 * reported_count)
+            + activity_count  # Legacy activities
         )
-        return float(score)
 
     @computed_field
     @property
     def committee_efficiency(self) -> float:
         """Calculate efficiency as reported bills / referred bills ratio."""
-        referred_count = self.referred_bills_count
+        return self._efficiency(self.referred_bills_count, self.reported_bills_count)
+
+    @staticmethod
+    def _efficiency(referred_count: int, reported_count: int) -> float:
+        """Calculate the reported / referred ratio from its counts."""
         if referred_count == 0:
             return 0.0
-        return self.reported_bills_count / referred_count
+        return reported_count / referred_count
 
     @computed_field
     @property
     def average_member_tenure(self) -> float:
         """Calculate average member tenure on committee."""
-        tenure_stats = self.get_member_tenure_stats()
+        return self._average_tenure(self.get_member_tenure_stats())
+
+    @staticmethod
+    def _average_tenure(tenure_stats: Dict[str, float]) -> float:
+        """Get the average tenure from get_member_tenure_stats() output."""
         return tenure_stats.get("avg", 0.0)
 
     def get_committee_analytics(self) -> Dict[str, Any]:
         """Get comprehensive committee analytics."""
+        # One pass over each collection accumulates every statistic, rather
+        # than a separate scan per count property
+        active_count = 0
+        party_breakdown: Dict[Party, int] = {}
+        tenures = []
+        for member in self.members:
+            if member.is_active:
+                active_count += 1
+            party_breakdown[member.party] = party_breakdown.get(member.party, 0) + 1
+            if member.tenure_years is not None:
+                tenures.append(member.tenure_years)
+
+        hearings_count = markups_count = 0
+        for meeting in self.meetings:
+            if meeting.is_hearing:
+                hearings_count += 1
+            if meeting.is_markup:
+                markups_count += 1
+
+        referred_count = reported_count = in_markup_count = 0
+        for action in self.bill_actions:
+            if action.is_referred:
+                referred_count += 1
+            if action.is_reported:
+                reported_count += 1
+            if action.is_markup_action:
+                in_markup_count += 1
+
+        ranked_parties = self._rank_parties(party_breakdown)
+        tenure_stats = self._tenure_stats(tenures)
+
+        member_count = len(self.members)
+        meetings_count = len(self.meetings)
+        activity_count = len(self.activities)
+        bill_actions_count = len(self.bill_actions)
         return {
             "membership": {
-                "total_members": self.member_count,
-                "active_members": len(self.get_active_members()),
-                "party_breakdown": self.get_party_breakdown(),
-                "majority_party": self.majority_party,
-                "minority_party": self.minority_party,
-                "partisan_balance": self.partisan_balance,
-                "average_tenure": self.average_member_tenure,
-                "tenure_stats": self.get_member_tenure_stats(),
+                "total_members": member_count,
+                "active_members": active_count,
+                "party_breakdown": party_breakdown,
+                "majority_party": ranked_parties[0] if ranked_parties else None,
+                "minority_party": (
+                    ranked_parties[1] if len(ranked_parties) > 1 else None
+                ),
+                "partisan_balance": self._partisan_balance(party_breakdown),
+                "average_tenure": self._average_tenure(tenure_stats),
+                "tenure_stats": tenure_stats,
             },
             "activity": {
-                "total_meetings": self.meetings_count,
-                "hearings": self.hearings_count_detailed,
-                "markups": self.markups_count_detailed,
-                "legacy_activities": self.activity_count,
+                "total_meetings": meetings_count,
+                "hearings": hearings_count,
+                "markups": markups_count,
+                "legacy_activities": activity_count,
             },
             "legislation": {
-                "bills_referred": self.referred_bills_count,
-                "bills_reported": self.reported_bills_count,
-                "bills_in_markup": self.bills_in_markup_count,
-                "total_bill_actions": self.bill_actions_count,
-                "efficiency_ratio": self.committee_efficiency,
+                "bills_referred": referred_count,
+                "bills_reported": reported_count,
+                "bills_in_markup": in_markup_count,
+                "total_bill_actions": bill_actions_count,
+                "efficiency_ratio": self._efficiency(referred_count, reported_count),
             },
             "productivity": {
-                "legacy_score": self.productivity_score,
-                "enhanced_score": self.enhanced_productivity_score,
+                "legacy_score": self._productivity_score(
+                    activity_count, len(self.bills_considered), len(self.bills_reported)
+                ),
+                "enhanced_score": self._enhanced_productivity_score(
+                    meetings_count, bill_actions_count, reported_count, activity_count
+                ),
             },
         }
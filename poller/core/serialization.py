@@ -0,0 +1,60 @@
+"""
+JSON serialization helpers for the core package.
+
+Uses orjson when it is installed (a much faster C parser/serializer) and
+falls back to the standard library json module otherwise, so callers get
+the same behaviour either way.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+# orjson is an optional dependency
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    Parse a JSON document
+
+    Args:
+        data: Raw JSON bytes or text
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(
+    obj: Any, indent: bool = False, default: Optional[Callable[[Any], Any]] = str
+) -> bytes:
+    """
+    Serialize an object to JSON
+
+    Args:
+        obj: Object to serialize
+        indent: Indent nested structures by two spaces
+        default: Called for objects that are not natively serializable
+
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=default).encode()
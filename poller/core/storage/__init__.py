@@ -30,6 +30,7 @@ Usage:
     db.save_records(records, "bills")
 """
 
+from .columnar import load_arrow, records_to_table, save_arrow
 from .compressed import (
     CompressedStorage,
     load_compressed_record,
@@ -55,6 +56,10 @@ __all__ = [
     "CompressedStorage",
     "save_compressed_record",
     "load_compressed_record",
+    # Columnar storage
+    "records_to_table",
+    "save_arrow",
+    "load_arrow",
     # Database storage
     "DatabaseStorage",
     "DatabaseConnection",
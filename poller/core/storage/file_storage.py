@@ -14,6 +14,7 @@ Features:
 - Data validation and integrity checks
 """
 
+import gzip
 import json
 import logging
 import threading
@@ -25,7 +26,11 @@ logger = logging.getLogger(__name__)
 
 
 def save_individual_record(
-    record: Dict, record_type: str, identifier: str, base_dir: str = "data"
+    record: Dict,
+    record_type: str,
+    identifier: str,
+    base_dir: str = "data",
+    compressed: bool = False,
 ) -> str:
     """
     Save an individual record as a JSON file
@@ -35,6 +40,7 @@ def save_individual_record(
         record_type: Type of record (e.g., 'bills', 'votes', 'filings')
         identifier: Unique identifier for the record
         base_dir: Base directory for data storage
+        compressed: Write compact gzip-compressed JSON to a .json.gz file
 
     Returns:
         Path to the saved file
@@ -49,7 +55,7 @@ def save_individual_record(
     safe_id = safe_id.replace("<", "_").replace(">", "_").replace("|", "_")
     safe_id = safe_id.replace('"', "_").replace("'", "_")
 
-    filename = f"{safe_id}.json"
+    filename = f"{safe_id}.json.gz" if compressed else f"{safe_id}.json"
     filepath = dir_path / filename
 
     # Add metadata to record
@@ -64,8 +70,12 @@ def save_individual_record(
     }
 
     # Save the record
-    with open(filepath, "w") as f:
-        json.dump(enriched_record, f, indent=2, default=str)
+    if compressed:
+        with gzip.open(filepath, "wt") as f:
+            json.dump(enriched_record, f, default=str)
+    else:
+        with open(filepath, "w") as f:
+            json.dump(enriched_record, f, indent=2, default=str)
 
     logger.debug(f"Saved {record_type} record to {filepath}")
     return str(filepath)
@@ -151,13 +161,16 @@ def load_individual_record(
     safe_id = safe_id.replace('"', "_").replace("'", "_")
 
     filepath = Path(base_dir) / record_type / f"{safe_id}.json"
-
-    if not filepath.exists():
-        return None
+    gz_filepath = filepath.with_suffix(".json.gz")
 
     try:
-        with open(filepath) as f:
-            return json.load(f)
+        if filepath.exists():
+            with open(filepath) as f:
+                return json.load(f)
+        if gz_filepath.exists():
+            with gzip.open(gz_filepath, "rt") as f:
+                return json.load(f)
+        return None
     except Exception as e:
         logger.error(f"Error loading record {identifier}: {e}")
         return None
@@ -44,6 +44,15 @@ def main():
     parser.add_argument(
         "--max-workers", type=int, default=10, help="Number of parallel workers"
     )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help=(
+            "Persist API responses in this directory and reuse them across runs "
+            "(e.g. data/.http_cache). Responses may be up to an hour old, or 30 "
+            "days for past Congresses and single Senate filings. Off by default"
+        ),
+    )
 
     args = parser.parse_args()
 
@@ -65,8 +74,12 @@ def main():
         args.senate_lobbyists = True
 
     # Initialize APIs
-    congress_api = CongressGovAPI(max_workers=args.max_workers)
-    senate_api = SenateGovAPI()  # Note: SenateGovAPI doesn't support max_workers
+    congress_api = CongressGovAPI(
+        max_workers=args.max_workers, cache_dir=args.cache_dir or None
+    )
+    senate_api = SenateGovAPI(
+        max_workers=args.max_workers, cache_dir=args.cache_dir or None
+    )
 
     total_fetched = 0
 
@@ -242,6 +242,7 @@ class TestConsolidationValidation(unittest.TestCase):
             # Mock successful response
             mock_response = Mock()
             mock_response.status_code = 200
+            mock_response.content = b'{"test": "data"}'
             mock_response.json.return_value = {"test": "data"}
             mock_response.raise_for_status.return_value = None
 
@@ -14,20 +14,29 @@ import threading
 import time
 import unittest
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 # Add core package to path for testing
 sys.path.insert(0, str(Path(__file__).parent))
 
 try:
+    from core.api.cache import ResponseCache
+    from core.api.circuit_breaker import CircuitBreaker
+    from core.api.concurrency import AIMDController
     from core.api.congress import CongressGovAPI
     from core.api.rate_limiter import RateLimiter
     from core.api.senate import SenateGovAPI
-    from core.models.base import BaseRecord
+    from core.models.base import (
+        BaseRecord,
+        DataValidationError,
+        normalize_chamber,
+        normalize_party_code,
+    )
     from core.models.congress import Bill, Member, Vote
     from core.models.senate import LobbingFiling
     from core.storage.file_storage import (
         FileStorage,
+        load_individual_record,
         save_index,
         save_individual_record,
     )
@@ -121,6 +130,75 @@ class TestRateLimiter(unittest.TestCase):
         self.assertEqual(stats["current_requests"], 0)
         self.assertEqual(stats["requests_remaining"], 2)
 
+    def test_rate_limiter_burst_capacity(self):
+        """Test that requests beyond the burst are paced at the allowed rate"""
+        limiter = RateLimiter(max_requests=60, time_window=60, burst=2)
+
+        limiter.wait_if_needed()
+        limiter.wait_if_needed()
+
+        with patch("time.sleep") as mock_sleep:
+            limiter.wait_if_needed()
+            mock_sleep.assert_called_once()
+            # One token per second at 60 requests/minute
+            self.assertLessEqual(mock_sleep.call_args[0][0], 1.0)
+
+    def test_rate_limiter_schedule_spaces_reservations(self):
+        """Test reservations beyond the burst are handed successive slots"""
+        limiter = RateLimiter(max_requests=60, time_window=60, burst=1)
+
+        start = time.time()
+        slots = [limiter.schedule() for _ in range(3)]
+
+        self.assertLess(slots[0] - start, 0.1)
+        self.assertAlmostEqual(slots[1] - start, 1.0, delta=0.1)
+        self.assertAlmostEqual(slots[2] - start, 2.0, delta=0.1)
+
+    def test_rate_limiter_spends_full_burst_without_waiting(self):
+        """Test a full bucket dispatches its whole burst immediately"""
+        limiter = RateLimiter(max_requests=120, time_window=60)
+
+        start = time.time()
+        slots = [limiter.schedule() for _ in range(120)]
+
+        self.assertLess(max(slots) - start, 0.1)
+        self.assertGreater(limiter.schedule() - start, 0.1)
+
+    def test_rate_limiter_observe_headers(self):
+        """Test that server rate-limit headers delay the next request"""
+        limiter = RateLimiter(max_requests=100, time_window=60)
+
+        limiter.observe({"Retry-After": "5"})
+        with patch("time.sleep") as mock_sleep:
+            limiter.wait_if_needed()
+            mock_sleep.assert_called_once()
+            self.assertGreater(mock_sleep.call_args[0][0], 4)
+
+        # Plenty of quota left - no throttling
+        limiter.reset()
+        limiter.observe({"X-RateLimit-Limit": "1000", "X-RateLimit-Remaining": "900"})
+        self.assertEqual(limiter.blocked_until, 0.0)
+
+        # Nearly exhausted - spread the remaining quota over the window
+        limiter.observe({"X-RateLimit-Limit": "1000", "X-RateLimit-Remaining": "10"})
+        self.assertGreater(limiter.blocked_until, time.time())
+
+    def test_rate_limiter_observe_reset_header(self):
+        """Test both reset header forms, including an epoch already passed"""
+        limiter = RateLimiter(max_requests=100, time_window=60)
+        headers = {"X-RateLimit-Limit": "1000", "X-RateLimit-Remaining": "1"}
+
+        limiter.observe({**headers, "X-RateLimit-Reset": str(time.time() - 5)})
+        self.assertEqual(limiter.blocked_until, 0.0)
+
+        limiter.observe({**headers, "X-RateLimit-Reset": str(time.time() + 30)})
+        self.assertAlmostEqual(limiter.blocked_until - time.time(), 30, delta=1)
+
+        # Delta-seconds beyond the window are clamped to it
+        limiter.reset()
+        limiter.observe({**headers, "X-RateLimit-Reset": "3600"})
+        self.assertAlmostEqual(limiter.blocked_until - time.time(), 60, delta=1)
+
     def test_rate_limiter_thread_safety(self):
         """Test that rate limiter is thread-safe"""
         limiter = RateLimiter(max_requests=10, time_window=60)
@@ -151,6 +229,189 @@ class TestRateLimiter(unittest.TestCase):
             self.assertIn("success", result)
 
 
+class TestAIMDController(unittest.TestCase):
+    """Test the adaptive concurrency controller"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        if not CORE_AVAILABLE:
+            self.skipTest("Core package not available")
+
+    def test_additive_increase_multiplicative_decrease(self):
+        """Test limit grows on fast successes and halves on failures"""
+        controller = AIMDController(c_min=1, c_max=8, alpha=1, initial=2)
+
+        for _ in range(10):
+            controller.observe(200, 0.01)
+        self.assertEqual(controller.get_stats()["limit"], 8)
+
+        controller.observe(429, 0.01)
+        self.assertEqual(controller.get_stats()["limit"], 4)
+
+        for _ in range(5):
+            controller.record_failure()
+        self.assertEqual(controller.get_stats()["limit"], 1)
+
+    def test_slow_responses_do_not_increase_limit(self):
+        """Test limit stays put when latency is above target"""
+        controller = AIMDController(initial=2, latency_target_ms=100)
+
+        controller.observe(200, 1.0)
+        self.assertEqual(controller.get_stats()["limit"], 2)
+
+    def test_limit_starts_at_max_and_recovers_at_page_latencies(self):
+        """Test a backoff recovers while full pages take over a second each"""
+        controller = AIMDController(c_max=8)
+        self.assertEqual(controller.get_stats()["limit"], 8)
+
+        controller.observe(503, 1.5)
+        self.assertEqual(controller.get_stats()["limit"], 4)
+
+        for _ in range(8):
+            controller.observe(200, 1.5)
+        self.assertEqual(controller.get_stats()["limit"], 8)
+
+    def test_slot_tracks_in_flight(self):
+        """Test slots are released after use"""
+        controller = AIMDController(initial=2)
+
+        with controller.slot():
+            self.assertEqual(controller.get_stats()["in_flight"], 1)
+        self.assertEqual(controller.get_stats()["in_flight"], 0)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test the API circuit breaker"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        if not CORE_AVAILABLE:
+            self.skipTest("Core package not available")
+
+    def test_opens_after_consecutive_failures(self):
+        """Test circuit opens after the failure threshold"""
+        breaker = CircuitBreaker(failure_threshold=3, cooldown=60)
+
+        for _ in range(3):
+            self.assertTrue(breaker.allow_request())
+            breaker.record_failure()
+
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(breaker.allow_request())
+
+    def test_half_open_probe_closes_on_success(self):
+        """Test a single probe is allowed after cooldown and closes on success"""
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=0)
+        breaker.record_failure()
+
+        self.assertTrue(breaker.allow_request())
+        self.assertFalse(breaker.allow_request())
+
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.assertTrue(breaker.allow_request())
+
+    def test_api_short_circuits_while_open(self):
+        """Test requests are skipped without hitting the network when open"""
+        with patch("requests.Session.get") as mock_get:
+            api = CongressGovAPI(api_key="test_key")
+            api.circuit_breaker = CircuitBreaker(failure_threshold=1, cooldown=60)
+            api.circuit_breaker.record_failure()
+
+            self.assertIsNone(api._make_request("/test/endpoint"))
+            mock_get.assert_not_called()
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test the two-tier response cache"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        if not CORE_AVAILABLE:
+            self.skipTest("Core package not available")
+
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        import shutil
+
+        if hasattr(self, "temp_dir") and os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_key_ignores_param_order(self):
+        """Test cache keys are stable regardless of param order"""
+        key_a = ResponseCache.make_key("https://x/y", {"a": 1, "b": 2})
+        key_b = ResponseCache.make_key("https://x/y", {"b": 2, "a": 1})
+        self.assertEqual(key_a, key_b)
+
+    def test_lru_eviction_and_ttl(self):
+        """Test entries are evicted when full and expire after the TTL"""
+        cache = ResponseCache(maxsize=2, ttl=60)
+        cache.set("a", {"v": 1})
+        cache.set("b", {"v": 2})
+        cache.set("c", {"v": 3})
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("c"), {"v": 3})
+
+        expired = ResponseCache(ttl=0)
+        expired.set("a", {"v": 1})
+        self.assertIsNone(expired.get("a"))
+
+    def test_disk_tier_survives_new_instance(self):
+        """Test cached responses persist across cache instances"""
+        ResponseCache(cache_dir=self.temp_dir).set("key", {"v": 1})
+        self.assertEqual(ResponseCache(cache_dir=self.temp_dir).get("key"), {"v": 1})
+
+    def test_api_serves_repeat_requests_from_cache(self):
+        """Test identical GETs only hit the network once"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"test": "data"}'
+        mock_response.json.return_value = {"test": "data"}
+        mock_response.raise_for_status.return_value = None
+
+        with patch("requests.Session.get", return_value=mock_response) as mock_get:
+            api = CongressGovAPI(api_key="test_key")
+            api._make_request("/test/endpoint", {"limit": 1})
+            result = api._make_request("/test/endpoint", {"limit": 1})
+
+        self.assertEqual(result, {"test": "data"})
+        self.assertEqual(mock_get.call_count, 1)
+
+    def test_api_shares_parsed_response_across_param_order(self):
+        """Test reordered params reuse the cached, already-parsed response"""
+        mock_response = Mock(status_code=200, content=b'{"bills": []}')
+        mock_response.headers = {}
+
+        with patch("requests.Session.get", return_value=mock_response) as mock_get:
+            api = CongressGovAPI(api_key="test_key")
+            first = api._make_request("/bill/118", {"limit": 250, "offset": 0})
+            second = api._make_request("/bill/118", {"offset": 0, "limit": 250})
+
+        self.assertIs(first, second)
+        self.assertEqual(mock_get.call_count, 1)
+
+    def test_api_revalidates_expired_entries_with_etag(self):
+        """Test expired entries are revalidated and a 304 reuses cached data"""
+        fresh = Mock(status_code=200, content=b'{"test": "data"}')
+        fresh.headers = {"ETag": '"abc"'}
+        not_modified = Mock(status_code=304, content=b"")
+        not_modified.headers = {}
+
+        with patch(
+            "requests.Session.get", side_effect=[fresh, not_modified]
+        ) as mock_get:
+            api = CongressGovAPI(api_key="test_key")
+            api.cache.ttl = 0
+            api._make_request("/test/endpoint")
+            result = api._make_request("/test/endpoint")
+
+        self.assertEqual(result, {"test": "data"})
+        sent_headers = mock_get.call_args_list[1].kwargs["headers"]
+        self.assertEqual(sent_headers["If-None-Match"], '"abc"')
+
+
 class TestFileStorage(unittest.TestCase):
     """Test the FileStorage utilities"""
 
@@ -200,6 +461,16 @@ class TestFileStorage(unittest.TestCase):
         for key, value in test_data.items():
             self.assertEqual(saved_data[key], value)
 
+    def test_save_compressed_individual_record(self):
+        """Test compressed records are written as .json.gz and load back"""
+        result = save_individual_record(
+            {"id": "test_123"}, "test_records", "test_123", self.temp_dir, True
+        )
+
+        self.assertTrue(result.endswith("test_123.json.gz"))
+        loaded = load_individual_record("test_records", "test_123", self.temp_dir)
+        self.assertEqual(loaded["id"], "test_123")
+
     def test_save_index(self):
         """Test saving index files"""
         test_records = [
@@ -273,6 +544,7 @@ class TestCongressGovAPI(unittest.TestCase):
         # Mock successful response
         mock_response = Mock()
         mock_response.status_code = 200
+        mock_response.content = b'{"test": "data"}'
         mock_response.json.return_value = {"test": "data"}
         mock_response.raise_for_status.return_value = None
 
@@ -282,6 +554,18 @@ class TestCongressGovAPI(unittest.TestCase):
 
             self.assertEqual(result, {"test": "data"})
 
+    def test_congress_api_does_not_mutate_params(self):
+        """Test the JSON format parameter comes from the session defaults"""
+        mock_response = Mock(status_code=200, content=b'{"test": "data"}')
+        params = {"limit": 1}
+
+        with patch("requests.Session.get", return_value=mock_response):
+            api = CongressGovAPI(api_key="test_key")
+            api._make_request("/test/endpoint", params)
+
+        self.assertEqual(params, {"limit": 1})
+        self.assertEqual(api.session.params, {"format": "json"})
+
     def test_congress_api_error_handling(self):
         """Test API error handling"""
         # Mock failed response
@@ -295,6 +579,196 @@ class TestCongressGovAPI(unittest.TestCase):
 
             self.assertIsNone(result)
 
+    def test_congress_api_fetch_many(self):
+        """Test concurrent requests return results in input order"""
+        api = CongressGovAPI(api_key="test_key")
+
+        def fake_request(endpoint, params=None):
+            return {"endpoint": endpoint}
+
+        with patch.object(api, "_make_request", side_effect=fake_request):
+            results = api.fetch_many([("/a", None), ("/b", None), ("/c", None)])
+
+        self.assertEqual([r["endpoint"] for r in results], ["/a", "/b", "/c"])
+
+    def test_congress_api_shares_rate_limiter(self):
+        """Test clients using one API key can share a single rate limiter"""
+        api = CongressGovAPI(api_key="test_key")
+        other = CongressGovAPI(api_key="test_key", rate_limiter=api.rate_limiter)
+
+        self.assertIs(other.rate_limiter, api.rate_limiter)
+        self.assertEqual(other.rate_limiter.max_requests, 900)
+
+    def test_congress_api_http2_drops_connection_headers(self):
+        """Test HTTP/1.1 connection headers are not forwarded over HTTP/2"""
+        api = CongressGovAPI(api_key="test_key")
+        response = Mock(status_code=200, headers={}, content=b'{"ok": true}')
+        api.http2_client = Mock()
+        api.http2_client.get.return_value = response
+
+        self.assertEqual(api._make_request("/bill/118"), {"ok": True})
+
+        headers = api.http2_client.get.call_args[1]["headers"]
+        sent = {name.lower(): value for name, value in headers.items()}
+        self.assertNotIn("connection", sent)
+        self.assertEqual(sent["x-api-key"], "test_key")
+
+    def test_congress_api_senate_votes_stop_at_max_votes(self):
+        """Test Senate vote collection stops once max_votes is reached"""
+        api = CongressGovAPI(api_key="test_key")
+        bills = [
+            {"originChamberCode": "S", "type": "S", "number": str(n)}
+            for n in range(20)
+        ]
+        action = {"text": "Passed Senate by Yea-Nay Vote. Roll Call Vote No. 1"}
+
+        with patch.object(
+            api, "_make_request", return_value={"bills": bills, "pagination": {}}
+        ), patch.object(api, "get_bill_actions", return_value=[action]):
+            votes = api._get_senate_votes_from_bills(118, 3, "unused")
+
+        self.assertEqual([vote["bill"]["number"] for vote in votes], ["0", "1", "2"])
+
+    def test_congress_api_paginates_concurrently_in_order(self):
+        """Test pages after the first are fetched ahead and yielded in order"""
+        api = CongressGovAPI(api_key="test_key")
+
+        def fake_request(endpoint, params=None):
+            offset = params["offset"]
+            return {
+                "bills": [{"n": n} for n in range(offset, offset + params["limit"])],
+                "pagination": {"count": 10, "next": "more"},
+            }
+
+        with patch.object(api, "_make_request", side_effect=fake_request):
+            bills = api.get_bills(limit=3, max_results=8, incremental=False)
+
+        self.assertEqual([bill["n"] for bill in bills], list(range(8)))
+
+    def test_congress_api_resumes_bills_from_jsonl_checkpoint(self):
+        """Test get_bills resumes after the records in an interrupted checkpoint"""
+        import shutil
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        checkpoint = Path(temp_dir) / "congress_118_bills.jsonl"
+        checkpoint.write_text('{"n": 0}\n{"n": 1}\n{"n": ')
+
+        api = CongressGovAPI(api_key="test_key")
+
+        def fake_request(endpoint, params=None):
+            offset = params["offset"]
+            return {
+                "bills": [{"n": n} for n in range(offset, offset + params["limit"])],
+                "pagination": {"count": 10, "next": "more"},
+            }
+
+        with patch.object(api, "_make_request", side_effect=fake_request):
+            bills = api.get_bills(congress=118, max_results=4, output_dir=temp_dir)
+
+        self.assertEqual([bill["n"] for bill in bills], [0, 1, 2, 3])
+        self.assertFalse(checkpoint.exists())
+        self.assertTrue((Path(temp_dir) / "congress_118_bills.json").exists())
+
+    def test_congress_api_resumes_bills_from_progress_sidecar(self):
+        """Test get_bills resumes at the saved count and merges at the end"""
+        import shutil
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        api = CongressGovAPI(api_key="test_key")
+        api._save_data([{"n": 0}, {"n": 1}], "congress_118_bills.json", temp_dir)
+
+        def fake_request(endpoint, params=None):
+            offset = params["offset"]
+            return {
+                "bills": [{"n": n} for n in range(offset, offset + params["limit"])],
+                "pagination": {"count": 10, "next": "more"},
+            }
+
+        with patch.object(api, "_make_request", side_effect=fake_request) as mock:
+            bills = api.get_bills(congress=118, max_results=4, output_dir=temp_dir)
+
+        self.assertEqual(mock.call_args_list[0].args[1]["offset"], 2)
+        self.assertEqual([bill["n"] for bill in bills], [0, 1, 2, 3])
+
+    def test_congress_api_caches_past_congresses_longer(self):
+        """Test endpoints for adjourned Congresses get the historical TTL"""
+        api = CongressGovAPI(api_key="test_key")
+
+        self.assertEqual(
+            api._cache_ttl("/bill/110/s/1/actions"), api.HISTORICAL_CACHE_TTL
+        )
+        self.assertIsNone(api._cache_ttl("/member"))
+
+    def test_congress_api_memoizes_bill_lookups(self):
+        """Test repeated bill lookups within a run only hit the network once"""
+        mock_response = Mock(status_code=200, content=b'{"actions": [{"text": "x"}]}')
+
+        with patch("requests.Session.get", return_value=mock_response) as mock_get:
+            api = CongressGovAPI(api_key="test_key")
+            api.get_bill_actions(118, "S", "42")
+            actions = api.get_bill_actions(118, "s", "42")
+
+        self.assertEqual(actions, [{"text": "x"}])
+        self.assertEqual(mock_get.call_count, 1)
+
+    def test_congress_api_vote_details_party_breakdown(self):
+        """Test member vote positions are tallied per party"""
+        api = CongressGovAPI(api_key="test_key")
+        positions = [("D", "Yea"), ("R", "Nay"), ("D", "Not Voting"), ("R", "Aye")]
+
+        def fake_request(endpoint, params=None):
+            if endpoint.endswith("/members"):
+                return {
+                    "members": [
+                        {"party": party, "votePosition": position}
+                        for party, position in positions
+                    ]
+                }
+            return {"rollCall": {"question": "On Passage"}}
+
+        with patch.object(api, "_make_request", side_effect=fake_request), patch(
+            "core.api.congress.save_individual_record"
+        ):
+            vote = api.get_vote_details(118, "house", 1, 42, refresh=True)
+
+        self.assertEqual(
+            vote["party_breakdown"],
+            {
+                "D": {"yea": 1, "nay": 0, "present": 0, "not_voting": 1},
+                "R": {"yea": 1, "nay": 1, "present": 0, "not_voting": 0},
+            },
+        )
+
+    def test_congress_api_vote_details_reuses_saved_vote(self):
+        """Test saved roll calls are returned without network requests"""
+        import shutil
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        save_individual_record(
+            {"rollCall": 42}, "house_votes_detailed/118", "118_1_42", temp_dir
+        )
+        api = CongressGovAPI(api_key="test_key")
+
+        with patch.object(api, "_make_request") as mock_request:
+            vote = api.get_vote_details(118, "house", 1, 42, base_dir=temp_dir)
+
+        self.assertEqual(vote["rollCall"], 42)
+        mock_request.assert_not_called()
+
+    def test_validate_response_required_fields(self):
+        """Test response validation against a required-fields set"""
+        api = CongressGovAPI(api_key="test_key")
+        required = frozenset({"results", "pagination"})
+
+        self.assertTrue(
+            api._validate_response({"results": [], "pagination": {}}, required)
+        )
+        self.assertFalse(api._validate_response({"results": []}, required))
+        self.assertFalse(api._validate_response([], required))
+
 
 class TestSenateGovAPI(unittest.TestCase):
     """Test the SenateGovAPI class"""
@@ -321,6 +795,308 @@ class TestSenateGovAPI(unittest.TestCase):
         self.assertEqual(api.username, "user")
         self.assertEqual(api.password, "pass")
 
+    @patch.dict(os.environ, {"SENATE_GOV_TOKEN": "abc"})
+    def test_senate_api_sets_token_on_session(self):
+        """Test the auth token is sent from the shared session"""
+        api = SenateGovAPI()
+
+        self.assertEqual(api.session.headers["Authorization"], "Token abc")
+
+    def test_senate_api_replaces_saved_token(self):
+        """Test re-authenticating replaces the .env token instead of appending"""
+        import shutil
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        env_path = os.path.join(temp_dir, ".env")
+        with open(env_path, "w") as f:
+            f.write("DATA_GOV_API_KEY=key\nSENATE_GOV_TOKEN=old\n")
+        api = SenateGovAPI()
+
+        for token in ("first", "second"):
+            api.token = token
+            api._save_token(env_path)
+
+        with open(env_path) as f:
+            self.assertEqual(f.read(), "DATA_GOV_API_KEY=key\nSENATE_GOV_TOKEN=second\n")
+
+    def test_senate_api_saved_token_file_permissions(self):
+        """Test the token file stays private and no lock file is left beside it"""
+        import shutil
+        import stat
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        env_path = os.path.join(temp_dir, ".env")
+        with open(env_path, "w") as f:
+            f.write("DATA_GOV_API_KEY=key\n")
+        os.chmod(env_path, 0o600)
+        api = SenateGovAPI()
+        api.token = "secret"
+
+        api._save_token(env_path)
+        api._save_token(os.path.join(temp_dir, "new.env"))
+
+        for name in (".env", "new.env"):
+            mode = stat.S_IMODE(os.stat(os.path.join(temp_dir, name)).st_mode)
+            self.assertEqual(mode, 0o600)
+        self.assertEqual(sorted(os.listdir(temp_dir)), [".env", "new.env"])
+
+    def test_senate_api_caches_single_filings_longer(self):
+        """Test single-filing lookups get the long filing TTL"""
+        api = SenateGovAPI()
+
+        self.assertEqual(api._cache_ttl("/v1/filings/abc-123/"), api.FILING_CACHE_TTL)
+        self.assertIsNone(api._cache_ttl("/v1/filings/"))
+
+    def test_senate_api_reuses_saved_filings(self):
+        """Test saved filings satisfying max_results are loaded, not fetched"""
+        import shutil
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        api = SenateGovAPI()
+        api._save_data([{"id": 0}, {"id": 1}], "senate_rr_filings.json", temp_dir)
+
+        with patch.object(api, "_make_request") as mock:
+            filings = api.get_filings(max_results=2, output_dir=temp_dir)
+
+        self.assertEqual(filings, [{"id": 0}, {"id": 1}])
+        mock.assert_not_called()
+
+    def test_senate_api_resumes_filings_from_jsonl_checkpoint(self):
+        """Test get_filings resumes after the records in an interrupted checkpoint"""
+        import shutil
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        checkpoint = Path(temp_dir) / "senate_rr_filings.jsonl"
+        checkpoint.write_text('{"id": 0}\n{"id": 1}\n{"id": 2}\n{"id": ')
+
+        api = SenateGovAPI()
+        page_two = {"count": 6, "next": None, "results": [{"id": n} for n in (3, 4, 5)]}
+
+        with patch.object(api, "_make_request", return_value=page_two) as mock:
+            filings = api.get_filings(limit=3, max_results=6, output_dir=temp_dir)
+
+        self.assertEqual(mock.call_args.args[1]["page"], 2)
+        self.assertEqual([filing["id"] for filing in filings], list(range(6)))
+        self.assertFalse(checkpoint.exists())
+
+    def test_senate_api_skips_filings_already_collected(self):
+        """Test re-read filings from a partial saved page are not duplicated"""
+        import shutil
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        api = SenateGovAPI()
+        saved = [{"filing_uuid": f"f{n}"} for n in range(4)]
+        api._save_data(saved, "senate_rr_filings.json", temp_dir)
+
+        def fake_request(endpoint, params=None):
+            start = (params["page"] - 1) * 3
+            return {
+                "count": 9,
+                "next": "more",
+                "results": [{"filing_uuid": f"f{n}"} for n in range(start, start + 3)],
+            }
+
+        with patch.object(api, "_make_request", side_effect=fake_request):
+            filings = api.get_filings(limit=3, max_results=7, output_dir=temp_dir)
+
+        self.assertEqual(
+            [filing["filing_uuid"] for filing in filings],
+            [f"f{n}" for n in range(7)],
+        )
+
+    def test_senate_api_serves_listed_filings_by_id_from_cache(self):
+        """Test filings seen on a list page need no request when looked up"""
+        api = SenateGovAPI()
+        page = {"count": 1, "next": None, "results": [{"filing_uuid": "abc"}]}
+        mock_response = Mock(status_code=200, content=json.dumps(page).encode())
+        mock_response.headers = {}
+
+        with patch("requests.Session.get", return_value=mock_response) as mock_get:
+            api.get_filings(incremental=False)
+            filing = api.get_filing_by_id("abc")
+
+        self.assertEqual(filing, {"filing_uuid": "abc"})
+        self.assertEqual(mock_get.call_count, 1)
+
+    def test_senate_api_resumes_lobbyists_after_saved_records(self):
+        """Test a resume skips the saved records re-read from a partial page"""
+        import shutil
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        api = SenateGovAPI()
+        saved = [{"id": n} for n in range(4)]
+        api._save_data(saved, "senate_lobbyists.json", temp_dir)
+        page_two = {"count": 6, "next": None, "results": [{"id": n} for n in (3, 4, 5)]}
+
+        with patch.object(api, "_make_request", return_value=page_two) as mock:
+            lobbyists = api.get_lobbyists(limit=3, max_results=6, output_dir=temp_dir)
+
+        self.assertEqual(mock.call_args.args[1]["page"], 2)
+        self.assertEqual([lobbyist["id"] for lobbyist in lobbyists], list(range(6)))
+        progress = Path(temp_dir) / "senate_lobbyists.progress.json"
+        self.assertEqual(json.loads(progress.read_text())["count"], 6)
+
+    def test_senate_api_streams_filings_across_pages(self):
+        """Test iter_filings yields filings page by page until a short page"""
+        api = SenateGovAPI()
+
+        def fake_get(url, params=None, **kwargs):
+            start = (params["page"] - 1) * 2
+            ids = [n for n in range(start, start + 2) if n < 3]
+            response = MagicMock()
+            response.__enter__.return_value = response
+            response.headers = {"Content-Length": "100"}
+            response.content = json.dumps(
+                {"results": [{"id": n} for n in ids]}
+            ).encode()
+            return response
+
+        with patch("requests.Session.get", side_effect=fake_get) as mock_get:
+            filings = list(api.iter_filings(limit=2))
+
+        self.assertEqual([filing["id"] for filing in filings], [0, 1, 2])
+        self.assertEqual(mock_get.call_count, 2)
+
+    def test_senate_api_stream_failure_is_not_end_of_data(self):
+        """Test a failed or malformed page raises instead of ending the stream"""
+        import requests
+
+        api = SenateGovAPI()
+
+        def fake_get(url, params=None, **kwargs):
+            if params["page"] == 2:
+                raise requests.exceptions.ConnectionError("connection reset")
+            response = MagicMock()
+            response.__enter__.return_value = response
+            response.headers = {"Content-Length": "100"}
+            response.content = b'{"results": [{"id": 0}, {"id": 1}]}'
+            return response
+
+        with patch("requests.Session.get", side_effect=fake_get):
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                list(api.iter_filings(limit=2))
+
+        truncated = MagicMock()
+        truncated.__enter__.return_value = truncated
+        truncated.headers = {"Content-Length": "100"}
+        truncated.content = b'{"results": [{"id": 0}'
+        with patch("requests.Session.get", return_value=truncated):
+            with self.assertRaises(ValueError):
+                list(api.iter_filings(limit=2))
+
+    def test_senate_api_writes_individual_filings(self):
+        """Test individual filing files are all written before returning"""
+        import shutil
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        api = SenateGovAPI()
+        page = {
+            "count": 3,
+            "next": None,
+            "results": [{"filing_uuid": f"f{n}"} for n in range(3)],
+        }
+
+        with patch.object(api, "_make_request", return_value=page):
+            api.get_filings(
+                max_results=3,
+                output_dir=temp_dir,
+                incremental=False,
+                individual_files=True,
+            )
+
+        filing_dir = Path(temp_dir, "senate_filings", "ld-1")
+        saved = sorted(path.name for path in filing_dir.iterdir())
+        self.assertEqual(saved, ["f0.json", "f1.json", "f2.json", "index.json"])
+
+    def test_senate_api_skips_filings_past_max_results(self):
+        """Test records beyond max_results on the last page are not written"""
+        import shutil
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        api = SenateGovAPI()
+        page = {
+            "count": 3,
+            "next": None,
+            "results": [{"filing_uuid": f"f{n}"} for n in range(3)],
+        }
+
+        with patch.object(api, "_make_request", return_value=page):
+            filings = api.get_filings(
+                max_results=2,
+                output_dir=temp_dir,
+                incremental=False,
+                individual_files=True,
+            )
+
+        self.assertEqual(len(filings), 2)
+        filing_dir = Path(temp_dir, "senate_filings", "ld-1")
+        saved = sorted(path.name for path in filing_dir.iterdir())
+        self.assertEqual(saved, ["f0.json", "f1.json", "index.json"])
+
+    def test_senate_api_filings_as_arrow_table(self):
+        """Test filings are laid out as columns, or pyarrow is asked for"""
+        from core.storage.columnar import PYARROW_AVAILABLE
+
+        api = SenateGovAPI()
+        filing = {"filing_uuid": "abc", "client": {"id": 7, "name": "Acme"}}
+
+        with patch.object(api, "get_filings", return_value=[filing]):
+            if not PYARROW_AVAILABLE:
+                with self.assertRaises(ImportError):
+                    api.get_filings_arrow()
+                return
+            table = api.get_filings_arrow()
+
+        self.assertEqual(table.column("client_name").to_pylist(), ["Acme"])
+        self.assertEqual(table.column("income").to_pylist(), [None])
+
+    def test_senate_api_search_uses_shared_pagination(self):
+        """Test search_filings pages through results up to max_results"""
+        api = SenateGovAPI()
+
+        def fake_request(endpoint, params=None):
+            start = (params["page"] - 1) * 2
+            return {
+                "count": 10,
+                "next": "more",
+                "results": [{"id": n} for n in range(start, start + 2)],
+            }
+
+        with patch.object(api, "_make_request", side_effect=fake_request) as mock:
+            results = api.search_filings("energy", limit=2, max_results=5)
+
+        self.assertEqual([result["id"] for result in results], list(range(5)))
+        self.assertEqual(mock.call_args.args[1]["search"], "energy")
+        self.assertEqual(mock.call_count, 3)
+
+    def test_senate_api_paginates_concurrently_in_order(self):
+        """Test filing pages after the first are fetched ahead and kept in order"""
+        api = SenateGovAPI()
+
+        def fake_request(endpoint, params=None):
+            start = (params["page"] - 1) * 3
+            stop = min(start + 3, 10)
+            return {
+                "count": 10,
+                "next": "more" if stop < 10 else None,
+                "results": [{"id": n} for n in range(start, stop)],
+            }
+
+        with patch.object(api, "_make_request", side_effect=fake_request) as mock:
+            filings = api.get_filings(limit=3, max_results=8, incremental=False)
+
+        self.assertEqual([filing["id"] for filing in filings], list(range(8)))
+        requested = sorted(call.args[1]["page"] for call in mock.call_args_list)
+        self.assertEqual(requested, [1, 2, 3])
+
 
 class TestDataModels(unittest.TestCase):
     """Test the data models"""
@@ -339,6 +1115,48 @@ class TestDataModels(unittest.TestCase):
         self.assertEqual(record.record_type, "test")
         self.assertEqual(record.identifier, "123")
 
+    def test_base_record_round_trips_datetimes(self):
+        """Test datetime fields are serialized to ISO strings and parsed back"""
+        bill = Bill(
+            record_type="bill",
+            identifier="118_hr_1",
+            congress=118,
+            bill_type="hr",
+            number="1",
+            title="Test Bill",
+        )
+
+        data = bill.to_dict()
+        self.assertEqual(data["created_at"], bill.created_at.isoformat())
+
+        restored = Bill.from_dict(data)
+        self.assertEqual(restored.created_at, bill.created_at)
+        self.assertIsNotNone(restored.created_at.tzinfo)
+        extra = Bill.from_dict({**data, "not_a_field": 1})
+        self.assertNotIn("not_a_field", extra.to_dict())
+
+    def test_normalizers(self):
+        """Test party and chamber names map to their standard forms"""
+        self.assertEqual(normalize_party_code(" Democrat "), "D")
+        self.assertEqual(normalize_party_code("r"), "R")
+        self.assertIsNone(normalize_party_code(""))
+        self.assertEqual(normalize_chamber("House of Representatives"), "house")
+        self.assertEqual(normalize_chamber("S"), "senate")
+        self.assertEqual(normalize_chamber("Joint"), "joint")
+
+    def test_data_validation_error(self):
+        """Test validation errors keep their context and survive pickling"""
+        import pickle
+
+        error = DataValidationError("must be positive", "congress", -1)
+        self.assertEqual(
+            str(error), "Validation error in field 'congress': must be positive"
+        )
+        self.assertEqual(str(DataValidationError("bad")), "Validation error: bad")
+
+        restored = pickle.loads(pickle.dumps(error))
+        self.assertEqual(restored.message, "must be positive")
+
     def test_bill_model(self):
         """Test Bill model"""
         bill_data = {
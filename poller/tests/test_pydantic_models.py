@@ -186,6 +186,527 @@ def test_bill_model():
         return False
 
 
+def test_trusted_bill_construction():
+    """Test building a Bill from trusted API data without validation."""
+    print("\nTesting trusted Bill construction...")
+
+    from core.models import Bill, BillType, Party
+
+    bill_data = {
+        "congress": 118,
+        "type": "hr",
+        "number": "10373",
+        "title": "Sample Bill Title",
+        "sponsors": [
+            {
+                "bioguideId": "T000478",
+                "fullName": "Rep. Tenney, Claudia [R-NY-24]",
+                "party": "Republican",
+                "state": "ny",
+            }
+        ],
+        "actions": [{"action_date": "2024-12-11", "text": "Introduced in House"}],
+    }
+
+    bill = Bill.from_trusted_api(bill_data)
+
+    assert bill.bill_type == BillType.HOUSE_BILL
+    assert bill.bill_id == "118_hr_10373"
+    assert bill.sponsors[0].party == Party.REPUBLICAN
+    assert bill.sponsors[0].state == "NY"
+    assert bill.get_latest_action().text == "Introduced in House"
+
+    # A sponsor with a null state must not break the trusted path
+    bill_data["sponsors"][0]["state"] = None
+    assert Bill.from_trusted_api(bill_data).sponsors[0].state == ""
+
+    print(f"✅ Trusted Bill construction test passed: {bill.display_name}")
+    return True
+
+
+def test_bill_actions_round_trip():
+    """Test column-stored actions still serialize as a list of actions."""
+    print("\nTesting Bill actions round trip...")
+
+    from core.models import Bill
+
+    bill = Bill(
+        congress=118,
+        type="HR",
+        number="10373",
+        bill_id="118_hr_10373",
+        title="Sample Bill",
+        actions=[
+            {"action_date": "2024-12-11", "text": "Introduced", "chamber": "House"},
+            {"text": "Referred to committee"},
+        ],
+    )
+
+    assert bill.model_dump_json_safe()["actions"] == [
+        {"action_date": "2024-12-11", "text": "Introduced", "chamber": "house"},
+        {"text": "Referred to committee"},
+    ]
+    data = bill.model_dump(by_alias=True)
+    assert Bill.model_validate(data).model_dump(by_alias=True) == data
+    assert Bill.model_validate_json(bill.to_json()) == bill
+
+    print("✅ Bill actions round trip test passed")
+    return True
+
+
+def test_bill_revalidate():
+    """Test revalidate() re-runs validation after in-place edits."""
+    print("\nTesting Bill revalidate...")
+
+    from pydantic import ValidationError
+
+    from core.models import Bill, BillType
+
+    bill = Bill(congress=118, type="HR", number="10373", title="Sample Bill")
+
+    # Assignment is not validated, so edits only normalize on revalidate()
+    bill.bill_type = "s"
+    revalidated = bill.revalidate()
+    assert revalidated is not bill
+    assert revalidated.bill_type == BillType.SENATE_BILL
+
+    bill.title = ""
+    try:
+        bill.revalidate()
+    except ValidationError:
+        pass
+    else:
+        raise AssertionError("revalidate() accepted an empty title")
+
+    # Nested sponsors and actions built without validation are checked too
+    trusted = Bill.from_trusted_api(
+        {
+            "congress": 118,
+            "type": "hr",
+            "number": "1",
+            "title": "Sample Bill",
+            "sponsors": [
+                {
+                    "bioguideId": "",
+                    "fullName": "",
+                    "party": "D",
+                    "state": "California-long",
+                }
+            ],
+            "actions": [{"text": ""}],
+        }
+    )
+    try:
+        trusted.revalidate()
+    except ValidationError as e:
+        locations = {error["loc"][0] for error in e.errors()}
+        assert locations == {"sponsors", "actions"}
+    else:
+        raise AssertionError("revalidate() accepted an invalid nested sponsor")
+
+    print("✅ Bill revalidate test passed")
+    return True
+
+
+def test_bill_derived_fields():
+    """Test derived properties stay out of dumps unless requested."""
+    print("\nTesting Bill derived fields...")
+
+    from core.models import Bill
+
+    bill = Bill(
+        congress=118,
+        type="HR",
+        number="10373",
+        title="Sample Bill",
+        introduced_date="2024-12-11",
+        sponsors=[
+            {
+                "bioguideId": "T000478",
+                "fullName": "Rep. Tenney, Claudia [R-NY-24]",
+                "party": "R",
+                "state": "NY",
+            }
+        ],
+    )
+
+    assert not set(Bill.DERIVED_FIELDS) & set(bill.model_dump(by_alias=True))
+    assert not set(Bill.DERIVED_FIELDS) & set(bill.model_dump_json_safe())
+
+    data = bill.model_dump_json_safe(include_derived=True)
+    assert data["display_name"] == "HR 10373"
+    assert data["sponsor_count"] == 1
+    assert data["total_sponsors"] == 1
+    assert data["days_since_introduction"] == bill.days_since_introduction
+
+    print("✅ Bill derived fields test passed")
+    return True
+
+
+def test_bill_created_at_ns():
+    """Test creation time is kept in nanoseconds and legacy values load."""
+    print("\nTesting Bill created_at_ns...")
+
+    from datetime import datetime, timezone
+
+    from core.models import Bill
+
+    bill = Bill(congress=118, type="HR", number="10373", title="Sample Bill")
+    assert isinstance(bill.created_at_ns, int)
+    assert bill.created_at.tzinfo == timezone.utc
+    assert "created_at" not in bill.model_dump()
+
+    # Older dumps stored a naive UTC created_at instead
+    legacy = Bill(
+        congress=118,
+        type="HR",
+        number="10373",
+        title="Sample Bill",
+        created_at="2024-01-02T03:04:05.123456",
+    )
+    expected = datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc)
+    assert legacy.created_at == expected
+    assert legacy.created_at_ns == 1704164645123456000
+
+    print("✅ Bill created_at_ns test passed")
+    return True
+
+
+def test_bill_validate_many():
+    """Test batches of raw bills validate in one call."""
+    print("\nTesting Bill validate_many...")
+
+    from pydantic import ValidationError
+
+    from core.models import Bill, BillType
+
+    raw = [
+        {"congress": 118, "type": "hr", "number": "1", "title": "First"},
+        {"congress": 118, "type": "s", "number": "2", "title": "Second"},
+    ]
+    bills = Bill.validate_many(raw)
+    assert [bill.bill_type for bill in bills] == [
+        BillType.HOUSE_BILL,
+        BillType.SENATE_BILL,
+    ]
+
+    try:
+        Bill.validate_many(raw + [{"congress": 118, "type": "hr"}])
+    except ValidationError:
+        pass
+    else:
+        raise AssertionError("validate_many() accepted a bill without a title")
+
+    print("✅ Bill validate_many test passed")
+    return True
+
+
+def test_bill_to_json():
+    """Test to_json encodes the same document as model_dump_json_safe."""
+    print("\nTesting Bill to_json...")
+
+    from core.models import Bill
+
+    bill = Bill(
+        congress=118,
+        type="HR",
+        number="10373",
+        title="Sample Bill",
+        introduced_date="2024-12-11",
+        actions=[{"action_date": "2024-12-11", "text": "Introduced"}],
+    )
+
+    encoded = bill.to_json()
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == bill.model_dump_json_safe()
+    assert json.loads(bill.to_json(include_derived=True)) == (
+        bill.model_dump_json_safe(include_derived=True)
+    )
+
+    print("✅ Bill to_json test passed")
+    return True
+
+
+def test_bill_cache_round_trip():
+    """Test validated bills can be cached to disk and loaded back."""
+    print("\nTesting Bill cache round trip...")
+
+    import os
+    import shutil
+    import stat
+    import tempfile
+
+    from core.models import Bill
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        cache_dir = os.path.join(temp_dir, "bills")
+        bill = Bill(congress=118, type="HR", number="10373", title="Sample Bill")
+        path = bill.to_cache(cache_dir)
+
+        assert path.parent.name == "118"
+        assert stat.S_IMODE(os.stat(cache_dir).st_mode) == 0o700
+        assert Bill.from_cache("118_hr_10373", cache_dir) == bill
+        assert Bill.from_cache("118_hr_1", cache_dir) is None
+    finally:
+        shutil.rmtree(temp_dir)
+
+    print("✅ Bill cache round trip test passed")
+    return True
+
+
+def test_trusted_committee_construction():
+    """Test building a Committee and its nested models from trusted data."""
+    print("\nTesting trusted Committee construction...")
+
+    from core.models import Chamber, Committee, CommitteeRole, Party
+
+    committee = Committee.from_trusted_api(
+        {
+            "systemCode": "hsag00",
+            "name": "Agriculture",
+            "chamber": "House",
+            "committee_type": "Standing",
+            "members": [
+                {
+                    "bioguideId": "A000001",
+                    "name": "Member A",
+                    "party": "Democrat",
+                    "state": "OH",
+                    "role": "Chairman",
+                },
+                {
+                    "bioguideId": "B000002",
+                    "name": "Member B",
+                    "party": "R",
+                    "state": "TX",
+                    "is_ranking_member": True,
+                },
+            ],
+            "activities": [{"activity_type": "Full Committee Hearing", "title": "A"}],
+            "meetings": [
+                {"committee_code": "hsag00", "meeting_type": "Markup", "title": "M"}
+            ],
+            "bill_actions": [
+                {
+                    "bill_number": "1",
+                    "congress": 118,
+                    "committee_code": "hsag00",
+                    "committee_name": "Agriculture",
+                    "action_type": "Referral",
+                    "action_description": "Referred to committee",
+                }
+            ],
+        }
+    )
+
+    assert committee.chamber == Chamber.HOUSE
+    chair, ranking = committee.members
+    assert chair.party == Party.DEMOCRATIC
+    assert chair.role == CommitteeRole.CHAIR and chair.is_chair
+    assert ranking.role == CommitteeRole.RANKING_MEMBER
+    assert committee.get_chair() is chair
+    assert committee.get_ranking_member() is ranking
+
+    # The lowercased type is cached even though validators did not run
+    assert committee.activities[0]._type_lower == "full committee hearing"
+    assert committee.activities[0].is_hearing
+    assert committee.meetings[0]._type_lower == "markup"
+    assert committee.meetings[0].is_markup
+    assert committee.bill_actions[0].is_referred
+
+    print(f"✅ Trusted Committee construction test passed: {committee.display_name}")
+    return True
+
+
+def test_committee_recent_meetings():
+    """Test recent meetings are newest first with undated ones by creation."""
+    print("\nTesting Committee recent meetings...")
+
+    from datetime import datetime
+
+    from core.models import Committee
+
+    def meeting(title, date=None):
+        return {
+            "committee_code": "hsag00",
+            "meeting_type": "Hearing",
+            "title": title,
+            "date": date,
+            "created_at": datetime(2023, 6, 1),
+        }
+
+    committee = Committee(
+        systemCode="hsag00",
+        name="Agriculture",
+        chamber="house",
+        committee_type="standing",
+        meetings=[
+            meeting("January", "2024-01-15"),
+            meeting("March", "2024-03-01"),
+            meeting("Undated"),
+            meeting("March again", "2024-03-01"),
+        ],
+    )
+
+    titles = [m.title for m in committee.get_recent_meetings()]
+    # Equal dates keep their original order
+    assert titles == ["March", "March again", "January", "Undated"]
+    assert [m.title for m in committee.get_recent_meetings(2)] == titles[:2]
+
+    print("✅ Committee recent meetings test passed")
+    return True
+
+
+def test_committee_party_ranking():
+    """Test majority and minority parties, with ties going to first seen."""
+    print("\nTesting Committee party ranking...")
+
+    from core.models import Committee, Party
+
+    parties = ["D", "R", "R", "D", "I", "X", "X", "X"]
+    committee = Committee(
+        systemCode="hsag00",
+        name="Agriculture",
+        chamber="house",
+        committee_type="standing",
+        members=[
+            {"bioguideId": f"M{i}", "name": f"M{i}", "party": party, "state": "OH"}
+            for i, party in enumerate(parties)
+        ],
+    )
+
+    # Unknown parties never rank, however many members they have
+    assert committee.get_party_breakdown()[Party.UNKNOWN] == 3
+    assert committee.majority_party == Party.DEMOCRATIC
+    assert committee.minority_party == Party.REPUBLICAN
+
+    print("✅ Committee party ranking test passed")
+    return True
+
+
+def test_committee_analytics():
+    """Test the single-pass analytics agree with the individual properties."""
+    print("\nTesting Committee analytics...")
+
+    from core.models import Committee
+
+    def action(action_type, is_reported=False):
+        return {
+            "bill_number": "1",
+            "congress": 118,
+            "committee_code": "hsag00",
+            "committee_name": "Agriculture",
+            "action_type": action_type,
+            "action_description": action_type,
+            "is_reported": is_reported,
+        }
+
+    committee = Committee(
+        systemCode="hsag00",
+        name="Agriculture",
+        chamber="house",
+        committee_type="standing",
+        members=[
+            {
+                "bioguideId": "A",
+                "name": "A",
+                "party": "D",
+                "state": "OH",
+                "tenure_years": 2.0,
+            },
+            {
+                "bioguideId": "B",
+                "name": "B",
+                "party": "R",
+                "state": "TX",
+                "tenure_years": 8.0,
+                "date_departed": "2024-01-01",
+            },
+            {
+                "bioguideId": "C",
+                "name": "C",
+                "party": "R",
+                "state": "CA",
+                "tenure_years": 5.0,
+            },
+        ],
+        activities=[{"activity_type": "Hearing", "title": "A"}],
+        meetings=[
+            {"committee_code": "hsag00", "meeting_type": t, "title": t}
+            for t in ("Hearing", "Markup", "Business Meeting")
+        ],
+        bill_actions=[
+            action("Referral"),
+            action("Referral"),
+            action("Markup", is_reported=True),
+        ],
+        bills_reported=[{"title": "Reported"}],
+    )
+
+    analytics = committee.get_committee_analytics()
+    membership = analytics["membership"]
+    assert membership["total_members"] == committee.member_count
+    assert membership["active_members"] == len(committee.get_active_members())
+    assert membership["party_breakdown"] == committee.get_party_breakdown()
+    assert membership["majority_party"] == committee.majority_party
+    assert membership["minority_party"] == committee.minority_party
+    assert membership["partisan_balance"] == committee.partisan_balance
+    assert membership["average_tenure"] == committee.average_member_tenure
+    assert membership["tenure_stats"] == committee.get_member_tenure_stats()
+    assert analytics["activity"] == {
+        "total_meetings": committee.meetings_count,
+        "hearings": committee.hearings_count_detailed,
+        "markups": committee.markups_count_detailed,
+        "legacy_activities": committee.activity_count,
+    }
+    assert analytics["legislation"] == {
+        "bills_referred": committee.referred_bills_count,
+        "bills_reported": committee.reported_bills_count,
+        "bills_in_markup": committee.bills_in_markup_count,
+        "total_bill_actions": committee.bill_actions_count,
+        "efficiency_ratio": committee.committee_efficiency,
+    }
+    assert analytics["productivity"] == {
+        "legacy_score": committee.productivity_score,
+        "enhanced_score": committee.enhanced_productivity_score,
+    }
+    assert analytics["legislation"]["bills_referred"] == 2
+    assert analytics["legislation"]["efficiency_ratio"] == 0.5
+
+    print("✅ Committee analytics test passed")
+    return True
+
+
+def test_committee_member_lookup():
+    """Test bioguide lookups follow in-place edits to the member list."""
+    print("\nTesting Committee member lookup...")
+
+    from core.models import Committee, CommitteeMember
+
+    def member(bioguide_id):
+        return CommitteeMember(
+            bioguideId=bioguide_id, name=bioguide_id, party="D", state="OH"
+        )
+
+    committee = Committee(
+        systemCode="hsag00",
+        name="Agriculture",
+        chamber="house",
+        committee_type="standing",
+        members=[member("A"), member("B")],
+    )
+    assert committee.get_member_by_bioguide("A").bioguide_id == "A"
+
+    # Replacing a member keeps the list and its length unchanged
+    committee.members[0] = member("Z")
+    assert committee.get_member_by_bioguide("A") is None
+    assert committee.has_member("Z")
+
+    print("✅ Committee member lookup test passed")
+    return True
+
+
 def test_vote_model():
     """Test Vote model with sample data."""
     print("\nTesting Vote model...")
@@ -290,6 +811,19 @@ def run_all_tests():
         test_enum_normalization,
         test_member_model,
         test_bill_model,
+        test_trusted_bill_construction,
+        test_bill_actions_round_trip,
+        test_bill_revalidate,
+        test_bill_derived_fields,
+        test_bill_created_at_ns,
+        test_bill_validate_many,
+        test_bill_to_json,
+        test_bill_cache_round_trip,
+        test_trusted_committee_construction,
+        test_committee_recent_meetings,
+        test_committee_party_ranking,
+        test_committee_analytics,
+        test_committee_member_lookup,
         test_vote_model,
         test_json_serialization,
     ]